@@ -0,0 +1,73 @@
+"""
+Compares the memory used by 100k Chord() objects against the same number of
+chords built with the old layout (a per-instance __dict__ plus four metadata
+lists allocated up front).
+
+Each variant is built in its own process so the RSS numbers don't overlap.
+
+Run from the project root:
+    python -m benchmarks.bench_containers
+"""
+
+import resource
+import tracemalloc
+from multiprocessing import Pool
+from random import choice
+
+from containers.chord import Chord
+from core.constants import NOTES, RHYTHMS, DYNAMICS
+
+TOTAL = 100_000
+
+
+class LegacyChord:
+    """the Container()/Chord() layout prior to __slots__"""
+
+    def __init__(self, instrument=None, tempo=None):
+        self.info = "None"
+        self.pcs = []
+        self.source_data = []
+        self.source_notes = []
+        self.instrument = "Acoustic Grand Piano" if instrument is None else instrument
+        self.tempo = 60.0 if tempo is None else tempo
+        self.notes = []
+        self.rhythm = 0.0
+        self.dynamic = 0.0
+
+
+def build(variant: str) -> tuple[str, float, float]:
+    """
+    builds TOTAL chords of the given variant and returns its name, the growth
+    of the process' peak RSS (MB), and the bytes allocated (MB)
+    """
+    cls = Chord if variant == "slots" else LegacyChord
+    # share note lists across chords so only the containers are being measured
+    scales = [[choice(NOTES) for _ in range(4)] for _ in range(64)]
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    chords = []
+    for i in range(TOTAL):
+        chord = cls(tempo=60.0)
+        chord.notes = scales[i % 64]
+        chord.rhythm = choice(RHYTHMS)
+        chord.dynamic = choice(DYNAMICS)
+        chords.append(chord)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in kilobytes on linux
+    return variant, (rss_after - rss_before) / 1024, allocated / (1024 * 1024)
+
+
+if __name__ == "__main__":
+    results = {}
+    for variant in ["legacy", "slots"]:
+        with Pool(1) as pool:
+            name, rss, allocated = pool.apply(build, (variant,))
+        results[name] = allocated
+        print(
+            f"{name:<7} {TOTAL} chords  rss: +{rss:.1f} MB  allocated: {allocated:.1f} MB"
+        )
+    print(f"reduction: {1 - results['slots'] / results['legacy']:.0%}")
@@ -0,0 +1,69 @@
+"""
+Compares counting pitch classes in a large generated composition the old way
+(each note name converted to a pitch class one at a time, then list.count()
+once per pitch class) against Analyze.count_pcs().
+
+Run from the project root:
+    python -m benchmarks.bench_count_pcs
+    python -m benchmarks.bench_count_pcs --parts 8 --notes 500000
+"""
+
+import argparse
+from time import perf_counter
+
+from core.analyze import Analyze
+from core.constants import NOTES
+from core.generate import Generate
+from containers.composition import Composition
+from containers.melody import Melody
+
+
+def new_comp(parts: int, total: int) -> Composition:
+    """builds a composition of melodies with random notes"""
+    create = Generate(seed=0)
+    comp = Composition()
+    for _ in range(parts):
+        melody = Melody(instrument="Violin")
+        melody.notes = [create.rng.choice(NOTES) for _ in range(total)]
+        comp.add_part(melody, melody.instrument)
+    return comp
+
+
+def legacy_count_pcs(analyze: Analyze, comp: Composition) -> dict:
+    pc_totals = {pc: 0 for pc in range(12)}
+    for part in comp.parts.values():
+        pcs = [analyze.get_pcs(note) for note in part.notes]
+        for key in pc_totals:
+            pc_totals[key] += pcs.count(key)
+    return pc_totals
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--parts", type=int, default=4, help="(int) number of parts")
+    parser.add_argument(
+        "--notes", type=int, default=250_000, help="(int) notes per part"
+    )
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    analyze = Analyze()
+    comp = new_comp(args.parts, args.notes)
+    total = args.parts * args.notes
+
+    start = perf_counter()
+    legacy = legacy_count_pcs(analyze, comp)
+    legacy_time = perf_counter() - start
+
+    start = perf_counter()
+    res = analyze.count_pcs(comp)
+    new_time = perf_counter() - start
+
+    assert res["Total"] == legacy, "counts don't match!"
+    print(f"{total:,} notes")
+    print(f"legacy:    {legacy_time:.3f} sec  ({total / legacy_time:,.0f} notes/sec)")
+    print(f"count_pcs: {new_time:.3f} sec  ({total / new_time:,.0f} notes/sec)")
+    print(f"speedup: {legacy_time / new_time:.1f}x")
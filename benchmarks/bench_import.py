@@ -0,0 +1,73 @@
+"""
+Measures how long it takes to import a module (core.generate by default)
+in a fresh interpreter using python -X importtime.
+
+Run from the project root:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --module compositions.melt --runs 10
+
+Pass --max-ms to exit with an error when the median import time goes over a
+budget, i.e. in CI-like runs:
+    python -m benchmarks.bench_import --max-ms 150
+"""
+
+import argparse
+import subprocess
+import sys
+from statistics import median
+
+from core.constants import ROOT
+
+
+def import_times(module: str) -> dict:
+    """
+    imports a module in a new interpreter and returns a dict of
+    each imported module's cumulative import time in microseconds
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--module", type=str, default="core.generate", help="(string) module to import"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="(int) number of runs")
+    parser.add_argument(
+        "--top", type=int, default=10, help="(int) slowest imports to display"
+    )
+    parser.add_argument(
+        "--max-ms", type=float, help="(float) fail if the median is over this"
+    )
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    total_ms = median(run[args.module] for run in runs) / 1000
+
+    print("\nslowest imports (last run):")
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)
+    for name, us in slowest[: args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+    print(f"\n{args.module}: {total_ms:.1f} ms (median of {args.runs} runs)")
+
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"import time is over budget! max: {args.max_ms} ms")
+        sys.exit(1)
@@ -0,0 +1,64 @@
+"""
+Compares the list-based Modify/tools pitch operations against the
+NumPy versions in core.pitch at 1k, 100k, and 1M notes.
+
+Run from the project root:
+    python -m benchmarks.bench_pitch
+"""
+
+from random import randint
+from time import perf_counter
+
+import numpy as np
+
+from core import pitch
+from core.modify import Modify
+from utils.tools import oct_equiv
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def timed(func, *args) -> float:
+    """returns how long (in seconds) a single call to func(*args) takes"""
+    start = perf_counter()
+    func(*args)
+    return perf_counter() - start
+
+
+def run(size: int) -> None:
+    indices = [randint(0, 87) for _ in range(size)]
+    arr = np.array(indices, dtype=pitch.PITCH_DTYPE)
+
+    # list functions modify their input in place, so each gets a fresh copy
+    rows = [
+        (
+            "transpose",
+            timed(Modify.transpose, list(indices), 5, False),
+            timed(pitch.transpose, arr, 5, False),
+        ),
+        (
+            "oct_equiv",
+            timed(oct_equiv, list(indices)),
+            timed(pitch.oct_equiv, arr),
+        ),
+        (
+            "invert",
+            timed(lambda n: [2 * n[0] - i for i in n], indices),
+            timed(pitch.invert, arr),
+        ),
+        (
+            "retrograde",
+            timed(lambda n: n.reverse(), list(indices)),
+            timed(pitch.retrograde, arr),
+        ),
+    ]
+    for name, list_time, arr_time in rows:
+        print(
+            f"{size:>9} notes  {name:<10}  list: {list_time:.5f}s  "
+            f"numpy: {arr_time:.5f}s  speedup: {list_time / max(arr_time, 1e-9):.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    for n in SIZES:
+        run(n)
@@ -0,0 +1,68 @@
+"""
+Measures how many pitch class sets per second can be identified as Forte sets:
+
+    naive:  sorts each set, finds its normal order by trying every rotation,
+            then searches SETS for a match in any transposition
+    lookup: Analyze.find_set() (a 12-bit mask plus a table lookup)
+    bulk:   Analyze.find_sets(), which classifies every n-note window of a
+            melody at once
+
+Run from the project root:
+    python -m benchmarks.bench_setclass
+    python -m benchmarks.bench_setclass --total 1000000 --size 6
+"""
+
+import argparse
+from random import randint
+from time import perf_counter
+
+from core.analyze import Analyze
+from core.constants import SETS
+
+
+def naive_find_set(pcs: list[int]) -> str:
+    pcs = sorted(set(pcs))
+    best = None
+    for i in range(len(pcs)):
+        rotation = pcs[i:] + pcs[:i]
+        zeroed = [(pc - rotation[0]) % 12 for pc in rotation]
+        if best is None or zeroed[::-1] < best[::-1]:
+            best = zeroed
+    for name, prime in SETS.items():
+        for n in range(12):
+            if sorted((pc + n) % 12 for pc in prime) == sorted(best):
+                return name
+    return None
+
+
+def run(label: str, func, total: int) -> None:
+    start = perf_counter()
+    func()
+    elapsed = perf_counter() - start
+    print(f"{label:<7} {total / elapsed:>14,.0f} sets/sec  ({elapsed:.3f} sec)")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--total", type=int, default=200_000, help="(int) number of windows"
+    )
+    parser.add_argument("--size", type=int, default=5, help="(int) notes per window")
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    analyze = Analyze()
+    melody = [randint(0, 11) for _ in range(args.total + args.size - 1)]
+    windows = [melody[i : i + args.size] for i in range(args.total)]
+    # build the tables up front so they aren't part of the timings
+    analyze.find_set(windows[0])
+
+    naive_total = min(args.total, 1_000)
+    run(
+        "naive", lambda: [naive_find_set(w) for w in windows[:naive_total]], naive_total
+    )
+    run("lookup", lambda: [analyze.find_set(w) for w in windows], args.total)
+    run("bulk", lambda: analyze.find_sets(melody, args.size), args.total)
@@ -19,7 +19,8 @@ from utils.tools import scale_to_tempo
 from utils.txtfile import gen_info_doc
 
 from core.generate import Generate
-from core.constants import DYNAMICS, RANGE, RHYTHMS, TEMPOS
+from core.constants import DYNAMICS, RHYTHMS, TEMPOS
+from core.ranges import sample_in_range
 
 from containers.melody import Melody
 from containers.composition import Composition
@@ -78,7 +79,7 @@ def melt(tempo: str = None, title: str = None) -> Composition:
 
     # export_midi source info to each Melody() object
     for q in range(len(trio)):
-        trio[q].pcs.append(pcs)
+        trio[q].add_pcs(pcs)
         trio[q].source_notes = source
 
     # write individual *choral* lines
@@ -127,28 +128,20 @@ def write_line(part: Melody, scale: list, total: int, asyn: bool = False) -> Mel
         # NOTE: this will redefine supplied total if asyn is True
         total = randint(12, 30)
 
-    for things in range(total):
-        # limited to octaves 4 and 5 for violins
-        if part.instrument == "Violin":
-            note = scale[randint(13, len(scale) - 1)]
-            # trying to account for random notes chosen out of range...
-            while note not in RANGE["Violin"]:
-                note = scale[randint(13, len(scale) - 1)]
-            part.notes.append(note)
-
-        # limit to octaves 3 and 4 for viola
-        elif part.instrument == "Viola":
-            note = scale[randint(7, len(scale) - 8)]
-            while note not in RANGE["Viola"]:
-                note = scale[randint(7, len(scale) - 8)]
-            part.notes.append(note)
-
-        # limit to octaves 2 and 3 for cello
-        elif part.instrument == "Cello":
-            note = scale[randint(0, len(scale) - 16)]
-            while note not in RANGE["Cello"]:
-                note = scale[randint(0, len(scale) - 16)]
-            part.notes.append(note)
+    # limited to octaves 4 and 5 for violins
+    if part.instrument == "Violin":
+        source = scale[13:]
+    # limit to octaves 3 and 4 for viola
+    elif part.instrument == "Viola":
+        source = scale[7:-7]
+    # limit to octaves 2 and 3 for cello
+    elif part.instrument == "Cello":
+        source = scale[:-15]
+    else:
+        source = None
+
+    if source is not None:
+        part.notes.extend(sample_in_range(source, part.instrument, total))
 
     if asyn:
         # add independent rhythms and dynamics of n length
@@ -12,10 +12,11 @@ from random import randint, seed
 
 from utils.midi import export_midi
 from utils.tools import scale_to_tempo
-from utils.txtfile import gen_info_doc
+from utils.txtfile import gen_info_doc_async
 
 from core.generate import Generate
-from core.constants import DYNAMICS, RANGE, RHYTHMS, TEMPOS
+from core.constants import DYNAMICS, RHYTHMS, TEMPOS
+from core.ranges import sample_in_range
 
 from containers.melody import Melody
 from containers.composition import Composition
@@ -53,7 +54,7 @@ def str_qtet(tempo=None) -> Composition:
 
     # export_midi source info to each Melody() object
     for q in range(len(qtet)):
-        qtet[q].pcs.append(pcs)
+        qtet[q].add_pcs(pcs)
         qtet[q].source_notes = source
 
     print("\nwriting opening...")
@@ -90,8 +91,8 @@ def str_qtet(tempo=None) -> Composition:
 
     for q in trange((len(qtet)), desc="progress"):
         qtet[q] = write_line(qtet[q], source, total, create, asyn=True)
-        qtet[q].source_notes.extend(source)
-        qtet[q].pcs.append(pcs)
+        qtet[q].add_source_notes(source)
+        qtet[q].add_pcs(pcs)
 
     print("\nrecapitulating choral opening at displaced end points...")
 
@@ -121,8 +122,10 @@ def str_qtet(tempo=None) -> Composition:
     # export_midi all parts then write out
     for q in range(len(qtet)):
         comp.add_part(qtet[q], qtet[q].instrument)
+    # write the info doc while the MIDI file is exported
+    writer = gen_info_doc_async(file_name=comp.txt_file_name, comp=comp, data=None)
     export_midi(comp)
-    gen_info_doc(file_name=comp.txt_file_name, comp=comp, data=None)
+    writer.result()
 
     print("\n...success!")
 
@@ -151,28 +154,20 @@ def write_line(
         # NOTE: this will redefine supplied total if asyn is True
         total = randint(12, 30)
 
-    for _ in range(total):
-        # limited to octaves 4 and 5 for violins
-        if part.instrument == "Violin":
-            note = scale[randint(13, len(scale) - 1)]
-            # trying to account for random notes chosen out of range...
-            while note not in RANGE["Violin"]:
-                note = scale[randint(13, len(scale) - 1)]
-            part.notes.append(note)
-
-        # limit to octaves 3 and 4 for viola
-        elif part.instrument == "Viola":
-            note = scale[randint(7, len(scale) - 8)]
-            while note not in RANGE["Viola"]:
-                note = scale[randint(7, len(scale) - 8)]
-            part.notes.append(note)
-
-        # limit to octaves 2 and 3 for cello
-        elif part.instrument == "Cello":
-            note = scale[randint(0, len(scale) - 16)]
-            while note not in RANGE["Cello"]:
-                note = scale[randint(0, len(scale) - 16)]
-            part.notes.append(note)
+    # limited to octaves 4 and 5 for violins
+    if part.instrument == "Violin":
+        source = scale[13:]
+    # limit to octaves 3 and 4 for viola
+    elif part.instrument == "Viola":
+        source = scale[7:-7]
+    # limit to octaves 2 and 3 for cello
+    elif part.instrument == "Cello":
+        source = scale[:-15]
+    else:
+        source = None
+
+    if source is not None:
+        part.notes.extend(sample_in_range(source, part.instrument, total))
 
     if asyn:
         # add independent rhythms and dynamics of n length
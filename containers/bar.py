@@ -16,22 +16,28 @@ class Bar(Container):
     class/container for dealing with individual measures.
     """
 
-    meter = ()  # the meter of this bar
-    tempo = 0.0  # global composition tempo
-    length = 0.0  # length of bar in seconds using the meter
-    current_beat = 0.0  # current UNUSED beat (in seconds)
-    instrument = ""  # instrument assigned to this bar
-    full = False  # flag for indicating if this bar is full
-    bar = {  # dictionary representing the current bar
-        "Notes": [],
-        "Rhythms": [],
-        "Dynamics": [],
-    }
+    __slots__ = (
+        "meter",  # the meter of this bar
+        "tempo",  # global composition tempo
+        "length",  # length of bar in seconds using the meter
+        "current_beat",  # current UNUSED beat (in seconds)
+        "instrument",  # instrument assigned to this bar
+        "full",  # flag for indicating if this bar is full
+        "bar",  # dictionary representing the current bar
+    )
 
     def __init__(self, meter=None, tempo=None, instrument=None):
 
         super().__init__()
 
+        self.current_beat = 0.0
+        self.full = False
+        self.bar = {
+            "Notes": [],
+            "Rhythms": [],
+            "Dynamics": [],
+        }
+
         if meter is None:
             self.meter = (4, 4)  # defaults to 4/4 if no meter is provided
         else:
@@ -14,6 +14,8 @@ class Chord(Container):
     a rhythm (float: duration in seconds), and list for dynamics (int: MIDI velocity numbers).
     """
 
+    __slots__ = ("instrument", "tempo", "notes", "_rhythm", "dynamic")
+
     def __init__(self, instrument=None, tempo=None):
         """
         Initialize with several empty lists. Use any inputted instrument or tempo data!
@@ -40,6 +42,15 @@ class Chord(Container):
         self.rhythm = 0.0
         self.dynamic = 0.0
 
+    @property
+    def rhythm(self) -> float:
+        return self._rhythm
+
+    @rhythm.setter
+    def rhythm(self, value: float) -> None:
+        self._rhythm = value
+        self._duration_changed()
+
     def duration(self):
         """returns the assigned rhythm, which is in seconds adjusted for tempo (hopefully)"""
         return self.rhythm
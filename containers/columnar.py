@@ -0,0 +1,179 @@
+"""
+Module for the ColumnarMelody() class/container. A compact, array-backed
+alternative to Melody() for very long melodies.
+"""
+
+from __future__ import annotations
+
+from array import array
+from copy import copy
+
+from containers.container import Container
+from containers.melody import Melody
+from core.lookup import note_to_midi, midi_to_note
+
+# array module type codes for each column
+PITCH_TYPE = "B"  # uint8 MIDI note number
+RHYTHM_TYPE = "d"  # float64 duration in seconds
+DYNAMIC_TYPE = "B"  # uint8 MIDI velocity
+
+
+class ColumnarMelody(Container):
+    """
+    A class/container for melodies stored as three contiguous arrays instead of
+    three lists of python objects:
+
+        pitches: MIDI note numbers (uint8)
+        rhythms: durations in seconds (float64)
+        dynamics: MIDI velocities (uint8)
+
+    Appends are amortized O(1), and the total duration is kept as a running sum
+    so duration() doesn't re-sum the rhythms. Since the sum has to stay in step
+    with the rhythms, the arrays are private. pitches, rhythms, and dynamics
+    return copies, and events are only added with append() and extend().
+
+    Use to_melody() and from_melody() to convert to and from a regular
+    Melody() object (i.e. for export_midi() or gen_info_doc()). Note names are
+    stored as MIDI numbers, so they come back spelled as they are in NOTES.
+    """
+
+    __slots__ = (
+        "tempo",
+        "instrument",
+        "_pitches",
+        "_rhythms",
+        "_dynamics",
+        "_duration",
+    )
+
+    def __init__(self, tempo=None, instrument=None):
+
+        super().__init__()
+
+        if tempo is None:
+            self.tempo = 0.0
+        else:
+            self.tempo = tempo
+        if instrument is None:
+            self.instrument = "None"
+        else:
+            self.instrument = instrument
+
+        self._pitches = array(PITCH_TYPE)
+        self._rhythms = array(RHYTHM_TYPE)
+        self._dynamics = array(DYNAMIC_TYPE)
+        self._duration = 0.0
+
+    def __len__(self) -> int:
+        return len(self._pitches)
+
+    @property
+    def pitches(self) -> array:
+        """
+        a copy of the MIDI note numbers
+        """
+        return self._pitches[:]
+
+    @property
+    def rhythms(self) -> array:
+        """
+        a copy of the durations (in seconds)
+        """
+        return self._rhythms[:]
+
+    @property
+    def dynamics(self) -> array:
+        """
+        a copy of the MIDI velocities
+        """
+        return self._dynamics[:]
+
+    @property
+    def notes(self) -> list[str]:
+        """
+        note name strings for each pitch, i.e. ["C4", "Eb4"]
+        """
+        return [midi_to_note(p) for p in self._pitches]
+
+    def append(self, note: str | int, rhythm: float, dynamic: int) -> None:
+        """
+        adds a single event. note can be a note name string or MIDI number.
+        """
+        self._pitches.append(note if type(note) == int else note_to_midi(note))
+        self._rhythms.append(rhythm)
+        self._dynamics.append(dynamic)
+        self._duration += rhythm
+        self._duration_changed()
+
+    def extend(self, notes: list, rhythms: list[float], dynamics: list[int]) -> None:
+        """
+        adds a series of events. each list must be the same length.
+        notes can be note name strings or MIDI numbers.
+        """
+        if not len(notes) == len(rhythms) == len(dynamics):
+            raise ValueError(
+                "notes, rhythms, and dynamics must be the same length! "
+                f"notes: {len(notes)} rhythms: {len(rhythms)} dynamics: {len(dynamics)}"
+            )
+        self._pitches.extend(n if type(n) == int else note_to_midi(n) for n in notes)
+        self._rhythms.extend(rhythms)
+        self._dynamics.extend(dynamics)
+        self._duration += sum(rhythms)
+        self._duration_changed()
+
+    def duration(self) -> float:
+        """
+        Returns the duration (float) of a melody in seconds.
+        """
+        return self._duration
+
+    def is_empty(self) -> bool:
+        """
+        Returns true if the container is empty, otherwise false
+        """
+        return len(self._pitches) == 0
+
+    def get_meta_data(self) -> dict:
+        """
+        returns meta-data as a dictionary
+        """
+        return {
+            "Info": self.info,
+            "PCS": self.pcs,
+            "Source Data": self.source_data,
+            "Source Scale": self.source_notes,
+        }
+
+    def to_melody(self) -> Melody:
+        """
+        returns a list-based Melody() object with the same events and a copy
+        of the meta-data
+        """
+        melody = Melody(tempo=self.tempo, instrument=self.instrument)
+        melody.notes = self.notes
+        melody.rhythms = self._rhythms.tolist()
+        melody.dynamics = self._dynamics.tolist()
+        _copy_meta_data(self, melody)
+        return melody
+
+    @classmethod
+    def from_melody(cls, melody: Melody) -> ColumnarMelody:
+        """
+        builds a ColumnarMelody() from a list-based Melody() object, with a
+        copy of its meta-data
+        """
+        col = cls(tempo=melody.tempo, instrument=melody.instrument)
+        col.extend(melody.notes, melody.rhythms, melody.dynamics)
+        _copy_meta_data(melody, col)
+        return col
+
+
+def _copy_meta_data(src: Container, dest: Container) -> None:
+    """
+    copies meta-data between containers, so neither shares a list with the
+    other. fields that were never written stay unallocated.
+    """
+    dest.info = src.info
+    dest._pcs = copy(src._pcs)
+    dest._source_data = copy(src._source_data)
+    dest._source_notes = copy(src._source_notes)
@@ -2,9 +2,11 @@
 Module for handling all composition data. Contains a Composition() class/container.
 """
 
+from array import array
+
 # from core.analyze import Analyze
-from containers.chord import Chord
 from containers.melody import Melody
+from containers.part import Part
 
 
 class Composition:
@@ -47,7 +49,9 @@ class Composition:
         # self.parts is a dictionary where each entry is a list
         # of either Melody() or Chord() (or both!) objects,
         # or a single Melody() or Chord() object
-        # the key is the name of the instrument, the value is the object
+        # the key is the name of the instrument, the value is the object.
+        # lists are kept as Part() lists, which (like Melody() and Chord()
+        # objects) keep track of their own durations.
         self.parts = {}
 
     def __repr__(self) -> str:
@@ -63,23 +67,7 @@ class Composition:
         Finds the longest individual part in the piece.
         This will be the duration (in seconds)
         """
-        longest = 0.0
-        for track in self.parts:
-            dur = 0.0
-            if isinstance(self.parts[track], Melody) or isinstance(
-                self.parts[track], Chord
-            ):
-                dur += self.parts[track].duration()
-                if dur > longest:
-                    longest = dur
-            elif isinstance(self.parts[track], list):
-                # sum the entire list since each object is considered
-                # a "single" part here
-                for obj in self.parts[track]:
-                    dur += obj.duration()
-                if dur > longest:
-                    longest = dur
-        return longest
+        return max((self.part_duration(part) for part in self.parts), default=0.0)
 
     ### Public methods ###
 
@@ -141,8 +129,13 @@ class Composition:
         Add a part to this composition where
         a "part" is either a Melody object, a Chord object,
         or a list of either (or both).
+
+        lists are copied into a Part() list (unless they already are one),
+        so add any more objects to comp.parts[name], not the original list.
         """
         self.instruments.append(instr)
+        if isinstance(part, list) and type(part) != Part:
+            part = Part(part)
         self.parts.update({f"{instr} {self.how_many(instr) + 1}": part})
 
     def remove_part(self, part: str) -> None:
@@ -153,3 +146,21 @@ class Composition:
         if part in list(self.parts.keys()):
             self.instruments.remove(part)
             del self.parts[part]
+
+    def part_duration(self, part: str) -> float:
+        """
+        Returns the duration (in seconds) of a single part.
+        part param must be a string like 'violin 1'
+        """
+        return self.parts[part].duration()
+
+    def part_onsets(self, part: str) -> array:
+        """
+        Returns an array of the start time (in seconds) of each note
+        (or chord) in a part.
+        part param must be a string like 'violin 1'
+        """
+        if isinstance(self.parts[part], (Part, Melody)):
+            return self.parts[part].onsets()
+        # a single Chord() starts at the top
+        return array("d", [0.0])
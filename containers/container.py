@@ -2,16 +2,121 @@
 Base class for each container
 """
 
+import weakref
+
+# returned by the metadata properties until something is stored in them,
+# so reading an unused field doesn't allocate anything.
+EMPTY = ()
+
 
 class Container(object):
     """
     Base class for holding metadata about an
     individual melody, chord, or note object
+
+    Uses __slots__ (as does every container subclass) so objects don't
+    carry a per-instance __dict__. The metadata lists are only allocated
+    the first time something is stored in them, so thousands of containers
+    that never touch their metadata don't pay for four empty lists each.
+
+    Until then, pcs, source_data, and source_notes read as an empty tuple
+    (EMPTY). Use add_pcs() and add_source_notes() to add to them in place.
+
+    NOTE: this changes the public API. These fields used to always be lists,
+    so code that appends to one directly, i.e. obj.pcs.append(pcs), raises an
+    AttributeError if nothing has been stored in it yet. Use add_pcs() or
+    add_source_notes() instead, or assign a list first.
     """
 
+    __slots__ = ("_info", "_pcs", "_source_data", "_source_notes", "_parts")
+
     def __init__(self):
 
-        self.info = "None"
-        self.pcs = []  # pitch classes for this container
-        self.source_data = []  # source data for this container
-        self.source_notes = []  # source scale for this container
+        self._info = "None"
+        self._pcs = None  # pitch classes for this container
+        self._source_data = None  # source data for this container
+        self._source_notes = None  # source scale for this container
+        self._parts = None  # weak references to each Part() this is in
+
+    def __getstate__(self) -> dict:
+        # the parts an object is in aren't copied (or pickled) along with it
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name != "_parts" and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self._parts = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _add_part(self, part) -> None:
+        """
+        keeps a weak reference to a Part() this object was added to
+        """
+        if self._parts is None:
+            self._parts = []
+        else:
+            self._parts = [ref for ref in self._parts if ref() is not None]
+        if not any(ref() is part for ref in self._parts):
+            self._parts.append(weakref.ref(part))
+
+    def _duration_changed(self) -> None:
+        """
+        lets each Part() this object is in know that its duration changed
+        """
+        if self._parts is not None:
+            for ref in self._parts:
+                part = ref()
+                if part is not None:
+                    part._stale = True
+
+    @property
+    def info(self):
+        return self._info
+
+    @info.setter
+    def info(self, value):
+        self._info = value
+
+    @property
+    def pcs(self):
+        return EMPTY if self._pcs is None else self._pcs
+
+    @pcs.setter
+    def pcs(self, value):
+        self._pcs = value
+
+    @property
+    def source_data(self):
+        return EMPTY if self._source_data is None else self._source_data
+
+    @source_data.setter
+    def source_data(self, value):
+        self._source_data = value
+
+    @property
+    def source_notes(self):
+        return EMPTY if self._source_notes is None else self._source_notes
+
+    @source_notes.setter
+    def source_notes(self, value):
+        self._source_notes = value
+
+    def add_pcs(self, pcs) -> None:
+        """
+        appends to pcs, allocating its list if needed
+        """
+        if type(self._pcs) != list:
+            self._pcs = list(self.pcs)
+        self._pcs.append(pcs)
+
+    def add_source_notes(self, notes: list) -> None:
+        """
+        extends source_notes, allocating its list if needed
+        """
+        if type(self._source_notes) != list:
+            self._source_notes = list(self.source_notes)
+        self._source_notes.extend(notes)
@@ -3,6 +3,7 @@ Module for the Melody() class/container. Used for individual melody data in comp
 """
 
 from containers.container import Container
+from containers.rhythms import Rhythms
 
 
 class Melody(Container):
@@ -14,8 +15,15 @@ class Melody(Container):
 
     Stores: original Forte number, inputted source data, original source scale,
     tempo, instrument, notes, rhythms, and dynamics.
+
+    Rhythms are kept in a Rhythms() list, which keeps a running total of
+    their durations, so duration() and onsets() don't re-sum every rhythm.
+    Any list assigned to melody.rhythms is copied into one, as is a Rhythms()
+    list that already belongs to another melody.
     """
 
+    __slots__ = ("tempo", "instrument", "notes", "_rhythms", "dynamics")
+
     def __init__(self, tempo=None, instrument=None):
 
         super().__init__()
@@ -33,11 +41,35 @@ class Melody(Container):
         self.rhythms = []
         self.dynamics = []
 
+    @property
+    def rhythms(self) -> Rhythms:
+        return self._rhythms
+
+    @rhythms.setter
+    def rhythms(self, value) -> None:
+        if type(value) != Rhythms or value._owner not in (None, self):
+            value = Rhythms(value)
+        value._owner = self
+        self._rhythms = value
+        self._duration_changed()
+
+    def __setstate__(self, state: dict) -> None:
+        # go through the setter, so the rhythms belong to this melody
+        rhythms = state.pop("_rhythms")
+        super().__setstate__(state)
+        self.rhythms = rhythms
+
     def duration(self) -> float:
         """
         Returns the duration (float) of a melody in seconds.
         """
-        return sum(self.rhythms)
+        return self._rhythms.total()
+
+    def onsets(self):
+        """
+        Returns an array of the start time (in seconds) of each note.
+        """
+        return self._rhythms.onsets()
 
     def is_empty(self) -> bool:
         """
@@ -12,6 +12,8 @@ class Note(Container):
     MidiFile and Track() objects
     """
 
+    __slots__ = ("name", "velocity", "pitch", "start", "end")
+
     def __init__(self, velocity, pitch, start, end):
         super().__init__()
 
@@ -29,9 +31,3 @@ class Note(Container):
 
     def duration(self):
         return self.end - self.start
-
-    def pitch(self):
-        return self.pitch
-
-    def velocity(self):
-        return self.velocity
@@ -0,0 +1,134 @@
+"""
+Module for the Part() list, used by Composition() to keep track of the
+duration and onset times of parts made up of a list of Melody() and/or
+Chord() objects.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from containers.container import Container
+from containers.rhythms import Rhythms
+
+
+class Part(list):
+    """
+    A list of Melody() and/or Chord() objects, each considered a "single"
+    event, that make up one part of a Composition().
+
+    The duration of each object is kept in a Rhythms() list, so duration()
+    and onsets() don't re-measure every object each time they're asked for.
+    Appending objects keeps it up to date as it goes.
+
+    Each object keeps a (weak) reference to the parts it's been added to,
+    and marks them as stale when its own duration changes (i.e. a chord's
+    rhythm is set, or a rhythm is added to a melody). A stale part measures
+    its objects again the next time it's asked for its duration or onsets.
+    So do parts changed by any list method other than append(), extend(),
+    and __iadd__(), which are rare outside of building a part.
+
+    Behaves like a regular list otherwise.
+    """
+
+    __slots__ = ("_durations", "_stale", "__weakref__")
+
+    def __init__(self, objs=()):
+        super().__init__(objs)
+        self._durations = Rhythms()
+        self._stale = True
+        self._track(self)
+
+    def __reduce__(self):
+        # rebuild through __init__ so the durations are set up (for pickle/copy)
+        return (Part, (list(self),))
+
+    def _track(self, objs) -> None:
+        for obj in objs:
+            if isinstance(obj, Container):
+                obj._add_part(self)
+
+    def _measured(self) -> Rhythms:
+        """
+        returns the duration of each object, measuring them first if needed
+        """
+        if self._stale:
+            self._durations = Rhythms([obj.duration() for obj in self])
+            self._stale = False
+        return self._durations
+
+    def duration(self) -> float:
+        """
+        returns the total duration (in seconds) of every object in the part
+        """
+        return self._measured().total()
+
+    def onsets(self) -> array:
+        """
+        returns an array of the start time (in seconds) of each object
+        """
+        return self._measured().onsets()
+
+    ### list methods ###
+
+    def append(self, obj) -> None:
+        super().append(obj)
+        self._track((obj,))
+        if not self._stale:
+            self._durations.append(obj.duration())
+
+    def extend(self, objs) -> None:
+        start = len(self)
+        super().extend(objs)
+        added = self[start:]
+        self._track(added)
+        if not self._stale:
+            self._durations.extend([obj.duration() for obj in added])
+
+    def __iadd__(self, objs) -> Part:
+        self.extend(objs)
+        return self
+
+    def _changed(self) -> None:
+        self._stale = True
+
+    def __imul__(self, n: int) -> Part:
+        super().__imul__(n)
+        self._changed()
+        return self
+
+    def insert(self, i: int, obj) -> None:
+        super().insert(i, obj)
+        self._track((obj,))
+        self._changed()
+
+    def pop(self, i: int = -1):
+        obj = super().pop(i)
+        self._changed()
+        return obj
+
+    def remove(self, obj) -> None:
+        super().remove(obj)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def __setitem__(self, i, value) -> None:
+        value = list(value) if isinstance(i, slice) else value
+        super().__setitem__(i, value)
+        self._track(value if isinstance(i, slice) else (value,))
+        self._changed()
+
+    def __delitem__(self, i) -> None:
+        super().__delitem__(i)
+        self._changed()
@@ -0,0 +1,157 @@
+"""
+Module for the Rhythms() list, used by Melody() to keep track of its own
+duration and onset times as it's modified.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+
+class Rhythms(list):
+    """
+    A list of rhythms (floats: durations in seconds) that keeps a running
+    total of its durations, so total() doesn't need to re-sum the list.
+
+    Also keeps a cumulative array of onsets (the start time of each rhythm).
+    Onsets are only computed when asked for, and only from the first value
+    that was changed since they were last computed, so appending to a long
+    melody doesn't re-sum everything before it.
+
+    Behaves like a regular list otherwise. Every list method that modifies
+    the list in place is overridden to keep the totals in sync, and to let
+    the Melody() that owns the list (if any) know its duration changed.
+    """
+
+    __slots__ = ("_total", "_onsets", "_owner")
+
+    def __init__(self, rhythms=()):
+        super().__init__(rhythms)
+        self._total = sum(self)
+        # onsets[i] == sum(self[:i]). only the first len(onsets) are valid.
+        self._onsets = array("d")
+        self._owner = None  # set by Melody()
+
+    def __reduce__(self):
+        # rebuild through __init__ so the totals are set up (for pickle/copy)
+        return (Rhythms, (list(self),))
+
+    def total(self) -> float:
+        """
+        returns the sum of every rhythm in the list
+        """
+        return self._total
+
+    def onsets(self) -> array:
+        """
+        returns an array of the start time (in seconds) of each rhythm
+        """
+        onsets = self._onsets
+        if len(onsets) < len(self):
+            i = len(onsets)
+            cur = onsets[-1] + self[i - 1] if i > 0 else 0.0
+            for rhythm in self[i:]:
+                onsets.append(cur)
+                cur += rhythm
+        return onsets
+
+    def onset(self, i: int) -> float:
+        """
+        returns the start time (in seconds) of the rhythm at a given index
+        """
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("rhythm index out of range")
+        return self.onsets()[i]
+
+    def _changed(self, start: int = 0) -> None:
+        # onsets after a change are no longer valid, nor are any past the end
+        del self._onsets[min(start + 1, len(self)) :]
+
+    def _recount(self) -> None:
+        self._total = sum(self)
+        self._changed()
+        self._notify()
+
+    def _notify(self) -> None:
+        if self._owner is not None:
+            self._owner._duration_changed()
+
+    ### list methods ###
+
+    def append(self, rhythm: float) -> None:
+        super().append(rhythm)
+        self._total += rhythm
+        self._notify()
+
+    def extend(self, rhythms) -> None:
+        start = len(self)
+        super().extend(rhythms)
+        for rhythm in self[start:]:
+            self._total += rhythm
+        self._notify()
+
+    def __iadd__(self, rhythms) -> Rhythms:
+        self.extend(rhythms)
+        return self
+
+    def __imul__(self, n: int) -> Rhythms:
+        super().__imul__(n)
+        self._recount()
+        return self
+
+    def insert(self, i: int, rhythm: float) -> None:
+        super().insert(i, rhythm)
+        self._total += rhythm
+        self._changed(max(0, i if i >= 0 else len(self) + i - 1))
+        self._notify()
+
+    def pop(self, i: int = -1) -> float:
+        rhythm = super().pop(i)
+        self._total -= rhythm
+        self._changed(i if i >= 0 else len(self) + i + 1)
+        self._notify()
+        return rhythm
+
+    def remove(self, rhythm: float) -> None:
+        i = self.index(rhythm)
+        del self[i]
+
+    def clear(self) -> None:
+        super().clear()
+        self._total = 0
+        self._changed()
+        self._notify()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def __setitem__(self, i, value) -> None:
+        if isinstance(i, slice):
+            super().__setitem__(i, value)
+            self._recount()
+        else:
+            if i < 0:
+                i += len(self)
+            self._total += value - self[i]
+            super().__setitem__(i, value)
+            self._changed(i)
+            self._notify()
+
+    def __delitem__(self, i) -> None:
+        if isinstance(i, slice):
+            super().__delitem__(i)
+            self._recount()
+        else:
+            if i < 0:
+                i += len(self)
+            self._total -= self[i]
+            super().__delitem__(i)
+            self._changed(i)
+            self._notify()
@@ -23,20 +23,28 @@ TODO:
 TODO: generate spectrogram of a given audio file
 """
 
-from core.constants import NOTES, PITCH_CLASSES, RHYTHMS, BEATS, RANGE, SCALES, SETS
-from core.modify import Modify
+from core.constants import RHYTHMS, BEATS, RANGE, SCALES, SETS
+from core.lookup import INDEX_PCS, note_to_index, notes_to_indices, note_to_pc
+from core.setclass import (
+    to_mask,
+    normal_order,
+    prime_form,
+    forte_number,
+    forte_numbers,
+    interval_vector,
+    window_masks,
+)
 from containers.composition import Composition
 from containers.melody import Melody
 from containers.chord import Chord
 from utils.midi import (
     load_midi_file,
     export_midi,
-    parse_midi,
     tempo2bpm,
-    MIDI_num_to_note_name,
 )
 
-from utils.tools import remove_oct, oct_equiv, scale_to_tempo, all_same, to_str
+from utils.smf import read_notes, ticks_to_seconds
+from utils.tools import oct_equiv, scale_to_tempo, all_same, to_str
 
 
 class Analyze:
@@ -59,59 +67,68 @@ class Analyze:
         it's in the original order of the elements in the submitted notes list
         """
         if type(notes) == str:
-            # check if there's an octave int present
-            if not notes.isalpha():
-                note = remove_oct(notes)
-                pcs = PITCH_CLASSES.index(note)
-            else:
-                pcs = PITCH_CLASSES.index(notes)
+            pcs = note_to_pc(notes)
         elif type(notes) == list:
-            pcs = []
-            notes_len = len(notes)
-            for n in range(notes_len):
-                if not notes[n].isalpha():
-                    note = remove_oct(notes[n])
-                    pcs.append(PITCH_CLASSES.index(note))
-                else:
-                    pcs.append(PITCH_CLASSES.index(notes[n]))
+            pcs = [note_to_pc(note) for note in notes]
         else:
             raise TypeError(
                 "notes must be a list[int] or single int! " "type is", type(notes)
             )
         return pcs
 
-    # TODO: TEST THIS
-    def count_pcs(self, tracks):
+    def count_pcs(self, tracks) -> dict:
         """
-        takes a list tracks (ideally parsed with midi.parse_midi()), then
-        counts the number of instances of each pitch class in each track
+        counts the number of instances of each pitch class in each track,
+        and across all of them, in a single pass over each track.
+
+        tracks can be:
+            - a Composition() (each part is a track)
+            - a dict or list of tracks, where each track is either a mido track
+              (i.e. from midi.parse_midi()), a structured note array (from
+              analyze_midi()), a Melody(), a Chord(), or a list of those.
 
         returns:
-            dict(key = pitch class integer, value = total appearances)
-        """
-        pc_totals = {
-            0: 0,
-            1: 0,
-            2: 0,
-            3: 0,
-            4: 0,
-            5: 0,
-            6: 0,
-            7: 0,
-            8: 0,
-            9: 0,
-            10: 0,
-            11: 0,
-        }
-        for track in tracks:
-            # convert all MIDI note numbers to
-            # note name strings, then pitch classes (obvs not ideal)
-            notes = []
-            for n in range(len(tracks.notes)):
-                notes.append(self.get_pcs(MIDI_num_to_note_name(track.notes[n])))
-            for key in pc_totals:
-                pc_totals[key] += notes.count(key)
-        return pc_totals
+            {
+                "Total": dict(key = pitch class integer, value = total appearances),
+                "Tracks": {track name (or index): dict(pitch class : total)},
+            }
+        """
+        import numpy as np
+
+        if isinstance(tracks, Composition):
+            tracks = tracks.parts
+        if not isinstance(tracks, dict):
+            tracks = dict(enumerate(tracks))
+
+        total = np.zeros(12, dtype=np.int64)
+        res = {"Total": {}, "Tracks": {}}
+        for name, track in tracks.items():
+            counts = np.bincount(self._track_pcs(track), minlength=12)
+            total += counts
+            res["Tracks"][name] = dict(enumerate(counts.tolist()))
+        res["Total"] = dict(enumerate(total.tolist()))
+        return res
+
+    def _track_pcs(self, track):
+        """
+        returns an int array of the pitch class of every note in a track
+        (see count_pcs() for the kinds of tracks supported)
+        """
+        import numpy as np
+
+        if isinstance(track, np.ndarray):
+            pitches = track["pitch"] if track.dtype.names else track
+            return np.asarray(pitches, dtype=np.int64) % 12
+        if isinstance(track, (Melody, Chord)):
+            indices = np.array(notes_to_indices(track.notes), dtype=np.intp)
+            return np.frombuffer(INDEX_PCS, dtype=np.int8)[indices].astype(np.int64)
+        if len(track) > 0 and isinstance(track[0], (Melody, Chord)):
+            return np.concatenate([self._track_pcs(item) for item in track])
+        # mido track (a list of Messages). rests are note_on's with no velocity
+        pitches = [
+            msg.note for msg in track if msg.type == "note_on" and msg.velocity > 0
+        ]
+        return np.array(pitches, dtype=np.int64) % 12
 
     @staticmethod
     def get_index(notes):
@@ -126,13 +143,9 @@ class Analyze:
         back against NOTES to get octave-accurate transposed notes
         """
         if type(notes) == str:
-            return NOTES.index(notes)
+            return note_to_index(notes)
         elif type(notes) == list:
-            indices = []
-            notes_len = len(notes)
-            for n in range(notes_len):
-                indices.append(NOTES.index(notes[n]))
-            return indices
+            return notes_to_indices(notes)
         else:
             raise TypeError(
                 "notes must be a single str or list[str]! " "\ntype is:", type(notes)
@@ -140,55 +153,57 @@ class Analyze:
 
     ### Pitch Class Set ###
 
-    # TODO
-    def find_normal_order(self, notes):
+    def get_mask(self, notes) -> int:
         """
-        NOTE: Not ready! maybe match against SETS to see if it's actually
-              in normal order
+        converts a set of notes to a 12-bit pitch class mask (see setclass).
+        notes can be a list of note name strings (with or without octaves),
+        a list of pitch class integers, or a mask (int) already.
+        """
+        if type(notes) == int:
+            return notes
+        if len(notes) > 0 and type(notes[0]) == str:
+            notes = self.get_pcs(notes)
+        return to_mask(notes)
 
-        takes a list of note name strings, converts them to pitch class integers,
-        and finds an ordering "most packed to the left"
+    def find_normal_order(self, notes) -> list[int]:
+        """
+        takes a list of note name strings or pitch class integers, converts
+        them to an unordered set of pitch classes, and finds the ordering
+        "most packed to the left"
 
         returns pcs (list[int]) in normal order.
         """
-        pcs = self.get_pcs(notes)  # get pcs from a given set
-        pcs.sort()  # sort in ascending order
-        # rotate until smallest interval in the set is
-        # at the left, and range of set is the smallest possible
-        while pcs[1] - pcs[0] >= 2:
-            pc = pcs.pop(0)
-            pcs.append(pc)
-        return pcs
+        return normal_order(self.get_mask(notes))
 
-    # TODO
-    def find_set(self, notes):
+    def find_prime_form(self, notes) -> list[int]:
         """
-        Given a set of notes, find an associated Forte set
-
-            Reduce all notes (removing duplicates in any octave)
-            in a given melody to an unordered set.
-
-                Iterate through list, keeping track of each note
-                it comes across.
+        takes a list of note name strings or pitch class integers and
+        returns the prime form (list[int]) of its pitch class set
+        """
+        return prime_form(self.get_mask(notes))
 
-                If we haven't seen this before, add to
-                list, otherwise skip
+    def find_set(self, notes) -> str | None:
+        """
+        Given a set of notes (note name strings or pitch class integers),
+        find the associated Forte set.
 
-            for note in notes:
-                # remove the octave and see if we've seen this note before
-                if note in found_notes:
-                    continue
-                else:
-                    found_notes.append(note)
+        Duplicates and octaves are ignored. Returns the Forte number (a key
+        in SETS), or None if the set isn't in SETS.
 
-            Convert to pitch class integers, then sort in ascending order
+        NOTE: SETS only has 5-9 note sets, not the full Forte collection
+        """
+        return forte_number(self.get_mask(notes))
 
-            Convert to normal order, then compare against SETS
+    def find_sets(self, notes, size: int) -> list:
+        """
+        finds the Forte set of every window of n consecutive notes in a
+        melody (note name strings or pitch class integers), all at once.
 
-            NOTE: will need to expand SETS to include all sets in the Forte collection,
-                  not just 5-9 note sets
+        returns a list of Forte numbers (or None) of length len(notes) - size + 1
         """
-        ...
+        if len(notes) > 0 and type(notes[0]) == str:
+            notes = self.get_pcs(notes)
+        return forte_numbers(window_masks(notes, size)).tolist()
 
     ### Intervals ###
 
@@ -200,22 +215,56 @@ class Analyze:
         difference between index values with NOTES corresponds to distance
         in semi-tones!
         """
-        intervals = []
         ind = self.get_index(notes)
-        ind_len = len(ind)
-        for n in range(1, ind_len):
-            intervals.append(ind[n] - ind[n - 1])
-        return intervals
+        return [cur - prev for prev, cur in zip(ind, ind[1:])]
+
+    def get_interval_vector(self, notes) -> dict:
+        """
+        gets the interval vector of a given set of notes (note name
+        strings, pitch class integers, or a mask).
 
-    # TODO
-    def get_interval_vector(self, notes):
+        returns a dict[interval class : frequency]
         """
-        gets the interval vector of a given set of
-        notes.
+        vector = interval_vector(self.get_mask(notes))
+        return {ic: total for ic, total in enumerate(vector, start=1)}
+
+    def get_interval_histogram(self, notes: list[str], ic: bool = False) -> dict:
+        """
+        counts every successive interval in a melody (a list of note name
+        strings) in semitones, i.e. {2: 10, -1: 4, ...}. intervals are
+        directed (negative values are descending).
+
+        if ic is True, intervals are reduced to interval classes (0-6) first.
 
         returns a dict[interval : frequency]
         """
-        ...
+        import numpy as np
+
+        intervals = np.diff(np.asarray(self.get_index(notes), dtype=np.int16))
+        if ic:
+            intervals = np.abs(intervals) % 12
+            intervals = np.minimum(intervals, 12 - intervals)
+        values, totals = np.unique(intervals, return_counts=True)
+        return dict(zip(values.tolist(), totals.tolist()))
+
+    def get_comp_interval_histogram(self, comp: Composition, ic: bool = False) -> dict:
+        """
+        counts every successive interval in each melody of a composition.
+        chord progressions are skipped, since chord notes aren't ordered.
+
+        returns a dict[interval : frequency] (see get_interval_histogram())
+        """
+        totals = {}
+        for part in comp.parts.values():
+            melodies = part if isinstance(part, list) else [part]
+            for melody in melodies:
+                if not isinstance(melody, Melody) or len(melody.notes) < 2:
+                    continue
+                for interval, total in self.get_interval_histogram(
+                    melody.notes, ic
+                ).items():
+                    totals[interval] = totals.get(interval, 0) + total
+        return dict(sorted(totals.items()))
 
     def check_range(self, notes: list[str], ran: list[str]):
         """
@@ -240,74 +289,48 @@ class Analyze:
     @staticmethod
     def get_range(notes: list[str]):
         """
-        returns the lowest and highest note in a given set of notes
-        in a tuple: (min, max)
+        returns the indices in NOTES of the lowest and highest note
+        in a given set of notes in a tuple: (min, max)
         """
-        min, max = 0, 0
-        for note in notes:
-            (min, max) = (10000, -1)
-            n = NOTES.index(note)
-            if n < int(min):
-                min = n
-            elif n > int(max):
-                max = n
-        return min, max
+        if len(notes) == 0:
+            return 0, 0
+        indices = notes_to_indices(notes)
+        return min(indices), max(indices)
 
     ### 12 Tone Functions ###
 
-    # TODO
-    def get_12tone_matrix(self, row, intervals):
+    @staticmethod
+    def get_12tone_matrix(row):
         """
-        NOTE: NOT READY
-
-        Generates a 2-D array/12-tone matrix from a given pitch class set (pcs = list[int]).
-        Requires a list of 11 unique positive intervals between 1-11 ([1, 4, 2, 6]) to iterate off of.
-
-        The matrix is generating by appending a transposition
-        of the original row to each subsequent index.
-        All other information, such as retrogressions, inversions, and
-        retrogressions + inversions can be found using some print tricks.
-
-        Returns a 2-D matrix - 'm'
-
-        ---------
-
-        Print original row:
-            print(m[0])
-
-        Print each row retrograde:
-            for i in range(len(m[i])):
-                retro = m[i]
-                retro.reverse()
-                print(retro)
-
-        Print each row inversions (matrix column, top to bottom):
-            for i in range(len(m))
-                inv = [row[i] for row in m]
-                print(inv)
+        Generates a 12-tone matrix from a given row (a list of all 12 pitch
+        class name strings, i.e. from Generate.new_12tone_row(), or integers).
+
+        Returns a cached ToneMatrix (see core.serial). Each row of the matrix
+        is a P form, and each column an I form. Forms are labeled by their
+        first pitch class:
+
+            m = analyze.get_12tone_matrix(row)
+            m.P(0)      # prime form starting on C
+            m.R(0)      # its retrograde
+            m.I(7)      # inversion starting on G
+            m.RI(7)     # its retrograde
+            m.matrix    # the full 12x12 array
+        """
+        from core.serial import get_matrix
 
-        Print each row retrograde inversions (matrix column, bottom to top):
-            for i in range(len(m))
-                ret_inv = [row[i] for row in m]
-                ret_inv[i].reverse()
-                print(ret_inv)
+        return get_matrix(row)
 
-        --------
-        NOTE: maybe there's a way to populate the matrix using syntax like this:
-        arr = [[r]*cols]*rows, where r is a modified version (transposition) of the
-        original row.
+    @staticmethod
+    def get_12tone_matrices(rows):
+        """
+        Generates the 12-tone matrices of many rows at once.
 
-        rows and cols are declared as a tuple (rows, cols = (n, n)
-        where n is some int)
+        Returns an (n, 12, 12) array, where each matrix is laid out the same
+        way as a ToneMatrix's.
         """
-        m = [[]]
-        mod = Modify()
-        # add original row to first matrix row
-        for i in range(len(intervals)):
-            r = mod.transpose(row, intervals[i])
-            print("\nadding P", intervals[i], ":", r)
-            m.insert(i, r)
-        return m
+        from core.serial import matrices
+
+        return matrices(rows)
 
     @staticmethod
     def print_matrix(matrix):
@@ -330,7 +353,7 @@ class Analyze:
         info = {}
         for part in comp.parts:
             if isinstance(comp.parts[part], Melody) or isinstance(
-                    comp.parts[part], Chord
+                comp.parts[part], Chord
             ):
                 info.update(
                     {
@@ -376,41 +399,66 @@ class Analyze:
         analyzes a given MIDI file with a given file_name (str)
 
         returns a dictionary with nested dictionaries containing
-        information about pitch class content, tempo, and velocities
-        for each track
-
-        TODO: still need to figure out rhythms...
-              extract start/end times for each note, subtract end
-              from start, then store?
+        information about pitch class content, tempo, rhythms (note
+        durations in seconds), and velocities for each track
         """
-        dynamics = {}
-        pitch_classes = {}
         res = {"Tempo": 0, "Pitch Classes": {}, "Rhythms": {}, "Dynamics": {}}
-        # get MidiTrack() dict and Messages() list
-        tracks, msgs = parse_midi(file_name)
-        # get global tempo
-        res["Tempo"] = tempo2bpm(msgs[0].tempo)
-        # get pitch class integers and velocities from each track
-        for t in range(len(tracks)):
-            pcs = []
-            vel = []
-            track = tracks[f"track {str(t)}"]
-            for i in range(len(track)):
-                if hasattr(track[i], "velocity"):
-                    # skip any silent notes (rests)
-                    if track[i].velocity == 0:
-                        continue
-                    # translate to note name...
-                    note = MIDI_num_to_note_name(track[i].note)
-                    # ...then to PC integer because reasons
-                    pcs.append(self.get_pcs(note))
-                    vel.append(track[i].velocity)
-            pitch_classes[f"track {str(t)}"] = pcs
-            dynamics[f"track {str(t)}"] = vel
-
-        res["Pitch Classes"].update(pitch_classes)
-        res["Dynamics"].update(dynamics)
+        analysis = self.analyze_midi(file_name)
+        res["Tempo"] = analysis["Tempo"]
+        for track, notes in analysis["Notes"].items():
+            res["Pitch Classes"][track] = (notes["pitch"] % 12).tolist()
+            res["Rhythms"][track] = analysis["Durations"][track].tolist()
+            res["Dynamics"][track] = notes["velocity"].tolist()
+        return res
 
+    @staticmethod
+    def analyze_midi(file_name: str, cache=None) -> dict:
+        """
+        reads every note in a MIDI file in a single pass over each track
+        (see utils.smf.read_notes()), without building mido Messages.
+
+        if an AnalysisCache() (see utils.cache) is supplied, unchanged files
+        are read from it instead, and new results are added to it.
+
+        returns a dict with:
+            "Tempo": the initial tempo in BPM
+            "Resolution": ticks per quarter note
+            "Notes": {"track n": structured array of pitch, velocity,
+                      channel, onset, and duration (in ticks) per note}
+            "Onsets": {"track n": onset of each note in seconds}
+            "Durations": {"track n": duration of each note in seconds}
+            "Pitch Classes": {"track n": array of totals for each pitch class}
+        """
+        import numpy as np
+
+        if cache is not None:
+            # hash the file once for both the lookup and the store
+            key = cache.key(file_name)
+            res = cache.get(file_name, key=key)
+            if res is not None:
+                return res
+
+        resolution, tempos, tracks = read_notes(file_name)
+        res = {
+            "Tempo": tempo2bpm(tempos[0][1]),
+            "Resolution": resolution,
+            "Notes": {},
+            "Onsets": {},
+            "Durations": {},
+            "Pitch Classes": {},
+        }
+        for t, notes in enumerate(tracks):
+            track = f"track {str(t)}"
+            onsets = ticks_to_seconds(notes["onset"], resolution, tempos)
+            ends = ticks_to_seconds(
+                notes["onset"] + notes["duration"], resolution, tempos
+            )
+            res["Notes"][track] = notes
+            res["Onsets"][track] = onsets
+            res["Durations"][track] = ends - onsets
+            res["Pitch Classes"][track] = np.bincount(notes["pitch"] % 12, minlength=12)
+        if cache is not None:
+            cache.put(file_name, res, key=key)
         return res
 
 
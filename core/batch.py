@@ -0,0 +1,255 @@
+"""
+Generates compositions in bulk across a pool of worker processes.
+
+Each composition is a duet (a melody plus a chord progression, like
+Generate.new_composition()) exported as its own MIDI file. Every task gets its
+own seed derived from a base seed, so any piece in a batch can be reproduced
+on its own regardless of which worker ran it.
+
+Usage:
+    python -m core.batch --total 1000 --workers 8 --seed 42 --timeout 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import random
+import signal
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from math import floor
+from os.path import join
+from time import perf_counter
+
+from tqdm import tqdm
+
+from core.constants import INSTRUMENTS, MIDI_FOLDER
+from core.generate import Generate
+from utils.midi import export_midi
+
+
+class TaskTimeout(Exception):
+    """raised inside a worker when a composition takes longer than its timeout"""
+
+
+def _on_timeout(signum, frame):
+    raise TaskTimeout()
+
+
+def task_seed(base_seed: int, index: int) -> int:
+    """
+    returns the seed for the nth composition in a batch.
+
+    same as the nth child of SeedSequence(base_seed).spawn(), so seeds from
+    batches with nearby base seeds don't overlap (base_seed + index would
+    make batch 4's first piece the same as batch 3's second).
+    """
+    from numpy.random import SeedSequence
+
+    seq = SeedSequence(base_seed, spawn_key=(index,))
+    return int(seq.generate_state(1, dtype="uint64")[0])
+
+
+def _tmp_name(out_dir: str, index: int, seed: int) -> str:
+    """
+    where a piece is written before it's renamed to its final file name.
+    the piece's title is random, so this only depends on index and seed,
+    which lets new_batch() clean up after a worker that died mid-export.
+    """
+    return join(out_dir, f".{index:06d}-{seed}.mid.tmp")
+
+
+def _remove(file_name: str) -> None:
+    try:
+        os.remove(file_name)
+    except FileNotFoundError:
+        pass
+
+
+def _failure(index: int, seed: int, error: str) -> dict:
+    return {"index": index, "seed": seed, "notes": 0, "error": error}
+
+
+def new_piece(index: int, seed: int, out_dir: str) -> dict:
+    """
+    generates and exports a single composition with a given seed.
+
+    the file is written under a temporary name and renamed once it's
+    complete, so a piece that fails or times out mid-export doesn't
+    leave a partial file behind.
+
+    returns a dict with the piece's index, seed, file name, and total notes.
+    """
+    create = Generate(seed=seed)
+    # names (used for the composer's name) only uses the global random state
+    random.seed(seed)
+
+    comp = create.init_comp()
+    comp.ensemble = "duet"
+
+    melody = create.new_melody(tempo=comp.tempo)
+    melody.instrument = create.new_instrument()
+    comp.add_part(melody, melody.instrument)
+
+    chords = create.new_chords(
+        total=create.rng.randint(floor(len(melody.notes) / 2), len(melody.notes)),
+        tempo=comp.tempo,
+        scale=melody.notes,
+    )
+    instr = INSTRUMENTS[create.rng.randint(0, 8)]
+    for chord in chords:
+        chord.instrument = instr
+    comp.add_part(chords, instr)
+
+    comp.midi_file_name = f"{index:06d} {comp.title}.mid"
+    tmp_name = _tmp_name(out_dir, index, seed)
+    try:
+        export_midi(comp, file_name=tmp_name)
+        os.replace(tmp_name, join(out_dir, comp.midi_file_name))
+    except BaseException:
+        _remove(tmp_name)
+        raise
+
+    return {
+        "index": index,
+        "seed": seed,
+        "file": comp.midi_file_name,
+        "notes": len(melody.notes) + sum(len(chord.notes) for chord in chords),
+    }
+
+
+def _run_task(index: int, seed: int, out_dir: str, timeout: float = None) -> dict:
+    """
+    worker entry point. runs new_piece() with an optional timeout (on platforms
+    with SIGALRM) and reports failures instead of raising them.
+    """
+    use_alarm = timeout is not None and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        # keep per-piece output from burying the progress bar
+        with redirect_stdout(io.StringIO()):
+            res = new_piece(index, seed, out_dir)
+        res["error"] = None
+    except TaskTimeout:
+        res = _failure(index, seed, "timeout")
+    except Exception as e:
+        res = _failure(index, seed, repr(e))
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    return res
+
+
+def new_batch(
+    total: int,
+    workers: int = None,
+    seed: int = None,
+    timeout: float = None,
+    out_dir: str = None,
+) -> dict:
+    """
+    generates a total number of compositions across a process pool.
+
+    workers defaults to the number of CPUs. if no seed is supplied one is
+    picked at random (and reported in the summary so the batch can be re-run).
+    timeout is in seconds per composition.
+
+    if a worker dies (i.e. it's killed, or runs out of memory) the pool
+    can't run anything else, so every task that hadn't finished yet is
+    recorded as failed instead of aborting the batch.
+
+    returns a summary dict with the results of each task and throughput stats.
+    """
+    if total < 1:
+        raise ValueError("total must be at least 1")
+    if seed is None:
+        seed = random.randrange(2**31)
+    if out_dir is None:
+        out_dir = MIDI_FOLDER
+    os.makedirs(out_dir, exist_ok=True)
+
+    results = []
+    start = perf_counter()
+    seeds = [task_seed(seed, i) for i in range(total)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tasks = {}
+        try:
+            for i in range(total):
+                tasks[pool.submit(_run_task, i, seeds[i], out_dir, timeout)] = i
+        except BrokenProcessPool:
+            pass  # tasks that weren't submitted are marked as failed below
+        for task in tqdm(as_completed(tasks), total=total, desc="progress"):
+            try:
+                results.append(task.result())
+            except BrokenProcessPool:
+                i = tasks[task]
+                _remove(_tmp_name(out_dir, i, seeds[i]))
+                results.append(_failure(i, seeds[i], "worker pool broke"))
+    for i in range(len(tasks), total):
+        results.append(_failure(i, seeds[i], "worker pool broke"))
+    elapsed = perf_counter() - start
+
+    results.sort(key=lambda r: r["index"])
+    failed = [r for r in results if r["error"] is not None]
+    notes = sum(r["notes"] for r in results)
+    return {
+        "seed": seed,
+        "total": total,
+        "completed": total - len(failed),
+        "failed": failed,
+        "notes": notes,
+        "seconds": elapsed,
+        "pieces_per_sec": (total - len(failed)) / elapsed,
+        "notes_per_sec": notes / elapsed,
+        "results": results,
+    }
+
+
+def display_summary(summary: dict) -> None:
+    output = (
+        f"\nseed: {summary['seed']}"
+        f"\ncompleted: {summary['completed']} / {summary['total']}"
+        f"\nfailed: {len(summary['failed'])}"
+        f"\ntotal notes: {summary['notes']}"
+        f"\ntime: {summary['seconds']:.2f} sec"
+        f"\npieces/sec: {summary['pieces_per_sec']:.2f}"
+        f"\nnotes/sec: {summary['notes_per_sec']:.1f}"
+    )
+    print(output)
+    for fail in summary["failed"]:
+        print(f"  piece {fail['index']} (seed {fail['seed']}): {fail['error']}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--total", type=int, default=10, help="(int) number of compositions"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="(int) worker processes (default: cpu count)"
+    )
+    parser.add_argument("--seed", type=int, help="(int) base seed (optional)")
+    parser.add_argument(
+        "--timeout", type=float, help="(float) seconds allowed per composition"
+    )
+    parser.add_argument("--out", type=str, help="(string) output directory")
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    display_summary(
+        new_batch(
+            total=args.total,
+            workers=args.workers,
+            seed=args.seed,
+            timeout=args.timeout,
+            out_dir=args.out,
+        )
+    )
@@ -11,6 +11,15 @@ ROOT = Path(__file__).parent.parent
 # location to write MIDI files to
 MIDI_FOLDER = join(ROOT, "midi")
 
+# word lists used to generate titles. the bundled list is always available,
+# the larger MIT list is downloaded to the cache once via utils.words.cache_words()
+WORD_LIST = join(ROOT, "data", "wordlist.txt")
+WORD_LIST_URL = "https://www.mit.edu/~ecprice/wordlist.10000"
+WORD_LIST_CACHE = join(Path.home(), ".cache", "anima", "wordlist.10000")
+
+# default location of cached MIDI analysis results (see utils.cache)
+ANALYSIS_CACHE = join(Path.home(), ".cache", "anima", "analysis")
+
 # The alphabet.
 ALPHABET = [
     "a",
@@ -530,6 +539,7 @@ SETS = {
     "5-23A": [0, 2, 3, 5, 7],
     "5-23B": [0, 2, 4, 5, 7],
     "5-24A": [0, 1, 3, 5, 7],
+    "5-24B": [0, 2, 4, 6, 7],
     "5-25A": [0, 2, 3, 5, 8],
     "5-25B": [0, 3, 5, 6, 8],
     "5-26A": [0, 2, 4, 5, 8],
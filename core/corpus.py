@@ -0,0 +1,325 @@
+"""
+Analyzes every MIDI file in a directory across a pool of worker processes.
+
+Each worker reads a chunk of files with Analyze.analyze_midi() and returns a
+row of per-file results plus a CorpusStats() object for the whole chunk.
+CorpusStats() objects only hold totals and histograms, so partial results can
+be merged in any order (and across separate runs).
+
+Per-file results are written as columns to a .npz or .csv file. Files are
+named by their path relative to the corpus folder, since files in different
+sub-folders can share a name.
+
+Pass --cache to keep each file's analysis in an AnalysisCache() (see
+utils.cache), so unchanged files are skipped when the corpus is re-analyzed.
+
+Usage:
+    python -m core.corpus --dir midi --workers 8 --out corpus.npz --cache
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from os.path import join
+from time import perf_counter
+
+import numpy as np
+from tqdm import tqdm
+
+from core.analyze import Analyze
+from core.constants import ANALYSIS_CACHE, MIDI_FOLDER, PITCH_CLASSES
+from utils.cache import AnalysisCache, MAX_BYTES
+
+# per-file result columns, in the order they're written
+COLUMNS = ["file_name", "tempo", "notes", "seconds", "mean_velocity", "mean_duration"]
+COLUMNS += [f"pc_{pc}" for pc in PITCH_CLASSES]
+
+# note durations are counted in bins of this many seconds
+DURATION_BIN = 0.125
+DURATION_BINS = 64  # anything longer lands in the last bin
+
+
+class CorpusStats:
+    """
+    Mergeable totals for a set of analyzed MIDI files:
+
+        files: number of files
+        notes: number of notes
+        pitch_classes: totals for each pitch class (12)
+        velocities: totals for each MIDI velocity (128)
+        durations: totals for each duration bin (see DURATION_BIN)
+        tempos: {BPM: number of files}
+    """
+
+    __slots__ = (
+        "files",
+        "notes",
+        "seconds",
+        "pitch_classes",
+        "velocities",
+        "durations",
+        "tempos",
+    )
+
+    def __init__(self):
+        self.files = 0
+        self.notes = 0
+        self.seconds = 0.0
+        self.pitch_classes = np.zeros(12, dtype=np.int64)
+        self.velocities = np.zeros(128, dtype=np.int64)
+        self.durations = np.zeros(DURATION_BINS, dtype=np.int64)
+        self.tempos = {}
+
+    def add(self, analysis: dict) -> None:
+        """
+        adds the results of Analyze.analyze_midi() for a single file
+        """
+        self.files += 1
+        tempo = analysis["Tempo"]
+        self.tempos[tempo] = self.tempos.get(tempo, 0) + 1
+        for track, notes in analysis["Notes"].items():
+            self.notes += len(notes)
+            self.pitch_classes += analysis["Pitch Classes"][track]
+            self.velocities += np.bincount(notes["velocity"], minlength=128)
+            bins = np.minimum(
+                analysis["Durations"][track] // DURATION_BIN, DURATION_BINS - 1
+            ).astype(np.int64)
+            self.durations += np.bincount(bins, minlength=DURATION_BINS)
+
+    def merge(self, other: CorpusStats) -> CorpusStats:
+        """
+        adds another CorpusStats() object's totals to this one.
+        returns self, so partial results can be reduced in a loop.
+        """
+        self.files += other.files
+        self.notes += other.notes
+        self.seconds += other.seconds
+        self.pitch_classes += other.pitch_classes
+        self.velocities += other.velocities
+        self.durations += other.durations
+        for tempo, total in other.tempos.items():
+            self.tempos[tempo] = self.tempos.get(tempo, 0) + total
+        return self
+
+    def mean_velocity(self) -> float:
+        if self.notes == 0:
+            return 0.0
+        return float(np.dot(np.arange(128), self.velocities) / self.notes)
+
+    def to_dict(self) -> dict:
+        return {
+            "files": self.files,
+            "notes": self.notes,
+            "pitch_classes": dict(zip(PITCH_CLASSES, self.pitch_classes.tolist())),
+            "mean_velocity": self.mean_velocity(),
+            "durations": self.durations.tolist(),
+            "tempos": dict(sorted(self.tempos.items())),
+        }
+
+
+def _file_row(file_name: str, analysis: dict, root: str = None) -> list:
+    """
+    builds a row of per-file results (see COLUMNS). the file is named by its
+    path relative to root, if one is supplied.
+    """
+    notes = [notes for notes in analysis["Notes"].values() if len(notes)]
+    durations = [analysis["Durations"][track] for track in analysis["Notes"]]
+    total = sum(len(n) for n in notes)
+    ends = [
+        analysis["Onsets"][track] + analysis["Durations"][track]
+        for track in analysis["Notes"]
+    ]
+    seconds = max((float(end.max()) for end in ends if len(end)), default=0.0)
+    mean_velocity = (
+        float(sum(int(n["velocity"].sum()) for n in notes) / total) if total else 0.0
+    )
+    mean_duration = (
+        float(sum(float(d.sum()) for d in durations) / total) if total else 0.0
+    )
+    pcs = sum(analysis["Pitch Classes"].values(), np.zeros(12, dtype=np.int64))
+    return [
+        file_name if root is None else os.path.relpath(file_name, root),
+        analysis["Tempo"],
+        total,
+        seconds,
+        mean_velocity,
+        mean_duration,
+        *pcs.tolist(),
+    ]
+
+
+def analyze_files(
+    files: list[str],
+    cache_dir: str = None,
+    cache_bytes: int = MAX_BYTES,
+    root: str = None,
+) -> tuple[list, CorpusStats, list]:
+    """
+    worker entry point. analyzes a chunk of files, using an AnalysisCache()
+    in cache_dir if one is supplied. rows name each file by its path
+    relative to root (the corpus folder), or as given if there isn't one.
+
+    returns the per-file rows, the chunk's CorpusStats(), and a list
+    of (file, error) for any files that couldn't be read.
+    """
+    rows = []
+    stats = CorpusStats()
+    failed = []
+    cache = None
+    if cache_dir is not None:
+        cache = AnalysisCache(cache_dir, max_bytes=cache_bytes)
+    for file_name in files:
+        try:
+            analysis = Analyze.analyze_midi(file_name, cache=cache)
+        except Exception as e:
+            failed.append((file_name, repr(e)))
+            continue
+        stats.add(analysis)
+        row = _file_row(file_name, analysis, root)
+        stats.seconds += row[3]
+        rows.append(row)
+    return rows, stats, failed
+
+
+def find_midi_files(folder: str) -> list[str]:
+    """returns every .mid file in a folder (and its sub-folders), sorted"""
+    found = []
+    for root, _, files in os.walk(folder):
+        found.extend(join(root, f) for f in files if f.lower().endswith(".mid"))
+    return sorted(found)
+
+
+def analyze_corpus(
+    folder: str = None,
+    workers: int = None,
+    chunk: int = 64,
+    cache_dir: str = None,
+    cache_bytes: int = MAX_BYTES,
+) -> dict:
+    """
+    analyzes every MIDI file in a folder (MIDI_FOLDER by default) across
+    a process pool. files are handed out in chunks of a given size.
+
+    if cache_dir is supplied, results are cached there (up to cache_bytes).
+
+    returns a summary dict with the merged stats, per-file rows (sorted by
+    path relative to folder), failures, and throughput.
+    """
+    if folder is None:
+        folder = MIDI_FOLDER
+    files = find_midi_files(folder)
+    if not files:
+        raise ValueError(f"no MIDI files found in {folder}")
+    chunks = [files[i : i + chunk] for i in range(0, len(files), chunk)]
+
+    rows = []
+    stats = CorpusStats()
+    failed = []
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tasks = [
+            pool.submit(analyze_files, c, cache_dir, cache_bytes, folder)
+            for c in chunks
+        ]
+        with tqdm(total=len(files), desc="progress") as progress:
+            for task in as_completed(tasks):
+                chunk_rows, chunk_stats, chunk_failed = task.result()
+                rows.extend(chunk_rows)
+                stats.merge(chunk_stats)
+                failed.extend(chunk_failed)
+                progress.update(len(chunk_rows) + len(chunk_failed))
+    elapsed = perf_counter() - start
+
+    rows.sort(key=lambda row: row[0])
+    return {
+        "folder": folder,
+        "total": len(files),
+        "stats": stats,
+        "rows": rows,
+        "failed": failed,
+        "seconds": elapsed,
+        "files_per_sec": len(files) / elapsed,
+        "notes_per_sec": stats.notes / elapsed,
+    }
+
+
+def write_results(rows: list, file_name: str) -> None:
+    """
+    writes per-file rows to a columnar .npz file (one array per column),
+    or a .csv file, depending on the file name's extension
+    """
+    if file_name.endswith(".npz"):
+        columns = list(zip(*rows)) if rows else [[] for _ in COLUMNS]
+        arrays = {name: np.array(col) for name, col in zip(COLUMNS, columns)}
+        np.savez_compressed(file_name, **arrays)
+    elif file_name.endswith(".csv"):
+        with open(file_name, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(COLUMNS)
+            writer.writerows(rows)
+    else:
+        raise ValueError("output file must be a .npz or .csv file!")
+
+
+def display_summary(summary: dict) -> None:
+    stats = summary["stats"]
+    output = (
+        f"\nfolder: {summary['folder']}"
+        f"\nanalyzed: {stats.files} / {summary['total']}"
+        f"\nfailed: {len(summary['failed'])}"
+        f"\ntotal notes: {stats.notes}"
+        f"\nmean velocity: {stats.mean_velocity():.1f}"
+        f"\npitch classes: {stats.to_dict()['pitch_classes']}"
+        f"\ntime: {summary['seconds']:.2f} sec"
+        f"\nfiles/sec: {summary['files_per_sec']:.2f}"
+        f"\nnotes/sec: {summary['notes_per_sec']:.1f}"
+    )
+    print(output)
+    for file_name, error in summary["failed"]:
+        print(f"  {file_name}: {error}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--dir", type=str, help="(string) folder of MIDI files (default: midi)"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="(int) worker processes (default: cpu count)"
+    )
+    parser.add_argument(
+        "--chunk", type=int, default=64, help="(int) files per worker task"
+    )
+    parser.add_argument(
+        "--out", type=str, help="(string) .npz or .csv file for per-file results"
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        nargs="?",
+        const=ANALYSIS_CACHE,
+        help="(string) cache analysis results (optionally in a given folder)",
+    )
+    parser.add_argument(
+        "--cache-mb", type=int, default=512, help="(int) cache size limit in MB"
+    )
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    summary = analyze_corpus(
+        folder=args.dir,
+        workers=args.workers,
+        chunk=args.chunk,
+        cache_dir=args.cache,
+        cache_bytes=args.cache_mb * 1024 * 1024,
+    )
+    display_summary(summary)
+    if args.out is not None:
+        write_results(summary["rows"], args.out)
+        print(f"\nsaved results to {args.out}")
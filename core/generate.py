@@ -1,17 +1,27 @@
 """
 This module handles all generative methods.
+
+NOTE: heavier dependencies (names, and the MIDI libraries behind export_midi)
+      are imported the first time they're used rather than at import time,
+      since short scripts often only need a handful of these methods.
 """
 
-import urllib.request
 from math import floor
-from names import get_full_name
 from datetime import datetime as date
-from random import seed, randint, sample, choice
-
-from utils.mapping import map_data
-from utils.txtfile import gen_info_doc
-from utils.midi import export_midi
-from utils.tools import to_str, oct_equiv, scale_to_tempo, scale_limit
+from random import Random
+from typing import Iterable, Iterator
+
+from utils.mapping import map_data, map_data_array
+from utils.words import get_words
+from utils.tools import (
+    chunks,
+    is_array,
+    to_str,
+    oct_equiv,
+    scale_to_tempo,
+    scale_limit,
+    scale_limit_bound,
+)
 
 from core.constants import (
     NOTES,
@@ -26,12 +36,11 @@ from core.constants import (
     ARPEGGIOS,
     SETS,
     INTERVALS,
-    RANGE,
 )
 from core.modify import Modify
-from core.analyze import Analyze
+from core.ranges import notes_in_range, sample_in_range
+from core.sources import LOW_OCTAVE, get_root, root_source_scale
 
-from containers.bar import Bar
 from containers.chord import Chord
 from containers.melody import Melody
 from containers.composition import Composition
@@ -40,43 +49,56 @@ from containers.composition import Composition
 class Generate:
     """
     This class handles all generative functions.
+
+    Every random choice is drawn from this object's own random.Random()
+    instance (self.rng) rather than the global random state, so independent
+    Generate() objects can produce reproducible streams side by side.
+    Supply a seed, or an existing Random() instance, to reproduce a run.
+    A numpy Generator (self.np_rng) is also available for bulk methods.
+
+    NOTE: new_composer() still uses the names library, which only draws
+          from the global random state.
     """
 
-    def __init__(self):
-        seed()
+    def __init__(self, seed: int = None, rng: Random = None, np_rng=None):
+        self.rng = rng if rng is not None else Random(seed)
+        self._np_rng = np_rng
         self.mod = Modify()  # modifier class
 
+    @property
+    def np_rng(self):
+        """
+        numpy random Generator. unless one was supplied, it's created on first
+        use and seeded from self.rng, so it's reproducible along with it.
+        """
+        if self._np_rng is None:
+            import numpy as np
+
+            self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        return self._np_rng
+
     ### TITLE ###
 
-    @staticmethod
-    def new_title() -> str:
-        """
-        Generate a composition title from 1-4 random words.
-
-            Random word generation technique from:
-            https://stackoverflow.com/questions/18834636/random-word-generator-python
-        """
-        try:
-            url = "https://www.mit.edu/~ecprice/wordlist.10000"  # get word list
-            response = urllib.request.urlopen(url)
-            text = response.read().decode()  # decode data to text string
-            words = text.splitlines()  # separate words into list
-            t = 0
-            total = randint(1, 3)  # pick 1 to 3 random words
-            name = choice(words)
-            while t < total:
-                name = name + " " + choice(words)
-                t += 1
-        except urllib.error.URLError as e:
-            print(f"unable to retrieve word list: {e}")
-            name = "untitled - "
-        except Exception as e:
-            print(f"exception occurred trying to retrieve word list: {e}")
-            name = "untitled - "
+    def new_title(self) -> str:
+        """
+        Generate a composition title from 2-4 random words.
+
+            Words come from a local word list (see utils.words), which is
+            loaded once and kept in memory, so this works offline.
+        """
+        words = get_words()
+        t = 0
+        total = self.rng.randint(1, 3)  # pick 1 to 3 random words
+        name = self.rng.choice(words)
+        while t < total:
+            name = name + " " + self.rng.choice(words)
+            t += 1
         return name
 
     @staticmethod
     def new_composer() -> str:
+        from names import get_full_name
+
         return get_full_name()
 
     def init_comp(
@@ -114,47 +136,42 @@ class Generate:
 
     ### TEMPO ###
 
-    @staticmethod
-    def new_tempo() -> float:
+    def new_tempo(self) -> float:
         """
         Picks tempo between 40-208bpm.
         """
-        return choice(TEMPOS)
+        return self.rng.choice(TEMPOS)
 
     ### INSTRUMENTS ###
 
-    @staticmethod
-    def new_instrument() -> str:
+    def new_instrument(self) -> str:
         """
         Randomly picks a melodic/harmonic instrument from a given list. Returns a string.
         Does NOT pick a percussion instrument!
         """
-        return INSTRUMENTS[randint(0, 110)]
+        return INSTRUMENTS[self.rng.randint(0, 110)]
 
-    @staticmethod
-    def new_instruments(total: int) -> list[str]:
+    def new_instruments(self, total: int) -> list[str]:
         """
         Generates a list of instruments of n length, where n is supplied from elsewhere.
         Returns a list.
         """
-        return [INSTRUMENTS[randint(0, 110)] for inst in range(total)]
+        return [INSTRUMENTS[self.rng.randint(0, 110)] for inst in range(total)]
 
     ### PITCH ###
 
-    @staticmethod
-    def rand_note() -> str:
+    def rand_note(self) -> str:
         """
         Picks a note at random between octaves 1 and 7.
         Returns a string representing the note, such as "C#2"
         """
-        return f"{choice(PITCH_CLASSES)}{randint(1, 7)}"
+        return f"{self.rng.choice(PITCH_CLASSES)}{self.rng.randint(1, 7)}"
 
-    @staticmethod
-    def choose_note(scale: list[str]) -> str:
+    def choose_note(self, scale: list[str]) -> str:
         """
         Picks a note at random from a given list of notes
         """
-        return choice(scale)
+        return self.rng.choice(scale)
 
     def new_notes(
         self, data=None, root: list = None, total: int = None
@@ -168,7 +185,8 @@ class Generate:
 
         Data that can be used:
             A supplied data list (list[int]) of n length functions as *index numbers*
-            against a generated "source scale" to select melody notes.
+            against a generated "source scale" to select melody notes. An index
+            array (see utils.mapping.map_data_array()) can be used as well.
 
         User also has the option to supply a "root" scale, though only if the program
         is accessing this method directly! new_melody() and other methods that call this
@@ -181,14 +199,14 @@ class Generate:
         """
 
         meta_data = []  # save forte numbers and/or pitch class sets
-        octave = randint(2, 3)  # initial starting octave
+        octave = self.rng.randint(2, 3)  # initial starting octave
         if root is None:
             root, info = self.pick_root(transpose=True, octave=None)
             meta_data.append(info)
         if data is None:
             if total is None:
                 # Pick total: 10 - 50 if we're generating random notes
-                gen_total = randint(9, 49)
+                gen_total = self.rng.randint(9, 49)
             else:
                 gen_total = total
         # Or the largest value of the supplied data set. This will give
@@ -198,25 +216,23 @@ class Generate:
         # source scale, so we can map the inputted 100 to the note in the
         # source scale by treating the data value as an index number.
         else:
-            gen_total = max(data) + 1
+            gen_total = int(data.max() if is_array(data) else max(data)) + 1
 
         # Generate source scale
         # NOTE: This only uses a supplied root scale once!
         # After we reach the final octave this will pick another
         # scale to build off of. May need to parameterize this behavior.
-        n = 0
         scale = []
-        for _ in range(gen_total):
-            note = f"{root[n]}{octave}"
-            scale.append(note)
-            n += 1
-            if n == len(root):
-                octave += 1
-                if octave > 5:
-                    octave = randint(2, 3)
-                    root, info = self.pick_root(transpose=True, octave=None)
-                    meta_data.append(info)
-                n = 0
+        while len(scale) < gen_total:
+            # the rest of the (cached) source scale, from the current octave up
+            source = root_source_scale(root).notes
+            start = (octave - LOW_OCTAVE) * len(root)
+            needed = gen_total - len(scale)
+            scale.extend(source[start : start + needed])
+            if needed >= len(source) - start:
+                octave = self.rng.randint(2, 3)
+                root, info = self.pick_root(transpose=True, octave=None)
+                meta_data.append(info)
 
         # Randomly pick notes from the generated source
         # scale to create an arrhythmic melody.
@@ -226,10 +242,10 @@ class Generate:
             # however many notes are in the source scale if no
             # total value is provided.
             if total is None:
-                pick_total = randint(3, len(scale))
+                pick_total = self.rng.randint(3, len(scale))
             else:
                 pick_total = total
-            notes = [choice(scale) for _ in range(pick_total)]
+            notes = [self.rng.choice(scale) for _ in range(pick_total)]
         # ...Or pick notes according to integers in data array
         else:
             # Map notes to the inputed data to generate a melody.
@@ -237,18 +253,17 @@ class Generate:
             # number of elements in the data set. Any supplied
             # t value doesn't matter here since we're going of len(data)
             # for our total because reasons.
-            data_len = len(data)
-            for i in range(data_len):
-                notes.append(scale[data[i]])
+            if is_array(data):
+                data = data.tolist()
+            notes = [scale[i] for i in data]
 
         return notes, meta_data, scale
 
-    @staticmethod
-    def choose_notes(source_notes: list, total: int) -> list:
+    def choose_notes(self, source_notes: list, total: int) -> list:
         """
         Choose a set (size total) of notes at random from a given set of notes.
         """
-        return [choice(source_notes) for _ in range(total)]
+        return [self.rng.choice(source_notes) for _ in range(total)]
 
     def pick_root(self, transpose: bool = True, octave: int = None) -> tuple[list, str]:
         """
@@ -264,7 +279,7 @@ class Generate:
             info (str) about the chosen scale.
         """
         # use scale? (1), pcs prime form (2), or invented scale(3)?
-        choice = randint(1, 3)
+        choice = self.rng.randint(1, 3)
         if choice == 1:
             if transpose:
                 mode, pcs, scale = self.pick_scale(transpose=True)
@@ -286,7 +301,8 @@ class Generate:
             else:
                 scale, pcs = self.new_scale(transpose=False)
                 info = f"invented scale: {scale} pcs: {pcs}"
-        scale = to_str(pcs=pcs, octave=octave)
+        # pcs are already transposed, so only the octave needs to be added
+        scale = list(get_root(pcs, 0, octave))
         return scale, info
 
     def pick_scale(
@@ -298,18 +314,15 @@ class Generate:
 
         Returns a tuple:
             the scale name (str),
-            un-transposed scale pcs (list[int]),
+            transposed scale pcs (list[int]),
             note list (list[str]) *without assigned octave by default.*
 
         Supply a value for o if a specified octave is needed.
         """
-        scale = choice(list(SCALES.keys()))
-        pcs = SCALES[scale]
-        if transpose:
-            pcs_t = self.mod.transpose(pcs, randint(1, 11), oct_eq=False)
-            notes = to_str(pcs_t, octave=octave)
-        else:
-            notes = to_str(pcs, octave=octave)
+        scale = self.rng.choice(list(SCALES.keys()))
+        dist = self.rng.randint(1, 11) if transpose else 0
+        pcs = [(pc + dist) % 12 for pc in SCALES[scale]]
+        notes = list(get_root(pcs, 0, octave))
         return scale, pcs, notes
 
     def pick_set(
@@ -320,18 +333,15 @@ class Generate:
 
         Returns a tuple:
             forte number/fn (str),
-            un-transposed prime form pcs (list[int]),
+            transposed prime form pcs (list[int]),
             note list (list[str]) *without an assigned octave* by default.
 
         Supply a value for o if a specified octave is needed.
         """
-        forte_number = choice(list(SETS.keys()))
-        pcs = SETS[forte_number]
-        if transpose:
-            pcs_t = self.mod.transpose(pcs, randint(1, 11), oct_eq=False)
-            scale = to_str(pcs_t, octave=octave)
-        else:
-            scale = to_str(pcs, octave=octave)
+        forte_number = self.rng.choice(list(SETS.keys()))
+        dist = self.rng.randint(1, 11) if transpose else 0
+        pcs = [(pc + dist) % 12 for pc in SETS[forte_number]]
+        scale = list(get_root(pcs, 0, octave))
         return forte_number, pcs, scale
 
     def new_scale(
@@ -348,20 +358,20 @@ class Generate:
         Returns a tuple: notes (list[str]) and the original pitch class set, (list[int]).
         """
         pcs = []
-        total = randint(5, 8)
+        total = self.rng.randint(5, 8)
         """
         Current approach. Outputs are quite interesting, though I think this
         is the least efficient way to go about this...
         """
         while len(pcs) < total:
-            n = randint(0, 11)
+            n = self.rng.randint(0, 11)
             if n not in pcs:
                 pcs.append(n)
         # pcs = [randint(0,11) for x in range(total) if x not in pcs]
         pcs.sort()
-        if transpose:
-            pcs = self.mod.transpose(pcs, randint(1, 11), oct_eq=False)
-        scale = to_str(pcs, octave)
+        dist = self.rng.randint(1, 11) if transpose else 0
+        scale = list(get_root(pcs, dist, octave))
+        pcs = [(pc + dist) % 12 for pc in pcs]
         return scale, pcs
 
     @staticmethod
@@ -376,18 +386,8 @@ class Generate:
 
         Returns a list[str] with appended octaves (2-6)
         """
-        n = 0
-        o = 2
-        scale = []
-        for _ in range(28):
-            scale.append(f"{root[n]}{o}")
-            n += 1
-            if n == len(root):
-                o += 1
-                if o == 6:
-                    o = 2
-                n = 0
-        return scale
+        span = root_source_scale(root).notes
+        return list((span * (28 // len(span) + 1))[:28])
 
     def new_source_scales(self, total: bool = None) -> tuple[dict, list]:
         """
@@ -398,7 +398,7 @@ class Generate:
             scale_info (list[str])
         """
         if total is None:
-            total = randint(3, 8)  # pick 3-8 scales if no total is provided
+            total = self.rng.randint(3, 8)  # pick 3-8 scales if no total is provided
 
         sources = {}
         scale_info = []
@@ -409,8 +409,7 @@ class Generate:
 
         return sources, scale_info
 
-    @staticmethod
-    def derive_scales(pcs: list, octave: int = None) -> dict:
+    def derive_scales(self, pcs: list, octave: int = None) -> dict:
         """
         Generate derivative scales based on each note in a given scale.
         Requires a pitch class set (pcs) list[int] who's values are
@@ -434,7 +433,7 @@ class Generate:
             scale_variant = []
             note = pcs[i]
             while len(scale_variant) < pcs_len:
-                note += randint(1, 3)
+                note += self.rng.randint(1, 3)
                 scale_variant.append(note)
             variants[i] = scale_variant
 
@@ -457,21 +456,21 @@ class Generate:
                 f"available parameters: {list(ARPEGGIOS.keys())}"
             )
 
-    @staticmethod
-    def new_12tone_row() -> list[str]:
+    def new_12tone_row(self) -> list[str]:
         """
         Generates a 12-tone row. Returns a note list[str].
         Notes don't have an assigned octave.
         """
-        return sample(PITCH_CLASSES, len(PITCH_CLASSES))
+        return self.rng.sample(PITCH_CLASSES, len(PITCH_CLASSES))
 
-    @staticmethod
-    def new_12tone_intervals() -> list:
+    def new_12tone_intervals(self) -> list:
         """
         Returns a list of 11 non-repeating intervals to generate 12-tone row
         transpositions.
         """
-        return sample(INTERVALS["Chromatic Scale"], len(INTERVALS["Chromatic Scale"]))
+        return self.rng.sample(
+            INTERVALS["Chromatic Scale"], len(INTERVALS["Chromatic Scale"])
+        )
 
     @staticmethod
     def new_palindrome(melody) -> Melody:
@@ -500,12 +499,11 @@ class Generate:
 
     ### RHYTHM ###
 
-    @staticmethod
-    def new_rhythm() -> float:
+    def new_rhythm(self) -> float:
         """
         Generates a single new rhythm. Not scaled to tempo!
         """
-        return choice(RHYTHMS)
+        return self.rng.choice(RHYTHMS)
 
     def new_rhythms(
         self, total: int = None, tempo: float = None, source_rhythms: list = None
@@ -528,7 +526,7 @@ class Generate:
         """
         rhythms = []
         if total is None:
-            total = randint(3, 30)
+            total = self.rng.randint(3, 30)
         if source_rhythms:
             _rhythms = source_rhythms
         else:
@@ -536,10 +534,10 @@ class Generate:
 
         # generate rhythms
         while len(rhythms) < total:
-            rhythm = choice(_rhythms)  # Pick rhythm and add to list
-            if randint(1, 2) == 1:  # Repeat this rhythm or not?
+            rhythm = self.rng.choice(_rhythms)  # Pick rhythm and add to list
+            if self.rng.randint(1, 2) == 1:  # Repeat this rhythm or not?
                 limit = self._rep_limit(total)
-                total_reps = randint(1, limit)
+                total_reps = self.rng.randint(1, limit)
                 for _ in range(total_reps):
                     rhythms.append(rhythm)
                     if len(rhythms) == total:
@@ -553,44 +551,96 @@ class Generate:
 
         return rhythms
 
-    @staticmethod
-    def _rep_limit(total: int):
-        limit = scale_limit(total)  # TODO: revisit this
+    def _rep_limit(self, total: int):
+        limit = scale_limit(total, self.rng)  # TODO: revisit this
         if limit == 0:
             limit += 2
         return limit
 
+    def _bulk_runs(self, picks, repeats, total: int):
+        """
+        Builds a sequence of total values in bulk, the same way the rhythm and
+        dynamics loops build theirs one at a time: take a value, then either
+        keep it once or repeat it a number of times.
+
+        picks holds one value per run, and repeats the number of times each
+        one is repeated if it's chosen to repeat. Every run is at least one
+        value long, so total runs is always enough to fill the sequence.
+        """
+        import numpy as np
+
+        repeat = self.np_rng.integers(1, 3, size=total) == 1  # repeat or not?
+        lengths = np.where(repeat, repeats, 1)
+        # only keep the runs needed to reach the total, then trim the last one
+        runs = int(np.searchsorted(np.cumsum(lengths), total)) + 1
+        return np.repeat(picks[:runs], lengths[:runs])[:total]
+
+    def _bulk_reps(self, total: int):
+        """
+        Draws total repetition counts, each bounded by its own limit from
+        scale_limit() (via scale_limit_bound()), matching _rep_limit().
+        """
+        import numpy as np
+
+        bound = scale_limit_bound(total)
+        if bound == 0:
+            limits = np.full(total, 2)
+        else:
+            limits = self.np_rng.integers(1, bound + 1, size=total)
+        return self.np_rng.integers(1, limits + 1)
+
+    def new_rhythms_array(
+        self, total: int = None, tempo: float = None, source_rhythms: list = None
+    ):
+        """
+        Bulk version of new_rhythms(). Draws every rhythm and repetition
+        at once with numpy instead of one at a time, which is much faster
+        for long pieces.
+
+        Returns a numpy float array, scaled to the given tempo if provided.
+        """
+        import numpy as np
+
+        if total is None:
+            total = self.rng.randint(3, 30)
+        if total == 0:
+            return np.zeros(0, dtype=float)  # like new_rhythms(0)
+        source = RHYTHMS if source_rhythms is None else source_rhythms
+        picks = self.np_rng.choice(source, size=total)
+        rhythms = self._bulk_runs(picks, self._bulk_reps(total), total)
+        if tempo is not None and tempo != 60.0:
+            rhythms = scale_to_tempo(tempo, rhythms)
+        return rhythms
+
     ### DYNAMICS ###
 
-    @staticmethod
-    def new_dynamic(rests: bool = True) -> int:
+    def new_dynamic(self, rests: bool = True) -> int:
         """
         Generates a single dynamic/velocity between 20 - 124
         OR a single rest!
         """
         if rests:
-            return choice(DYNAMICS) if randint(0, 1) == 1 else REST
+            return self.rng.choice(DYNAMICS) if self.rng.randint(0, 1) == 1 else REST
         else:
-            return choice(DYNAMICS)
+            return self.rng.choice(DYNAMICS)
 
-    @staticmethod
-    def _new_dynamics_with_silences(total_dynamics: int, dynamics: list):
+    def _new_dynamics_with_silences(self, total_dynamics: int, dynamics: list):
         """
         Creates a list of dynamic/velocities with optional silences.
         Will also randomly repeat a dynamic n times.
         """
         while len(dynamics) < total_dynamics:
-            if randint(0, 1) == 1:  # Pick dynamic OR a rest
-                dynamic = choice(DYNAMICS)
-                if randint(1, 2) == 1:  # repeat?
+            if self.rng.randint(0, 1) == 1:  # Pick dynamic OR a rest
+                dynamic = self.rng.choice(DYNAMICS)
+                if self.rng.randint(1, 2) == 1:  # repeat?
                     # scale total reps with regards to the total number of dynamic/velocities we have
                     # we want to avoid repeating the dynamic/velocities *too* many times, so we try to
                     # repeat something with a "sane" number of repetiions -- i.e., doesn't dominate the
                     # entire set of dyanmics.
-                    rep_limit = scale_limit(total_dynamics)
+                    rep_limit = scale_limit(total_dynamics, self.rng)
                     if rep_limit == 0:
                         rep_limit += 2
-                    total_reps = randint(1, rep_limit)
+                    total_reps = self.rng.randint(1, rep_limit)
                     for _ in range(total_reps):
                         dynamics.append(dynamic)
                         if len(dynamics) == total_dynamics:
@@ -599,8 +649,9 @@ class Generate:
                     dynamics.append(dynamic)
             else:
                 dynamic = REST
-                if randint(1, 2) == 1:  # repeat?
-                    total_reps = randint(1, 2)  # only repeat rests 1-2 times for now...
+                if self.rng.randint(1, 2) == 1:  # repeat?
+                    # only repeat rests 1-2 times for now...
+                    total_reps = self.rng.randint(1, 2)
                     for _ in range(total_reps):
                         dynamics.append(dynamic)
                         if len(dynamics) == total_dynamics:
@@ -610,22 +661,21 @@ class Generate:
 
         return dynamics
 
-    @staticmethod
-    def _new_dynamics(total_dynamics: int, dynamics: list) -> list:
+    def _new_dynamics(self, total_dynamics: int, dynamics: list) -> list:
         """
         Generates a list of dynamics without silences(rests)
         """
         while len(dynamics) < total_dynamics:
-            dynamic = choice(DYNAMICS)
-            if randint(1, 2) == 1:  # repeat?
+            dynamic = self.rng.choice(DYNAMICS)
+            if self.rng.randint(1, 2) == 1:  # repeat?
                 # scale total reps with regards to the total number of dynamic/velocities we have
                 # we want to avoid repeating the dynamic/velocities *too* many times, so we try to
                 # repeat something with a "sane" number of repetiions -- i.e., doesn't dominate the
                 # entire set of dyanmics.
-                rep_limit = scale_limit(total_dynamics)
+                rep_limit = scale_limit(total_dynamics, self.rng)
                 if rep_limit == 0:
                     rep_limit += 2
-                total_reps = randint(1, rep_limit)
+                total_reps = self.rng.randint(1, rep_limit)
                 for _ in range(total_reps):
                     dynamics.append(dynamic)
                     if len(dynamics) == total_dynamics:
@@ -650,12 +700,37 @@ class Generate:
               be hard-coded.
         """
         if total is None:
-            total = randint(3, 30)
+            total = self.rng.randint(3, 30)
         if rests:
             return self._new_dynamics_with_silences(total, [])
         else:
             return self._new_dynamics(total, [])
 
+    def new_dynamics_array(self, total: int = None, rests: bool = True):
+        """
+        Bulk version of new_dynamics(). Draws every dynamic and repetition
+        at once with numpy instead of one at a time.
+
+        Rests are picked half the time (when rests=True) and only
+        repeat 1-2 times, like in _new_dynamics_with_silences().
+
+        Returns a numpy int array.
+        """
+        import numpy as np
+
+        if total is None:
+            total = self.rng.randint(3, 30)
+        if total == 0:
+            return np.zeros(0, dtype=int)  # like new_dynamics(0)
+        picks = self.np_rng.choice(DYNAMICS, size=total)
+        reps = self._bulk_reps(total)
+        if rests:
+            # pick a dynamic or a rest for each run. rests only repeat 1-2 times
+            is_rest = self.np_rng.integers(0, 2, size=total) == 0
+            picks = np.where(is_rest, REST, picks)
+            reps = np.where(is_rest, self.np_rng.integers(1, 3, size=total), reps)
+        return self._bulk_runs(picks, reps, total)
+
     ### CHORDS ###
 
     @staticmethod
@@ -706,22 +781,22 @@ class Generate:
             new_chord.tempo = tempo
         if scale is None:
             # pick an existing scale/set or make a new one?
-            if randint(1, 2) == 1:
+            if self.rng.randint(1, 2) == 1:
                 new_chord.source_notes, new_chord.info = self.pick_root(
-                    octave=randint(2, 5)
+                    octave=self.rng.randint(2, 5)
                 )
                 new_chord.pcs = "None"
             else:
                 new_chord.source_notes, new_chord.pcs = self.new_scale(
-                    octave=randint(2, 5)
+                    octave=self.rng.randint(2, 5)
                 )
                 new_chord.info = "Invented Scale"
         else:
             new_chord.source_notes = scale
 
         # pick notes
-        total = randint(2, 9)
-        new_chord.notes = [choice(scale) for _ in range(total)]
+        total = self.rng.randint(2, 9)
+        new_chord.notes = [self.rng.choice(scale) for _ in range(total)]
 
         # only add randomized rhythm and dynamics if specified.
         # chords can just be a set of notes and the other parameters can be
@@ -752,7 +827,7 @@ class Generate:
         """
         chords = []
         if total is None:
-            total = randint(5, 11)
+            total = self.rng.randint(5, 11)
         if tempo is None:
             tempo = self.new_tempo()
         if scale is None:
@@ -844,7 +919,7 @@ class Generate:
         raw_data=None,
         data_type: int = None,
         total: int = None,
-        inst_range: bool = None,
+        inst_range=None,
         rests: bool = True,
     ) -> Melody:
         """
@@ -858,6 +933,9 @@ class Generate:
 
         If no data is supplied, then it will generate a melody anyway.
 
+        inst_range can be an instrument name (a key in RANGE) or a list
+        of notes. Any notes outside of it are removed.
+
         Returns a melody() object
 
         NOTE: Instrument is *NOT* picked! Needs to be supplied externally.
@@ -880,24 +958,24 @@ class Generate:
         # Pick notes from scratch
         if raw_data is None:
             if total is None:
-                (melody.notes, melody.info, melody.source_notes) = self.new_notes()
+                melody.notes, melody.info, melody.source_notes = self.new_notes()
             else:
-                (melody.notes, melody.info, melody.source_notes) = self.new_notes(
+                melody.notes, melody.info, melody.source_notes = self.new_notes(
                     total=total
                 )
         # Or use supplied data. Supplied total isn't applicable with
         # a data set of n size, since n will just become the total we work with.
         else:
-            (melody.notes, melody.info, melody.source_notes) = self.new_notes(
+            melody.notes, melody.info, melody.source_notes = self.new_notes(
                 data=processed_data
             )
 
         # remove any notes not within a supplied range (if available)
-        if inst_range is not None:
-            melody_len = len(melody.notes)
-            for note in range(melody_len):
-                if melody.notes[note] not in inst_range:
-                    melody.notes.remove(melody.notes[note])
+        if isinstance(inst_range, str):
+            melody.notes = notes_in_range(melody.notes, inst_range)
+        elif inst_range is not None:
+            inst_range = set(inst_range)
+            melody.notes = [note for note in melody.notes if note in inst_range]
 
         # add rhythms and dynamics
         melody.rhythms = self.new_rhythms(len(melody.notes), melody.tempo)
@@ -905,6 +983,63 @@ class Generate:
 
         return melody
 
+    def new_melody_stream(
+        self,
+        data: Iterable,
+        data_type: str,
+        chunk: int = 64,
+        tempo: float = None,
+        instrument: str = None,
+        inst_range=None,
+        rests: bool = True,
+    ) -> Iterator[Melody]:
+        """
+        Streaming version of new_melody() for data that's too large (or too
+        long-lived) to hold in memory, i.e. a log file, a CSV column, or a
+        live sensor feed.
+
+        Reads data (any iterable, or a numpy array) chunk values at a time,
+        maps each chunk with utils.mapping, and yields a Melody() for it.
+        Each melody only uses its own chunk to size its source scale, so
+        memory use is bounded by the chunk size rather than the data.
+
+        Every melody shares the same tempo (picked once if none is supplied),
+        so they can be written one after another as a single track with
+        utils.midi.export_melody_stream().
+
+        data_type is one of the types supported by map_data():
+        "int", "float", "chars", or "hex".
+
+        instrument is set on every melody. if none is supplied, one is
+        picked once for the whole stream.
+        """
+        if tempo is None:
+            tempo = self.new_tempo()
+        if instrument is None:
+            instrument = self.new_instrument()
+        if inst_range is not None and not isinstance(inst_range, str):
+            inst_range = set(inst_range)
+        for values in chunks(data, chunk):
+            indices = map_data_array(values, data_type)
+            if len(indices) == 0:
+                continue
+            melody = Melody()
+            melody.tempo = tempo
+            melody.instrument = instrument
+            melody.source_data = values
+            melody.notes, melody.info, melody.source_notes = self.new_notes(
+                data=indices
+            )
+            if isinstance(inst_range, str):
+                melody.notes = notes_in_range(melody.notes, inst_range)
+            elif inst_range is not None:
+                melody.notes = [note for note in melody.notes if note in inst_range]
+            if not melody.notes:
+                continue
+            melody.rhythms = self.new_rhythms(len(melody.notes), tempo)
+            melody.dynamics = self.new_dynamics(len(melody.notes), rests)
+            yield melody
+
     def write_string_line(
         self, part: Melody, scale: list, total: int, asyn: bool = False
     ) -> Melody:
@@ -920,30 +1055,22 @@ class Generate:
         """
         if asyn:
             # NOTE: this will redefine supplied total if asyn is True
-            total = randint(12, 30)
+            total = self.rng.randint(12, 30)
+
+        # limited to octaves 4 and 5 for violins
+        if part.instrument == "Violin":
+            source = scale[13:]
+        # limit to octaves 3 and 4 for viola
+        elif part.instrument == "Viola":
+            source = scale[7:-7]
+        # limit to octaves 2 and 3 for cello
+        elif part.instrument == "Cello":
+            source = scale[:-15]
+        else:
+            source = None
 
-        for _ in range(total):
-            # limited to octaves 4 and 5 for violins
-            if part.instrument == "Violin":
-                note = scale[randint(13, len(scale) - 1)]
-                # trying to account for random notes chosen out of range...
-                while note not in RANGE["Violin"]:
-                    note = scale[randint(13, len(scale) - 1)]
-                part.notes.append(note)
-
-            # limit to octaves 3 and 4 for viola
-            elif part.instrument == "Viola":
-                note = scale[randint(7, len(scale) - 8)]
-                while note not in RANGE["Viola"]:
-                    note = scale[randint(7, len(scale) - 8)]
-                part.notes.append(note)
-
-            # limit to octaves 2 and 3 for cello
-            elif part.instrument == "Cello":
-                note = scale[randint(0, len(scale) - 16)]
-                while note not in RANGE["Cello"]:
-                    note = scale[randint(0, len(scale) - 16)]
-                part.notes.append(note)
+        if source is not None:
+            part.notes.extend(sample_in_range(source, part.instrument, total, self.rng))
 
         if asyn:
             # add independent rhythms and dynamics of n length
@@ -990,12 +1117,12 @@ class Generate:
         # Total is between half the number of notes
         # in the melody and total num of notes.
         chords = self.new_chords(
-            total=randint(floor(len(melody.notes) / 2), len(melody.notes)),
+            total=self.rng.randint(floor(len(melody.notes) / 2), len(melody.notes)),
             tempo=comp.tempo,
             scale=melody.notes,
         )
         # Pick keyboard instrument and apply to all chord objects
-        instr = INSTRUMENTS[randint(0, 8)]
+        instr = INSTRUMENTS[self.rng.randint(0, 8)]
         for i in range(len(chords)):
             chords[i].instrument = instr
 
@@ -1003,6 +1130,8 @@ class Generate:
         comp.add_part(chords, instr)
 
         # Add title and write out MIDI
+        from utils.midi import export_midi
+
         comp.title = f"{comp.title} for mixed duet"
         export_midi(comp)
 
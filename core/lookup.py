@@ -0,0 +1,114 @@
+"""
+Precomputed lookup tables for translating between note name strings,
+NOTES indices, pitch class integers, and MIDI note numbers.
+
+Everything here is built once at import time from NOTES and PITCH_CLASSES,
+so each lookup is a single dict or array access instead of a linear
+NOTES.index() scan.
+"""
+
+from __future__ import annotations
+
+from array import array
+from core.constants import NOTES, PITCH_CLASSES
+
+# MIDI number of NOTES[0] ("A0"). NOTES indices + MIDI_OFFSET == MIDI numbers.
+MIDI_OFFSET = 21
+
+# semi-tone offsets of each natural note from C
+_LETTERS = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+# semi-tone adjustment for each accidental we accept
+_ACCIDENTALS = {"": 0, "#": 1, "b": -1}
+
+
+def _spellings() -> dict:
+    """
+    builds every single-accidental spelling of each pitch class, mapped to its
+    signed semi-tone distance from C (i.e. "Cb" == -1, "B#" == 12). the sign
+    matters when adding an octave, since "Cb4" is actually B3.
+    """
+    return {
+        f"{letter}{acc}": _LETTERS[letter] + _ACCIDENTALS[acc]
+        for letter in _LETTERS
+        for acc in _ACCIDENTALS
+    }
+
+
+_SPELLINGS = _spellings()
+
+# pitch class name (with or without enharmonic spelling) -> pitch class int
+PC_INDEX = {name: semitones % 12 for name, semitones in _SPELLINGS.items()}
+# the spellings in PITCH_CLASSES always win
+PC_INDEX.update({pc: i for i, pc in enumerate(PITCH_CLASSES)})
+
+
+def _note_index() -> dict:
+    """
+    maps every spelling of every note in NOTES to its index. the
+    spellings used in NOTES are applied last so they're always present.
+    """
+    note_index = {}
+    for name, semitones in _SPELLINGS.items():
+        for octave in range(0, 9):
+            i = 12 * (octave + 1) + semitones - MIDI_OFFSET
+            if 0 <= i < len(NOTES):
+                note_index[f"{name}{octave}"] = i
+    note_index.update({note: i for i, note in enumerate(NOTES)})
+    return note_index
+
+
+# note name string (i.e "C#4" or "Db4") -> index in NOTES
+NOTE_INDEX = _note_index()
+
+# NOTES index -> pitch class int, and NOTES index -> octave
+INDEX_PCS = array("b", [(i + MIDI_OFFSET) % 12 for i in range(len(NOTES))])
+INDEX_OCTAVES = array("b", [(i + MIDI_OFFSET) // 12 - 1 for i in range(len(NOTES))])
+
+
+def note_to_index(note: str) -> int:
+    """
+    returns the index in NOTES of a given note name string.
+    accepts enharmonic spellings, i.e. "Db4" and "C#4" both return 40.
+    """
+    try:
+        return NOTE_INDEX[note]
+    except KeyError:
+        raise ValueError(f"{note} is not a valid note name!") from None
+
+
+def notes_to_indices(notes: list[str]) -> list[int]:
+    """
+    returns a list of NOTES indices for a list of note name strings.
+    """
+    try:
+        return [NOTE_INDEX[note] for note in notes]
+    except KeyError as e:
+        raise ValueError(f"{e.args[0]} is not a valid note name!") from None
+
+
+def note_to_midi(note: str) -> int:
+    """
+    returns the MIDI note number of a given note name string.
+    """
+    return note_to_index(note) + MIDI_OFFSET
+
+
+def midi_to_note(num: int) -> str:
+    """
+    returns the note name string (as spelled in NOTES) of a given MIDI number.
+    """
+    if num < MIDI_OFFSET or num > MIDI_OFFSET + len(NOTES) - 1:
+        raise ValueError("MIDI number must be between 21 and 108")
+    return NOTES[num - MIDI_OFFSET]
+
+
+def note_to_pc(note: str) -> int:
+    """
+    returns the pitch class integer of a note name string, with or
+    without an assigned octave (i.e. "Eb", "D#", or "Eb4").
+    """
+    pc = PC_INDEX.get(note)
+    if pc is not None:
+        return pc
+    return INDEX_PCS[note_to_index(note)]
@@ -14,11 +14,17 @@ TODO:
 
 from __future__ import annotations
 
-from random import randint, shuffle
+import random
+from typing import TYPE_CHECKING
 
-from utils.tools import to_str, is_pos, oct_equiv, scale_to_tempo
+from utils.tools import is_array, oct_equiv, scale_to_tempo
 from containers.melody import Melody
-from core.constants import NOTES
+from core.lookup import note_to_index, notes_to_indices
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# core.pitch (and numpy) are imported on first use in the methods below
 
 
 class Modify:
@@ -32,12 +38,15 @@ class Modify:
 
     @staticmethod
     def transpose(
-        pcs: list[int], dist: int | list[int], oct_eq: bool = True
-    ) -> list[int]:
+        pcs: list[int] | np.ndarray, dist: int | list[int], oct_eq: bool = True
+    ) -> list[int] | np.ndarray:
         """
         transpose a list of pitch classes (list[int]) using a supplied interval t (int),
         or list of intervals t (list[int]).
 
+        pcs can also be a numpy int array, in which case the transposition is
+        done with core.pitch and a new array is returned.
+
         if oct_eq is set to False, then resulting values may be greater than
         11. This may work when working with a source scale (since it goes
         from octaves 2-5) as long as the resulting value n is n <= len(source)-1.
@@ -48,6 +57,10 @@ class Modify:
 
         returns a modified pcs (list[int]) or modified pitch class (int).
         """
+        if is_array(pcs):
+            from core import pitch
+
+            return pitch.transpose(pcs, dist, oct_eq)
         pcs_len = len(pcs)
         # modify with a single interval across all pitch-class integers
         if type(dist) == int:
@@ -75,8 +88,11 @@ class Modify:
         """
         if dist > 11 or dist < 1:
             raise ValueError("distance must be an int: 1<=n<=11")
-        pcs = self.transpose(self.get_index(notes), dist=dist, oct_eq=False)
-        return to_str(pcs, oct_eq=False)
+        from core import pitch
+
+        return pitch.to_notes(
+            pitch.transpose(pitch.to_indices(notes), dist=dist, oct_eq=False)
+        )
 
     def transpose_chords(self, chords: list, dist: int) -> list:
         """
@@ -84,13 +100,13 @@ class Modify:
         """
         if dist > 11 or dist < 1:
             raise ValueError("distance must be an int: 1<=n<=11")
+        from core import pitch
 
         total_chords = len(chords)
         for c in range(total_chords):
-            pcs = self.transpose(
-                self.get_index(chords[c].notes), dist=dist, oct_eq=False
+            chords[c].notes = pitch.to_notes(
+                pitch.transpose(pitch.to_indices(chords[c].notes), dist, oct_eq=False)
             )
-            chords[c].notes = to_str(pcs, oct_eq=False)
 
         return chords
 
@@ -102,12 +118,8 @@ class Modify:
         difference between index values with NOTES corresponds to distance
         in semi-tones!
         """
-        intervals = []
-        index_list = self.get_index(notes)
-        ind_len = len(index_list)
-        for n in range(1, ind_len):
-            intervals.append(index_list[n] - index_list[n - 1])
-        return intervals
+        ind = self.get_index(notes)
+        return [cur - prev for prev, cur in zip(ind, ind[1:])]
 
     @staticmethod
     def get_index(notes: str | list[str]) -> int | list[int]:
@@ -122,13 +134,9 @@ class Modify:
         back against NOTES to get octave-accurate transposed notes.
         """
         if type(notes) == str:
-            return NOTES.index(notes)
+            return note_to_index(notes)
         elif type(notes) == list:
-            indices = []
-            note_len = len(notes)
-            for n in range(note_len):
-                indices.append(NOTES.index(notes[n]))
-            return indices
+            return notes_to_indices(notes)
         else:
             raise TypeError(
                 "notes must be a single str or list[str]! type is:", type(notes)
@@ -149,26 +157,13 @@ class Modify:
     def invert(self, notes: list[str]) -> list[str | list[str]]:
         """
         inverts a melody. returns a new note list[str]
-        """
 
-        inverted = []  # list of inverted intervals
-        intervals = self.get_intervals(notes)  # get list of intervals and invert values
-        total_intervals = len(intervals)
-        for i in range(total_intervals):
-            if is_pos(intervals[i]):
-                inverted.append(-abs(intervals[i]))
-            else:
-                inverted.append(abs(intervals[i]))
-
-        # get index of first note. we don't need them all.
-        mel = []
-        mel.append(self.get_index(notes))
-
-        # build new melody note list off this inverted interval list
-        for i in range(total_intervals):
-            mel.append(mel[i] + inverted[i])
+        each interval from the first note is mirrored, so
+        an inverted note n becomes first - (n - first).
+        """
+        from core import pitch
 
-        return to_str(mel, oct_eq=False)
+        return pitch.to_notes(pitch.invert(pitch.to_indices(notes)))
 
     def retro_invert(self, m: Melody) -> Melody:
         """
@@ -181,12 +176,17 @@ class Modify:
         return ret
 
     @staticmethod
-    def fragment(orig_melody: Melody) -> Melody:
+    def fragment(orig_melody: Melody, rng: random.Random = None) -> Melody:
         """
         randomly picks a subset of notes, rhythms, and dynamics (all
         from the same position in the melody) from a given melody and
         returns this subset as a melodic fragment in a new melody() object
+
+        supply a random.Random() instance as rng for reproducible fragments,
+        otherwise the global random state is used.
         """
+        if rng is None:
+            rng = random
         # copy other info from supplied melody object
         # to not miss anything important. remove initial
         # notes ect so we can reuse the lists.
@@ -197,10 +197,10 @@ class Modify:
 
         # generate fragment size. any subset will necessarily
         # be at least one element less than the original set.
-        frag_len = randint(3, len(orig_melody.notes) - 2)
+        frag_len = rng.randint(3, len(orig_melody.notes) - 2)
 
         # pick starting index and build fragment from here
-        strt = randint(0, len(orig_melody.notes) - frag_len)
+        strt = rng.randint(0, len(orig_melody.notes) - frag_len)
         for _ in range(frag_len):
             frag.notes.append(orig_melody.notes[strt])
             frag.rhythms.append(orig_melody.rhythms[strt])
@@ -210,18 +210,23 @@ class Modify:
         return frag
 
     @staticmethod
-    def mutate(melody: Melody) -> Melody:
+    def mutate(melody: Melody, rng: random.Random = None) -> Melody:
         """
         randomly permutates the order of notes, rhythms, and dynamics
         in a given melody object. each list is permutated independently of
         each other, meaning original associations aren't preserved!
 
         returns a new Melody() object containing this permutation
+
+        supply a random.Random() instance as rng for reproducible permutations,
+        otherwise the global random state is used.
         """
+        if rng is None:
+            rng = random
         mutant = melody
-        shuffle(mutant.notes)
-        shuffle(mutant.rhythms)
-        shuffle(mutant.dynamics)
+        rng.shuffle(mutant.notes)
+        rng.shuffle(mutant.rhythms)
+        rng.shuffle(mutant.dynamics)
         return mutant
 
     @staticmethod
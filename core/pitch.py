@@ -0,0 +1,100 @@
+"""
+NumPy-backed pitch operations for very long melodies.
+
+Works on int arrays of either NOTES indices or pitch class integers, so each
+transformation is a single array operation instead of a per-note Python loop.
+Use to_indices() and to_notes() to move between note name lists and arrays.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from core.constants import NOTES
+from core.lookup import notes_to_indices
+
+# NOTES as an array so index arrays can be mapped back to names in one step
+NOTES_ARRAY = np.array(NOTES, dtype=object)
+
+# default dtype for index and pitch class arrays. signed, since
+# transpositions and inversions can temporarily go negative.
+PITCH_DTYPE = np.int16
+
+
+def to_indices(notes: list[str]) -> np.ndarray:
+    """
+    converts a list of note name strings to an array of NOTES indices
+    """
+    return np.array(notes_to_indices(notes), dtype=PITCH_DTYPE)
+
+
+def to_notes(indices: np.ndarray) -> list[str]:
+    """
+    converts an array of NOTES indices back to a list of note name strings.
+    raises a ValueError if any index falls outside of NOTES.
+    """
+    indices = np.asarray(indices)
+    if indices.size and (indices.min() < 0 or indices.max() > len(NOTES) - 1):
+        raise ValueError(
+            f"indices must be between 0 and {len(NOTES) - 1}! "
+            f"range supplied: {indices.min()} - {indices.max()}"
+        )
+    return NOTES_ARRAY[indices].tolist()
+
+
+def oct_equiv(pcs: np.ndarray) -> np.ndarray:
+    """
+    keeps every value in an array of pitch class integers between 0 - 11.
+    returns a new array.
+    """
+    return np.mod(pcs, 12)
+
+
+def transpose(
+    pcs: np.ndarray, dist: int | np.ndarray, oct_eq: bool = True
+) -> np.ndarray:
+    """
+    transposes an array of pitch class integers (or NOTES indices) by a single
+    interval, or by an array of intervals of the same length.
+
+    set oct_eq to False when working with NOTES indices.
+
+    returns a new array.
+    """
+    pcs = np.asarray(pcs)
+    dist = np.asarray(dist)
+    if dist.ndim != 0 and dist.shape != pcs.shape:
+        raise ValueError(
+            "interval array must be the same length as the pitch array! "
+            f"intervals: {dist.shape} pitches: {pcs.shape}"
+        )
+    res = pcs + dist
+    if oct_eq:
+        res = oct_equiv(res)
+    return res
+
+
+def intervals(indices: np.ndarray) -> np.ndarray:
+    """
+    returns the successive intervals (in semi-tones) between
+    an array of NOTES indices. length will be len(indices)-1.
+    """
+    return np.diff(np.asarray(indices))
+
+
+def invert(indices: np.ndarray) -> np.ndarray:
+    """
+    inverts an array of NOTES indices around the first note, that is,
+    every interval from the first note is mirrored. returns a new array.
+    """
+    indices = np.asarray(indices)
+    if indices.size == 0:
+        return indices.copy()
+    return 2 * indices[0] - indices
+
+
+def retrograde(indices: np.ndarray) -> np.ndarray:
+    """
+    reverses an array. returns a view of the supplied array.
+    """
+    return np.asarray(indices)[::-1]
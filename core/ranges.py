@@ -0,0 +1,104 @@
+"""
+Precomputed instrument ranges and a range-aware note sampler.
+
+RANGE_INDEX is built once at import time from RANGE. Each instrument's entry
+holds its lowest and highest MIDI note numbers plus frozensets of its note
+names and MIDI note numbers, so checking whether a note is playable is a
+constant time lookup instead of a scan through RANGE's lists. Ranges aren't
+always contiguous (the Oboe's skips G#5 - B5), so checks use the sets rather
+than low and high.
+
+sample_in_range() intersects a source scale with an instrument's range up
+front and picks notes straight from the result, rather than drawing random
+notes until one happens to land in range.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import NamedTuple
+
+from core.constants import RANGE
+from core.lookup import NOTE_INDEX, MIDI_OFFSET
+
+
+class InstrumentRange(NamedTuple):
+    low: int  # lowest MIDI note number
+    high: int  # highest MIDI note number
+    notes: frozenset  # note name strings, as spelled in NOTES
+    nums: frozenset  # MIDI note numbers
+
+
+def _range_index() -> dict:
+    """
+    maps each instrument in RANGE to its InstrumentRange
+    """
+    index = {}
+    for instrument, notes in RANGE.items():
+        nums = [NOTE_INDEX[note] + MIDI_OFFSET for note in notes]
+        index[instrument] = InstrumentRange(
+            min(nums), max(nums), frozenset(notes), frozenset(nums)
+        )
+    return index
+
+
+# instrument name -> InstrumentRange
+RANGE_INDEX = _range_index()
+
+
+def get_range(instrument: str) -> InstrumentRange:
+    """
+    returns the InstrumentRange of a given instrument
+    """
+    try:
+        return RANGE_INDEX[instrument]
+    except KeyError:
+        raise ValueError(f"no range available for {instrument}!") from None
+
+
+def _contains(inst_range: InstrumentRange, note: str | int) -> bool:
+    if isinstance(note, str):
+        if note in inst_range.notes:
+            return True
+        if note not in NOTE_INDEX:
+            return False
+        note = NOTE_INDEX[note] + MIDI_OFFSET
+    return note in inst_range.nums
+
+
+def in_range(note: str | int, instrument: str) -> bool:
+    """
+    returns true if a note (name string or MIDI number) is within
+    an instrument's range. enharmonic spellings are accepted.
+    """
+    return _contains(get_range(instrument), note)
+
+
+def notes_in_range(notes: list, instrument: str) -> list:
+    """
+    returns the notes in a list that are within an instrument's range.
+    order and any duplicates are kept.
+    """
+    inst_range = get_range(instrument)
+    return [note for note in notes if _contains(inst_range, note)]
+
+
+def sample_in_range(
+    notes: list[str], instrument: str, total: int, rng: random.Random = None
+) -> list[str]:
+    """
+    picks a total number of notes from a list, limited to those within
+    an instrument's range. each note in range is equally likely to be
+    picked (duplicates are weighted accordingly).
+
+    draws from rng (a random.Random() instance) if one is supplied,
+    otherwise from the global random state.
+
+    raises a ValueError if none of the notes are within range.
+    """
+    if rng is None:
+        rng = random
+    candidates = notes_in_range(notes, instrument)
+    if not candidates:
+        raise ValueError(f"none of the supplied notes are in range for {instrument}!")
+    return rng.choices(candidates, k=total)
@@ -0,0 +1,123 @@
+"""
+Twelve-tone matrices.
+
+A matrix is stored as a 12x12 int8 array of pitch classes, where each row is
+a prime (P) form and each column an inversion (I). Forms are labeled by
+their first pitch class, so P0 starts on C, I7 starts on G, etc. R and RI
+forms are the retrogrades of the P and I forms with the same label.
+
+Matrices are cached by row, and matrices() builds any number of them at
+once with a single array operation.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from core.lookup import note_to_pc
+
+MATRIX_DTYPE = np.int8
+
+
+def to_row(row) -> tuple[int, ...]:
+    """
+    converts a row of pitch class name strings or integers to a tuple[int],
+    checking that it contains all 12 pitch classes exactly once.
+    """
+    row = tuple(note_to_pc(pc) if type(pc) == str else int(pc) % 12 for pc in row)
+    if len(row) != 12 or len(set(row)) != 12:
+        raise ValueError(f"row must contain all 12 pitch classes once! row: {row}")
+    return row
+
+
+def _build(rows: np.ndarray) -> np.ndarray:
+    """
+    builds a matrix for each row in an (n, 12) array.
+    matrix[i][j] == row[j] - row[i] + row[0] (mod 12)
+    """
+    rows = rows.astype(np.int16)
+    return ((rows[:, None, :] - rows[:, :, None] + rows[:, None, :1]) % 12).astype(
+        MATRIX_DTYPE
+    )
+
+
+class ToneMatrix:
+    """
+    A twelve-tone matrix for a single row.
+
+    Usage:
+        m = get_matrix(row)
+        m.P(0), m.R(5), m.I(7), m.RI(11)  # each form as an int8 array
+        m.matrix                         # the full 12x12 array
+
+    Every form is a (read-only) view into the matrix, found with one lookup.
+    """
+
+    __slots__ = ("row", "matrix", "_p", "_i")
+
+    def __init__(self, row, matrix: np.ndarray = None):
+        self.row = to_row(row)
+        if matrix is None:
+            matrix = _build(np.array([self.row]))[0]
+        matrix.setflags(write=False)
+        self.matrix = matrix
+        # label (first pitch class) -> row/column of each P and I form
+        self._p = np.argsort(matrix[:, 0])
+        self._i = np.argsort(matrix[0, :])
+
+    def __repr__(self) -> str:
+        return "\n".join(" ".join(f"{pc:>2}" for pc in row) for row in self.matrix)
+
+    def P(self, n: int) -> np.ndarray:
+        """prime form starting on pitch class n"""
+        return self.matrix[self._p[n % 12], :]
+
+    def R(self, n: int) -> np.ndarray:
+        """retrograde of Pn"""
+        return self.P(n)[::-1]
+
+    def I(self, n: int) -> np.ndarray:
+        """inversion starting on pitch class n"""
+        return self.matrix[:, self._i[n % 12]]
+
+    def RI(self, n: int) -> np.ndarray:
+        """retrograde of In"""
+        return self.I(n)[::-1]
+
+    def forms(self) -> dict:
+        """
+        returns every form in a dict, keyed by name (i.e. "P0", "RI11")
+        """
+        forms = {}
+        for name, get in (("P", self.P), ("R", self.R), ("I", self.I), ("RI", self.RI)):
+            forms.update({f"{name}{n}": get(n) for n in range(12)})
+        return forms
+
+
+@lru_cache(maxsize=1024)
+def _cached_matrix(row: tuple[int, ...]) -> ToneMatrix:
+    return ToneMatrix(row)
+
+
+def get_matrix(row) -> ToneMatrix:
+    """
+    returns the ToneMatrix of a row (pitch class name strings or integers).
+    matrices are cached, so the same row always returns the same object.
+    """
+    return _cached_matrix(to_row(row))
+
+
+def matrices(rows) -> np.ndarray:
+    """
+    builds the matrices of many rows at once.
+
+    rows can be a list of rows or an (n, 12) array of pitch class integers.
+    returns an (n, 12, 12) int8 array.
+    """
+    if not isinstance(rows, np.ndarray):
+        rows = np.array([to_row(row) for row in rows], dtype=np.int16)
+    if rows.ndim != 2 or rows.shape[1] != 12:
+        raise ValueError(f"rows must be an (n, 12) array! shape: {rows.shape}")
+    return _build(rows % 12)
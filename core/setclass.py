@@ -0,0 +1,204 @@
+"""
+Pitch class set identification.
+
+Every pitch class collection can be represented as a 12-bit mask, where
+bit n is set if pitch class n is present (i.e. [0, 4, 7] == 0b10010001).
+Since there are only 4096 possible masks, the normal order, prime form,
+interval vector, and Forte number of every one of them is computed once
+(on first use) and stored in tables indexed by mask, so identifying a set
+is a single lookup.
+
+Normal and prime forms follow Rahn's packing (smallest span first, then
+the smallest span to each note from the right). Forte numbers come from
+SETS, where inversionally related sets are listed separately with an A or
+B suffix, so a set and its inversion can have different names.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from core.constants import SETS
+from utils.tools import is_array
+
+TOTAL_MASKS = 4096
+FULL_MASK = TOTAL_MASKS - 1
+
+
+def to_mask(pcs) -> int:
+    """
+    converts an iterable of pitch class integers to a 12-bit mask.
+    values outside of 0-11 are reduced to pitch classes first.
+    """
+    mask = 0
+    for pc in pcs:
+        mask |= 1 << (pc % 12)
+    return mask
+
+
+def to_pcs(mask: int) -> list[int]:
+    """
+    converts a 12-bit mask to a sorted list of pitch class integers
+    """
+    return [pc for pc in range(12) if mask >> pc & 1]
+
+
+def transpose_mask(mask: int, n: int) -> int:
+    """
+    transposes every pitch class in a mask by n semitones (a bit rotation)
+    """
+    n %= 12
+    return ((mask << n) | (mask >> (12 - n))) & FULL_MASK
+
+
+def invert_mask(mask: int) -> int:
+    """
+    inverts every pitch class in a mask around 0 (pc -> 12 - pc)
+    """
+    return to_mask(-pc for pc in to_pcs(mask))
+
+
+def _normal_order(mask: int) -> tuple[int, ...]:
+    """
+    finds the normal order of a mask: the rotation of its sorted pitch
+    classes with the smallest span, breaking ties by the span to the
+    second to last note, then the third to last, etc., then by the
+    lowest first pitch class.
+    """
+    pcs = to_pcs(mask)
+    if len(pcs) < 2:
+        return tuple(pcs)
+    best, best_key = None, None
+    for i in range(len(pcs)):
+        rotation = pcs[i:] + pcs[:i]
+        first = rotation[0]
+        spans = tuple((pc - first) % 12 for pc in reversed(rotation[1:]))
+        key = (spans, first)
+        if best_key is None or key < best_key:
+            best, best_key = rotation, key
+    return tuple(best)
+
+
+def _zeroed(order: tuple[int, ...]) -> tuple[int, ...]:
+    """transposes a normal order so it starts on 0"""
+    return tuple((pc - order[0]) % 12 for pc in order) if order else ()
+
+
+def _forte_names() -> dict:
+    """
+    maps every transposition of every set in SETS to its Forte number.
+    sets without an A/B pair are inversionally symmetric (or only listed
+    once), so their inversions are mapped to the same name.
+    """
+    names = {}
+    for name, pcs in SETS.items():
+        mask = to_mask(pcs)
+        for n in range(12):
+            names.setdefault(transpose_mask(mask, n), name)
+    for name, pcs in SETS.items():
+        if name[-1] in "AB":
+            continue
+        inv = invert_mask(to_mask(pcs))
+        for n in range(12):
+            names.setdefault(transpose_mask(inv, n), name)
+    return names
+
+
+@lru_cache(maxsize=None)
+def _tables() -> tuple[list, list, list]:
+    """
+    builds the normal order, prime form, and Forte number of all 4096 masks
+    """
+    normal = [_normal_order(mask) for mask in range(TOTAL_MASKS)]
+    prime = []
+    for mask in range(TOTAL_MASKS):
+        inverted = normal[invert_mask(mask)]
+        prime.append(min(_zeroed(normal[mask]), _zeroed(inverted)))
+    names = _forte_names()
+    forte = [names.get(mask) for mask in range(TOTAL_MASKS)]
+    return normal, prime, forte
+
+
+def normal_order(mask: int) -> list[int]:
+    """
+    returns the normal order of a mask as a list[int]
+    """
+    return list(_tables()[0][mask])
+
+
+def prime_form(mask: int) -> list[int]:
+    """
+    returns the prime form of a mask as a list[int]
+    """
+    return list(_tables()[1][mask])
+
+
+def forte_number(mask: int) -> str | None:
+    """
+    returns the Forte number (a key in SETS) of a mask,
+    or None if the set isn't in SETS.
+    """
+    return _tables()[2][mask]
+
+
+def _interval_vector(mask: int) -> tuple[int, ...]:
+    """
+    counts each interval class (1-6) between every pair of pitch classes
+    in a mask. rotating the mask by n semitones and AND-ing it with itself
+    leaves a bit for every pair n semitones apart.
+    """
+    vector = [(mask & transpose_mask(mask, ic)).bit_count() for ic in range(1, 7)]
+    # tritones are counted from both sides
+    vector[5] //= 2
+    return tuple(vector)
+
+
+@lru_cache(maxsize=None)
+def _vectors() -> list:
+    """builds the interval vector of all 4096 masks"""
+    return [_interval_vector(mask) for mask in range(TOTAL_MASKS)]
+
+
+def interval_vector(mask: int) -> list[int]:
+    """
+    returns the interval vector of a mask: the number of times each interval
+    class (1-6) appears between every pair of its pitch classes.
+    """
+    return list(_vectors()[mask])
+
+
+def window_masks(pcs, size: int):
+    """
+    returns the mask of every window of n consecutive pitch classes in a
+    sequence as a numpy array, i.e. for classifying every n-note segment of
+    a melody at once.
+    """
+    import numpy as np
+
+    pcs = np.asarray(pcs, dtype=np.int64) % 12
+    total = len(pcs) - size + 1
+    if size < 1 or total < 1:
+        return np.zeros(0, dtype=np.int64)
+    bits = np.left_shift(1, pcs)
+    masks = bits[:total].copy()
+    for i in range(1, size):
+        masks |= bits[i : i + total]
+    return masks
+
+
+@lru_cache(maxsize=None)
+def _forte_array():
+    import numpy as np
+
+    return np.array(_tables()[2], dtype=object)
+
+
+def forte_numbers(masks) -> list:
+    """
+    returns the Forte number (or None) of each mask in an iterable or array.
+    numpy arrays of masks are looked up all at once and return an array.
+    """
+    if is_array(masks):
+        return _forte_array()[masks]
+    forte = _tables()[2]
+    return [forte[mask] for mask in masks]
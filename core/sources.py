@@ -0,0 +1,185 @@
+"""
+Cached roots and source scales.
+
+A root is a list of note names without octaves (i.e. ["C", "D", "E"]), built
+from a pitch class set and a transposition. A source scale repeats a root
+across a span of octaves (i.e. ["C2", "D2", "E2", "C3", ...]), and is what
+Generate.new_notes() and Generate.new_source_scale() pick notes from.
+
+Since there are only so many roots (every scale in SCALES, every set in SETS,
+and at most 4096 invented scales, times 12 transpositions), both are built
+once per (pcs, transposition, octave span) and kept in an LRU cache, instead
+of being formatted note by note on every call. pcs are transposed before
+they're used as a key, so i.e. ([0, 4, 7], 2) and ([2, 6, 9], 0) share an
+entry.
+
+Cached values are tuples, so they can't be changed by accident. Callers that
+hand them out should copy them into a list first.
+"""
+
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+
+from core.constants import PITCH_CLASSES
+from core.lookup import MIDI_OFFSET, NOTE_INDEX, PC_INDEX
+
+# lowest and highest octave of a source scale
+LOW_OCTAVE = 2
+HIGH_OCTAVE = 5
+
+# maximum number of entries kept in each cache. there are more possible
+# roots than this (mostly invented scales), but only a few hundred of them
+# come up often.
+ROOT_CACHE_SIZE = 16384
+SCALE_CACHE_SIZE = 4096
+
+
+class SourceScale:
+    """
+    A source scale of a root.
+
+        notes: note name strings, in order (tuple[str])
+        indices: the NOTES index of each note (array of int16), which can be
+                 viewed as a numpy array without copying with np.frombuffer()
+
+    indices are only built the first time they're used.
+    """
+
+    __slots__ = ("notes", "_starts", "_pcs", "_indices")
+
+    def __init__(
+        self, notes: tuple[str, ...], pcs: tuple[int, ...], starts, indices=None
+    ):
+        self.notes = notes
+        self._pcs = pcs
+        self._starts = starts  # NOTES index of C in each octave
+        self._indices = indices
+
+    def __repr__(self) -> str:
+        return f"SourceScale({list(self.notes)})"
+
+    def __len__(self) -> int:
+        return len(self.notes)
+
+    @property
+    def indices(self) -> array:
+        if self._indices is None:
+            self._indices = array(
+                "h", [start + pc for start in self._starts for pc in self._pcs]
+            )
+        return self._indices
+
+
+def _key(pcs, transposition: int) -> tuple[int, ...]:
+    """
+    transposes pcs ahead of time, so every (pcs, transposition) pair that
+    spells the same notes shares one cache entry
+    """
+    return tuple([(pc + transposition) % 12 for pc in pcs])
+
+
+def root_pcs(root: list[str]) -> tuple[int, ...]:
+    """
+    returns the pitch classes of a root (list of note names without octaves)
+    """
+    try:
+        return tuple([PC_INDEX[note] for note in root])
+    except KeyError as e:
+        raise ValueError(f"{e.args[0]} is not a valid pitch class name!") from None
+
+
+@lru_cache(maxsize=ROOT_CACHE_SIZE)
+def _root(pcs: tuple[int, ...], octave: int) -> tuple[str, ...]:
+    if octave is None:
+        return tuple([PITCH_CLASSES[pc] for pc in pcs])
+    return tuple([f"{PITCH_CLASSES[pc]}{octave}" for pc in pcs])
+
+
+def get_root(pcs, transposition: int = 0, octave: int = None) -> tuple[str, ...]:
+    """
+    returns the note names of a pitch class set (list[int]) transposed by a
+    given distance, with an octave appended to each if one is supplied (2-5).
+    same output as to_str(transpose(pcs, transposition), octave).
+    """
+    if octave is not None and (type(octave) != int or not 1 < octave < 6):
+        raise ValueError("octave must be within 2-5!")
+    return _root(_key(pcs, transposition), octave)
+
+
+@lru_cache(maxsize=SCALE_CACHE_SIZE)
+def _source_scale(pcs: tuple[int, ...]) -> SourceScale:
+    """builds the full source scale (LOW_OCTAVE - HIGH_OCTAVE) of a root"""
+    octaves = range(LOW_OCTAVE, HIGH_OCTAVE + 1)
+    notes = tuple([f"{PITCH_CLASSES[pc]}{octave}" for octave in octaves for pc in pcs])
+    # NOTES starts on A0, so C(octave) is at index 12 * (octave + 1) - MIDI_OFFSET
+    return SourceScale(
+        notes, pcs, [12 * (octave + 1) - MIDI_OFFSET for octave in octaves]
+    )
+
+
+def get_source_scale(
+    pcs,
+    transposition: int = 0,
+    low: int = LOW_OCTAVE,
+    high: int = HIGH_OCTAVE,
+) -> SourceScale:
+    """
+    returns the SourceScale of a pitch class set (list[int]) transposed by a
+    given distance, repeated from octave low up to and including octave high.
+
+    only the full source scale is cached. any smaller span of octaves is a
+    slice of it.
+    """
+    if not LOW_OCTAVE <= low <= high <= HIGH_OCTAVE:
+        raise ValueError(
+            f"octaves must be within {LOW_OCTAVE}-{HIGH_OCTAVE}! low: {low} high: {high}"
+        )
+    if len(pcs) == 0:
+        raise ValueError("pcs can't be empty!")
+    scale = _source_scale(_key(pcs, transposition))
+    if low == LOW_OCTAVE and high == HIGH_OCTAVE:
+        return scale
+    start = (low - LOW_OCTAVE) * len(pcs)
+    end = (high - LOW_OCTAVE + 1) * len(pcs)
+    return SourceScale(
+        scale.notes[start:end],
+        scale._pcs,
+        scale._starts[low - LOW_OCTAVE : high - LOW_OCTAVE + 1],
+    )
+
+
+def _spelled_source_scale(root: tuple[str, ...]) -> SourceScale:
+    """builds a full source scale, keeping the root's own spelling"""
+    octaves = range(LOW_OCTAVE, HIGH_OCTAVE + 1)
+    notes = tuple([f"{note}{octave}" for octave in octaves for note in root])
+    # looked up by name, since i.e. "Cb3" is actually B2
+    indices = array("h", [NOTE_INDEX[note] for note in notes])
+    return SourceScale(notes, root_pcs(root), None, indices)
+
+
+def root_source_scale(root: list[str]) -> SourceScale:
+    """
+    same as get_source_scale(root_pcs(root)), for a root that's
+    already spelled out (i.e. from Generate.pick_root()).
+
+    roots spelled differently than PITCH_CLASSES (i.e. "Db" instead of "C#")
+    keep their spelling, and aren't cached.
+    """
+    pcs = root_pcs(root)
+    if _root(pcs, None) != tuple(root):
+        return _spelled_source_scale(tuple(root))
+    return _source_scale(pcs)
+
+
+def cache_info() -> dict:
+    """
+    returns the hit/miss statistics of each cache
+    """
+    return {"roots": _root.cache_info(), "source scales": _source_scale.cache_info()}
+
+
+def clear_cache() -> None:
+    _root.cache_clear()
+    _source_scale.cache_clear()
@@ -0,0 +1,88 @@
+import os
+import signal
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from core import batch
+
+
+def test_task_seeds():
+    seeds = [batch.task_seed(42, i) for i in range(100)]
+    assert seeds == [batch.task_seed(42, i) for i in range(100)]
+    assert len(set(seeds)) == 100
+    # nearby base seeds don't share pieces
+    assert not set(seeds) & {batch.task_seed(43, i) for i in range(100)}
+
+
+def test_new_batch(tmp_path):
+    summary = batch.new_batch(3, workers=2, seed=7, out_dir=str(tmp_path))
+    assert summary["completed"] == 3 and not summary["failed"]
+    files = sorted(os.listdir(tmp_path))
+    assert files == sorted(r["file"] for r in summary["results"])
+    assert [r["index"] for r in summary["results"]] == [0, 1, 2]
+
+
+def test_same_seed_same_pieces(tmp_path):
+    a = batch.new_piece(0, 1234, str(tmp_path))
+    b = batch.new_piece(0, 1234, str(tmp_path))
+    assert a == b
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGALRM"), reason="needs SIGALRM")
+def test_timeout_leaves_no_partial_file(tmp_path, monkeypatch):
+    def slow_export(comp, file_name):
+        with open(file_name, "wb") as file:
+            file.write(b"MThd")
+        time.sleep(5)
+
+    monkeypatch.setattr(batch, "export_midi", slow_export)
+    res = batch._run_task(0, 1, str(tmp_path), timeout=0.2)
+    assert res["error"] == "timeout"
+    assert os.listdir(tmp_path) == []
+
+
+def test_error_leaves_no_partial_file(tmp_path, monkeypatch):
+    def bad_export(comp, file_name):
+        with open(file_name, "wb") as file:
+            file.write(b"MThd")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(batch, "export_midi", bad_export)
+    res = batch._run_task(0, 1, str(tmp_path))
+    assert "disk full" in res["error"]
+    assert os.listdir(tmp_path) == []
+
+
+class BrokenPool:
+    """stands in for a ProcessPoolExecutor whose worker died after 2 tasks"""
+
+    def __init__(self, max_workers=None):
+        self.submitted = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        if self.submitted < 2:
+            future.set_result(fn(*args))
+        elif self.submitted < 4:
+            future.set_exception(BrokenProcessPool("a worker died"))
+        else:
+            raise BrokenProcessPool("a worker died")
+        self.submitted += 1
+        return future
+
+
+def test_broken_pool_fails_the_remaining_tasks(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", BrokenPool)
+    summary = batch.new_batch(6, seed=3, out_dir=str(tmp_path))
+    assert summary["completed"] == 2
+    assert [r["index"] for r in summary["failed"]] == [2, 3, 4, 5]
+    assert len(os.listdir(tmp_path)) == 2
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from core.constants import DYNAMICS, REST, RHYTHMS
+from core.generate import Generate
+
+
+def test_rhythms_array():
+    rhythms = Generate(seed=0).new_rhythms_array(10_000)
+    assert rhythms.shape == (10_000,)
+    assert set(rhythms.tolist()) <= set(RHYTHMS)
+
+
+def test_rhythms_array_sources():
+    gen = Generate(seed=0)
+    for source in ([0.5, 1.0], np.array([0.5, 1.0]), (0.5, 1.0)):
+        rhythms = gen.new_rhythms_array(500, source_rhythms=source)
+        assert set(rhythms.tolist()) <= {0.5, 1.0}
+    with pytest.raises(ValueError):
+        gen.new_rhythms_array(10, source_rhythms=[])
+
+
+def test_rhythms_array_tempo():
+    a = Generate(seed=1).new_rhythms_array(100)
+    b = Generate(seed=1).new_rhythms_array(100, tempo=120.0)
+    # scale_to_tempo() rounds to 3 decimal places
+    assert np.allclose(b, a / 2, atol=0.001)
+
+
+def test_dynamics_array():
+    dynamics = Generate(seed=0).new_dynamics_array(10_000)
+    assert dynamics.shape == (10_000,)
+    assert set(dynamics.tolist()) <= set(DYNAMICS) | {REST}
+    assert REST in dynamics
+    no_rests = Generate(seed=0).new_dynamics_array(10_000, rests=False)
+    assert REST not in no_rests
+
+
+def test_empty_arrays():
+    gen = Generate(seed=0)
+    assert gen.new_rhythms_array(0).shape == (0,)
+    assert gen.new_dynamics_array(0).shape == (0,)
+
+
+def test_seeded_arrays_repeat():
+    a, b = Generate(seed=9), Generate(seed=9)
+    assert (a.new_rhythms_array(50) == b.new_rhythms_array(50)).all()
+    assert (a.new_dynamics_array(50) == b.new_dynamics_array(50)).all()
@@ -0,0 +1,107 @@
+from shutil import copyfile
+
+import pytest
+
+from core.analyze import Analyze
+from core.generate import Generate
+from containers.composition import Composition
+from utils.cache import AnalysisCache
+from utils.midi import export_midi_stream
+
+
+@pytest.fixture
+def midi_files(tmp_path):
+    """writes three small (different) MIDI files"""
+    files = []
+    for seed in range(3):
+        comp = Composition(title=f"test {seed}", tempo=100.0)
+        melody = Generate(seed=seed).new_melody(tempo=100.0, total=20)
+        melody.instrument = "Flute"
+        comp.add_part(melody, "Flute")
+        file_name = str(tmp_path / f"{seed}.mid")
+        export_midi_stream(comp, file_name)
+        files.append(file_name)
+    return files
+
+
+def same_results(a: dict, b: dict) -> bool:
+    if (a["Tempo"], a["Resolution"]) != (b["Tempo"], b["Resolution"]):
+        return False
+    for field in ("Notes", "Onsets", "Durations", "Pitch Classes"):
+        if a[field].keys() != b[field].keys():
+            return False
+        for track in a[field]:
+            if not (a[field][track] == b[field][track]).all():
+                return False
+    return True
+
+
+def test_cached_results_match(tmp_path, midi_files):
+    analyze = Analyze()
+    cache = AnalysisCache(str(tmp_path / "cache"))
+    for file_name in midi_files:
+        res = analyze.analyze_midi(file_name)
+        assert same_results(analyze.analyze_midi(file_name, cache=cache), res)
+        assert same_results(analyze.analyze_midi(file_name, cache=cache), res)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_content_keys(tmp_path, midi_files):
+    analyze = Analyze()
+    cache = AnalysisCache(str(tmp_path / "cache"))
+    cache.put(midi_files[0], analyze.analyze_midi(midi_files[0]))
+    # a copy hits, an edit misses
+    copy = str(tmp_path / "copy.mid")
+    copyfile(midi_files[0], copy)
+    assert cache.get(copy) is not None
+    copyfile(midi_files[1], midi_files[0])
+    assert cache.get(midi_files[0]) is None
+
+
+def test_invalidate_and_clear(tmp_path, midi_files):
+    analyze = Analyze()
+    cache = AnalysisCache(str(tmp_path / "cache"))
+    a, b = midi_files[:2]
+    cache.put(a, analyze.analyze_midi(a))
+    cache.put(b, analyze.analyze_midi(b))
+    assert cache.invalidate(a)
+    assert not cache.invalidate(a)
+    assert cache.get(a) is None and cache.get(b) is not None
+    cache.clear()
+    assert cache.size == 0 and cache.get(b) is None
+
+
+def test_evicts_least_recently_used(tmp_path, midi_files):
+    analyze = Analyze()
+    cache = AnalysisCache(str(tmp_path / "cache"))
+    results = [analyze.analyze_midi(file_name) for file_name in midi_files]
+    cache.put(midi_files[0], results[0])
+    cache.max_bytes = cache.size * 2 + cache.size // 2
+    cache.put(midi_files[1], results[1])
+    # reading the first entry makes the second the least recently used
+    cache.get(midi_files[0])
+    cache.put(midi_files[2], results[2])
+    assert cache.size <= cache.max_bytes
+    assert cache.get(midi_files[0]) is not None
+    assert cache.get(midi_files[1]) is None
+    assert cache.get(midi_files[2]) is not None
+
+
+def test_files_are_hashed_once(tmp_path, midi_files, monkeypatch):
+    cache = AnalysisCache(str(tmp_path / "cache"))
+    calls = []
+    key = cache.key
+    monkeypatch.setattr(cache, "key", lambda f: calls.append(f) or key(f))
+    Analyze().analyze_midi(midi_files[0], cache=cache)
+    Analyze().analyze_midi(midi_files[0], cache=cache)
+    assert calls == [midi_files[0]] * 2
+
+
+def test_entry_removed_by_another_process(tmp_path, midi_files):
+    cache = AnalysisCache(str(tmp_path / "cache"))
+    other = AnalysisCache(str(tmp_path / "cache"))
+    cache.put(midi_files[0], Analyze().analyze_midi(midi_files[0]))
+    other.clear()
+    assert cache.get(midi_files[0]) is None
+    cache.clear()
+    cache.evict()
@@ -0,0 +1,69 @@
+import pytest
+
+from containers.columnar import ColumnarMelody
+from containers.melody import Melody
+
+
+def new_columnar() -> ColumnarMelody:
+    col = ColumnarMelody(tempo=60.0, instrument="Flute")
+    col.append("C4", 1.0, 100)
+    col.extend([62, "Eb4"], [0.5, 0.25], [90, 80])
+    return col
+
+
+def test_events():
+    col = new_columnar()
+    assert len(col) == 3
+    assert col.notes == ["C4", "D4", "Eb4"]
+    assert col.pitches.tolist() == [60, 62, 63]
+    assert col.dynamics.tolist() == [100, 90, 80]
+    assert col.duration() == 1.75
+    with pytest.raises(ValueError):
+        col.extend(["C4"], [1.0, 2.0], [100])
+
+
+def test_arrays_are_copies():
+    col = new_columnar()
+    col.rhythms[0] = 10.0
+    col.pitches.append(64)
+    assert col.rhythms.tolist() == [1.0, 0.5, 0.25]
+    assert len(col) == 3
+    assert col.duration() == 1.75
+    with pytest.raises(AttributeError):
+        col.rhythms = [1.0]
+
+
+def test_melody_round_trip():
+    col = new_columnar()
+    col.info = "test"
+    col.add_pcs([0, 2, 3])
+    col.add_source_notes(["C4", "D4"])
+    melody = col.to_melody()
+    assert melody.notes == col.notes
+    assert list(melody.rhythms) == col.rhythms.tolist()
+    assert melody.dynamics == col.dynamics.tolist()
+    assert melody.get_meta_data() == col.get_meta_data()
+    back = ColumnarMelody.from_melody(melody)
+    assert back.notes == col.notes and back.duration() == col.duration()
+    assert back.get_meta_data() == col.get_meta_data()
+
+
+def test_meta_data_is_not_shared():
+    col = new_columnar()
+    col.add_pcs([0, 2, 3])
+    col.source_data = [1, 2, 3]
+    melody = col.to_melody()
+    melody.add_pcs([5])
+    melody.add_source_notes(["G4"])
+    melody.source_data.append(4)
+    assert col.pcs == [[0, 2, 3]]
+    assert len(col.source_notes) == 0
+    assert col.source_data == [1, 2, 3]
+    back = ColumnarMelody.from_melody(melody)
+    back.add_pcs([7])
+    assert melody.pcs == [[0, 2, 3], [5]]
+
+
+def test_unused_meta_data_stays_unallocated():
+    melody = new_columnar().to_melody()
+    assert melody._pcs is None and melody._source_notes is None
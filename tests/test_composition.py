@@ -0,0 +1,122 @@
+import copy
+import pickle
+
+from containers.chord import Chord
+from containers.composition import Composition
+from containers.melody import Melody
+from containers.part import Part
+
+
+def new_chord(rhythm: float) -> Chord:
+    chord = Chord()
+    chord.notes = ["C4", "E4"]
+    chord.rhythm = rhythm
+    return chord
+
+
+def new_melody(rhythms: list) -> Melody:
+    melody = Melody()
+    melody.rhythms = rhythms
+    return melody
+
+
+class Counted(Chord):
+    """a chord that counts how many times its duration is measured"""
+
+    __slots__ = ("calls",)
+
+    def __init__(self, rhythm: float):
+        super().__init__()
+        self.calls = 0
+        self.rhythm = rhythm
+
+    def duration(self):
+        self.calls += 1
+        return super().duration()
+
+
+def test_list_parts_stay_current():
+    comp = Composition()
+    comp.add_part([new_chord(1.0), new_chord(0.5)], "Piano")
+    part = list(comp.parts)[0]
+    assert isinstance(comp.parts[part], Part)
+    assert comp.part_duration(part) == 1.5
+    assert list(comp.part_onsets(part)) == [0.0, 1.0]
+
+    comp.parts[part].append(new_chord(2.0))
+    assert comp.part_duration(part) == 3.5
+    assert list(comp.part_onsets(part)) == [0.0, 1.0, 1.5]
+
+    # modifying an object already in the part
+    comp.parts[part][0].rhythm = 3.0
+    assert comp.part_duration(part) == 5.5
+    assert list(comp.part_onsets(part)) == [0.0, 3.0, 3.5]
+
+    comp.parts[part].pop(0)
+    assert comp.part_duration(part) == 2.5
+    assert list(comp.part_onsets(part)) == [0.0, 0.5]
+
+
+def test_melodies_in_list_parts():
+    melody = new_melody([1.0, 1.0])
+    part = Part([melody, new_chord(0.5)])
+    assert part.duration() == 2.5
+    melody.rhythms.append(1.0)
+    assert part.duration() == 3.5
+    melody.rhythms = [0.25]
+    assert part.duration() == 0.75
+    assert list(part.onsets()) == [0.0, 0.25]
+
+
+def test_queries_do_not_remeasure():
+    chords = [Counted(1.0) for _ in range(100)]
+    comp = Composition()
+    comp.add_part(chords, "Piano")
+    part = list(comp.parts)[0]
+    assert comp.part_duration(part) == 100.0
+    assert all(chord.calls == 1 for chord in chords)
+    for _ in range(10):
+        comp.part_duration(part)
+        comp.part_onsets(part)
+        comp._duration()
+    assert all(chord.calls == 1 for chord in chords)
+    # appends only measure the new object
+    extra = Counted(2.0)
+    comp.parts[part].append(extra)
+    assert comp.part_duration(part) == 102.0
+    assert extra.calls == 1 and all(chord.calls == 1 for chord in chords)
+
+
+def test_objects_removed_or_copied_dont_touch_the_part():
+    chord = new_chord(1.0)
+    part = Part([chord])
+    part.duration()
+    clone = copy.deepcopy(chord)
+    clone.rhythm = 5.0
+    assert not part._stale
+    assert part.duration() == 1.0
+    back = pickle.loads(pickle.dumps(part))
+    assert isinstance(back, Part) and back.duration() == 1.0
+    back[0].rhythm = 2.0
+    assert back.duration() == 2.0 and part.duration() == 1.0
+
+
+def test_shared_rhythms_are_copied():
+    a = new_melody([1.0])
+    b = Melody()
+    b.rhythms = a.rhythms
+    b.rhythms.append(1.0)
+    assert a.duration() == 1.0 and b.duration() == 2.0
+    clone = copy.copy(a)
+    clone.rhythms.append(3.0)
+    assert a.duration() == 1.0 and clone.duration() == 4.0
+
+
+def test_duration_is_the_longest_part():
+    comp = Composition()
+    melody = new_melody([1.0, 1.0])
+    comp.add_part(melody, "Violin")
+    comp.add_part([new_chord(0.5)], "Piano")
+    assert comp._duration() == 2.0
+    melody.rhythms.append(4.0)
+    assert comp._duration() == 6.0
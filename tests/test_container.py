@@ -0,0 +1,35 @@
+import pytest
+
+from containers.chord import Chord
+from containers.container import EMPTY
+from containers.melody import Melody
+
+
+@pytest.mark.parametrize("cls", [Melody, Chord])
+def test_meta_data_is_not_allocated_on_read(cls):
+    obj = cls()
+    assert obj.pcs is EMPTY
+    assert obj.source_data is EMPTY
+    assert obj.source_notes is EMPTY
+    obj.get_meta_data()
+    assert obj._pcs is None and obj._source_notes is None
+    assert not hasattr(obj, "__dict__")
+
+
+def test_add_meta_data():
+    melody = Melody()
+    melody.add_pcs([0, 4, 7])
+    melody.add_pcs([2, 5, 9])
+    melody.add_source_notes(["C2", "E2"])
+    melody.add_source_notes(["G2"])
+    assert melody.pcs == [[0, 4, 7], [2, 5, 9]]
+    assert melody.source_notes == ["C2", "E2", "G2"]
+
+
+def test_appending_to_an_unwritten_field_raises():
+    melody = Melody()
+    with pytest.raises(AttributeError):
+        melody.pcs.append([0, 4, 7])
+    melody.pcs = []
+    melody.pcs.append([0, 4, 7])
+    assert melody.pcs == [[0, 4, 7]]
@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+
+from core.corpus import (
+    COLUMNS,
+    CorpusStats,
+    analyze_corpus,
+    analyze_files,
+    write_results,
+)
+from core.generate import Generate
+from containers.composition import Composition
+from utils.midi import export_midi_stream
+
+
+def write_midi(file_name: str, seed: int) -> None:
+    comp = Composition(title=str(seed), tempo=120.0)
+    melody = Generate(seed=seed).new_melody(tempo=120.0, total=10)
+    melody.instrument = "Flute"
+    comp.add_part(melody, "Flute")
+    export_midi_stream(comp, file_name)
+
+
+def new_corpus(folder) -> list[str]:
+    """two files with the same name in different sub-folders, plus one more"""
+    os.makedirs(folder / "a")
+    os.makedirs(folder / "b")
+    files = [folder / "a" / "x.mid", folder / "b" / "x.mid", folder / "y.mid"]
+    for seed, file_name in enumerate(files):
+        write_midi(str(file_name), seed)
+    return [str(f) for f in files]
+
+
+def test_rows_are_keyed_by_relative_path(tmp_path):
+    new_corpus(tmp_path)
+    summary = analyze_corpus(str(tmp_path), workers=2, chunk=1)
+    names = [row[0] for row in summary["rows"]]
+    assert names == [os.path.join("a", "x.mid"), os.path.join("b", "x.mid"), "y.mid"]
+    assert summary["stats"].files == 3 and not summary["failed"]
+
+
+def test_chunks_merge_to_the_same_stats(tmp_path):
+    files = new_corpus(tmp_path)
+    rows, whole, _ = analyze_files(files, root=str(tmp_path))
+    merged = CorpusStats()
+    for file_name in files:
+        merged.merge(analyze_files([file_name], root=str(tmp_path))[1])
+    assert merged.to_dict() == whole.to_dict()
+    assert merged.notes == sum(row[2] for row in rows)
+
+
+def test_failed_files(tmp_path):
+    bad = tmp_path / "bad.mid"
+    bad.write_bytes(b"not midi")
+    rows, stats, failed = analyze_files([str(bad)])
+    assert rows == [] and stats.files == 0
+    assert failed[0][0] == str(bad)
+
+
+def test_write_results(tmp_path):
+    new_corpus(tmp_path / "corpus")
+    rows = analyze_corpus(str(tmp_path / "corpus"), workers=1)["rows"]
+    write_results(rows, str(tmp_path / "out.npz"))
+    data = np.load(tmp_path / "out.npz")
+    assert list(data.files) == COLUMNS
+    assert data["file_name"].tolist() == [row[0] for row in rows]
+    write_results(rows, str(tmp_path / "out.csv"))
+    lines = (tmp_path / "out.csv").read_text().splitlines()
+    assert lines[0].split(",") == COLUMNS and len(lines) == 4
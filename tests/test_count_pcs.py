@@ -0,0 +1,54 @@
+from collections import Counter
+
+from core.analyze import Analyze
+from core.generate import Generate
+from core.lookup import note_to_pc
+from containers.chord import Chord
+from containers.composition import Composition
+from utils.midi import export_midi_stream, parse_midi
+
+
+def new_composition() -> Composition:
+    melody = Generate(seed=6).new_melody(tempo=60.0, total=30)
+    melody.instrument = "Flute"
+    # rests aren't written to MIDI files, so leave them out
+    melody.dynamics = [100] * len(melody.notes)
+    chord = Chord()
+    chord.notes = ["C3", "E3", "G3", "C4"]
+    chord.rhythm = 1.0
+    chord.dynamic = 90
+    comp = Composition(title="test", tempo=60.0)
+    comp.add_part(melody, "Flute")
+    comp.add_part([chord, chord], "Acoustic Grand Piano")
+    return comp
+
+
+def expected_counts(notes: list) -> dict:
+    counts = Counter(note_to_pc(note) for note in notes)
+    return {pc: counts[pc] for pc in range(12)}
+
+
+def test_composition():
+    comp = new_composition()
+    res = Analyze().count_pcs(comp)
+    melody, chords = comp.parts.values()
+    flute, piano = comp.parts
+    assert res["Tracks"][flute] == expected_counts(melody.notes)
+    assert res["Tracks"][piano] == expected_counts(chords[0].notes * 2)
+    assert res["Total"] == expected_counts(melody.notes + chords[0].notes * 2)
+
+
+def test_file_sources_agree(tmp_path):
+    file_name = str(tmp_path / "a.mid")
+    export_midi_stream(new_composition(), file_name)
+    analyze = Analyze()
+    notes = analyze.analyze_midi(file_name)["Notes"]
+    tracks, _ = parse_midi(file_name)
+    res = analyze.count_pcs(notes)
+    assert analyze.count_pcs(tracks) == res
+    assert sum(res["Total"].values()) == sum(len(n) for n in notes.values())
+
+
+def test_empty():
+    res = Analyze().count_pcs([])
+    assert res == {"Total": {pc: 0 for pc in range(12)}, "Tracks": {}}
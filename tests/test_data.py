@@ -0,0 +1,100 @@
+import importlib
+import random
+
+import numpy as np
+import pytest
+
+import utils.data
+from core.generate import Generate
+from utils.data import DATA_MAP, map_file, new_data
+
+
+def test_data_map_is_lazy():
+    assert all(callable(func) for func in DATA_MAP.values())
+    # importing doesn't generate anything
+    state = random.getstate()
+    importlib.reload(utils.data)
+    assert random.getstate() == state
+    random.seed(0)
+    assert new_data("ints") != new_data("ints")
+
+
+@pytest.mark.parametrize("data_type", list(DATA_MAP))
+def test_totals(data_type):
+    assert len(new_data(data_type, total=25)) == 25
+    array = new_data(data_type, total=25, as_array=True)
+    assert isinstance(array, np.ndarray) and len(array) == 25
+
+
+def test_ranges():
+    ints = new_data("ints", total=1000, as_array=True)
+    assert ints.min() >= 0 and ints.max() <= 500
+    floats = new_data("floats", total=1000)
+    assert all(0.001 <= f <= 500.001 for f in floats)
+    chars = new_data("chars", total=1000, as_array=True)
+    assert all(c.isalpha() for c in chars)
+    for hex_str in new_data("hex_num", total=100, as_array=True):
+        assert hex_str.startswith("0x") and 0 <= int(hex_str, 16) <= 0xFFFFFF
+    assert new_data("hex_num").startswith("0x")
+
+
+def test_seeded():
+    random.seed(1)
+    a = new_data("ints", total=50, as_array=True)
+    random.seed(1)
+    assert (a == new_data("ints", total=50, as_array=True)).all()
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        new_data("bytes")
+    with pytest.raises(ValueError):
+        new_data("ints", total=-1)
+
+
+def write_ints(path, values, dtype="<i2") -> str:
+    np.asarray(values, dtype=dtype).tofile(path)
+    return str(path)
+
+
+def test_map_file(tmp_path):
+    file_name = write_ints(tmp_path / "a.raw", range(100))
+    data = map_file(file_name, dtype="<i2")
+    assert isinstance(data, np.memmap)
+    assert data.tolist() == list(range(100))
+    assert map_file(file_name, dtype="<i2", offset=20).tolist() == list(range(10, 100))
+    # a trailing partial value is ignored
+    with open(file_name, "ab") as file:
+        file.write(b"\x01")
+    assert len(map_file(file_name, dtype="<i2")) == 100
+
+
+def test_map_file_modes(tmp_path):
+    file_name = write_ints(tmp_path / "a.raw", range(100))
+    assert map_file(file_name, "<i2", total=10, mode="head").tolist() == list(range(10))
+    stride = map_file(file_name, "<i2", total=10, mode="stride")
+    assert stride.tolist() == list(range(0, 100, 10))
+    mean = map_file(file_name, "<i2", total=10, mode="mean")
+    assert mean.tolist() == [n + 4.5 for n in range(0, 100, 10)]
+    # never more than total values
+    assert len(map_file(file_name, "<i2", total=30, mode="stride")) <= 30
+    # shorter files aren't padded
+    assert len(map_file(file_name, "<i2", total=500)) == 100
+
+
+def test_map_file_errors(tmp_path):
+    file_name = write_ints(tmp_path / "a.raw", range(10))
+    with pytest.raises(ValueError):
+        map_file(file_name, mode="tail")
+    with pytest.raises(ValueError):
+        map_file(file_name, offset=100)
+    with pytest.raises(ValueError):
+        map_file(file_name, total=0)
+
+
+def test_map_file_melody(tmp_path):
+    file_name = write_ints(tmp_path / "a.raw", np.arange(-500, 500))
+    data = map_file(file_name, dtype="<i2", total=64)
+    melody = Generate(seed=0).new_melody(raw_data=data, data_type="int")
+    assert len(melody.notes) == len(data)
+    assert data.tolist() == np.arange(-500, 500)[::16].tolist()
@@ -0,0 +1,78 @@
+"""
+fixed-seed regression tests. if a change to Generate is meant to change its
+output, update these values. otherwise they should never change.
+"""
+
+from copy import deepcopy
+
+from core.constants import SCALES, SETS
+from core.generate import Generate
+from core.sources import get_root
+
+
+def test_pick_root():
+    assert Generate(seed=0).pick_root() == (
+        ["C#", "D", "Eb", "E", "F", "F#", "G", "Bb"],
+        "set 8-3 transposed to C#",
+    )
+    assert Generate(seed=1).pick_root() == (
+        ["D", "E", "F", "G", "A", "B", "C#"],
+        "D Mel Min Ascending",
+    )
+
+
+def is_transposition(pcs: list, prime: list) -> bool:
+    dist = (pcs[0] - prime[0]) % 12
+    return pcs == [(pc + dist) % 12 for pc in prime]
+
+
+def test_roots_start_on_their_transposition():
+    for seed in range(50):
+        gen = Generate(seed=seed)
+        mode, pcs, notes = gen.pick_scale()
+        assert is_transposition(pcs, SCALES[mode])
+        assert notes == list(get_root(pcs))
+        fn, pcs, notes = gen.pick_set()
+        assert is_transposition(pcs, SETS[fn])
+        assert notes == list(get_root(pcs))
+        root, info = gen.pick_root()
+        if info.startswith("set"):
+            assert info.endswith(f"transposed to {root[0]}")
+        elif not info.startswith("invented"):
+            assert info.startswith(f"{root[0]} ")
+
+
+def test_tables_are_not_modified():
+    sets, scales = deepcopy(SETS), deepcopy(SCALES)
+    gen = Generate(seed=0)
+    for _ in range(100):
+        gen.pick_root()
+    assert sets == SETS and scales == SCALES
+
+
+def test_new_notes():
+    notes, info, source = Generate(seed=1).new_notes(total=8)
+    assert notes == ["G#2", "Bb3", "F2", "G#3", "G#3", "F2", "Bb3", "D2"]
+    assert info == [
+        "invented scale: ['F', 'G#', 'Bb', 'B', 'D'] pcs: [5, 8, 10, 11, 2]"
+    ]
+    assert source == ["F2", "G#2", "Bb2", "B2", "D2", "F3", "G#3", "Bb3"]
+
+
+def test_new_rhythms_and_dynamics():
+    gen = Generate(seed=2)
+    assert gen.new_rhythms(8, 60.0) == [4.0, 4.0, 2.0, 1.0, 0.125, 0.125, 0.25, 0.25]
+    assert gen.new_dynamics(8) == [24, 24, 68, 0, 0, 40, 40, 0]
+
+
+def test_new_melody():
+    melody = Generate(seed=3).new_melody(tempo=60.0, total=6)
+    assert melody.notes == ["C#2", "F2", "A2", "A2", "F#2", "Eb2"]
+    assert list(melody.rhythms) == [0.25, 0.5, 0.25, 4.0, 1.0, 1.0]
+    assert melody.dynamics == [108, 112, 0, 0, 44, 116]
+
+
+def test_same_seed_same_output():
+    a, b = Generate(seed=5), Generate(seed=5)
+    for _ in range(5):
+        assert a.new_melody(total=20).notes == b.new_melody(total=20).notes
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _loaded(code: str) -> list[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return out.stdout.split()
+
+
+def test_generate_defers_heavy_imports():
+    mods = ["names", "mido", "pretty_midi", "numpy", "urllib.request", "core.pitch"]
+    code = f"import sys, core.generate; print(*[m in sys.modules for m in {mods}])"
+    assert _loaded(code) == ["False"] * len(mods)
+
+
+def test_is_array_without_numpy():
+    code = (
+        "import sys; from utils.tools import is_array; "
+        "print(is_array([1]), 'numpy' in sys.modules); "
+        "import numpy; print(is_array(numpy.zeros(2)))"
+    )
+    assert _loaded(code) == ["False", "False", "True"]
@@ -0,0 +1,55 @@
+from collections import Counter
+from itertools import combinations
+from random import Random
+
+from core.analyze import Analyze
+from core.constants import NOTES
+from containers.composition import Composition
+from containers.melody import Melody
+from core.setclass import interval_vector, to_mask
+
+
+def naive_vector(pcs) -> list[int]:
+    vector = [0] * 6
+    for a, b in combinations(sorted(set(pcs)), 2):
+        ic = min((b - a) % 12, (a - b) % 12)
+        vector[ic - 1] += 1
+    return vector
+
+
+def test_interval_vector():
+    assert interval_vector(to_mask([0, 4, 7])) == [0, 0, 1, 1, 1, 0]
+    for mask in range(4096):
+        pcs = [pc for pc in range(12) if mask >> pc & 1]
+        assert interval_vector(mask) == naive_vector(pcs)
+
+
+def test_get_interval_vector():
+    assert Analyze().get_interval_vector(["C4", "E4", "G4"]) == {
+        1: 0,
+        2: 0,
+        3: 1,
+        4: 1,
+        5: 1,
+        6: 0,
+    }
+
+
+def test_interval_histogram():
+    rng = Random(0)
+    notes = [rng.choice(NOTES[20:60]) for _ in range(500)]
+    analyze = Analyze()
+    intervals = analyze.get_intervals(notes)
+    assert analyze.get_interval_histogram(notes) == dict(Counter(intervals))
+    classes = Counter(min(abs(i) % 12, 12 - abs(i) % 12) for i in intervals)
+    assert analyze.get_interval_histogram(notes, ic=True) == dict(classes)
+
+
+def test_comp_interval_histogram():
+    a, b = Melody(), Melody()
+    a.notes = ["C4", "D4", "E4"]
+    b.notes = ["C4", "B3"]
+    comp = Composition()
+    comp.add_part(a, "Violin")
+    comp.add_part([b], "Viola")
+    assert Analyze().get_comp_interval_histogram(comp) == {-1: 1, 2: 2}
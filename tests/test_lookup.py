@@ -0,0 +1,45 @@
+import pytest
+
+from core.constants import NOTES, PITCH_CLASSES
+from core.lookup import (
+    midi_to_note,
+    note_to_index,
+    note_to_midi,
+    note_to_pc,
+    notes_to_indices,
+)
+
+
+def test_note_to_index_matches_notes():
+    for i, note in enumerate(NOTES):
+        assert note_to_index(note) == i
+
+
+def test_enharmonic_spellings():
+    assert note_to_index("Db4") == note_to_index("C#4")
+    assert note_to_index("Cb4") == note_to_index("B3")
+    assert note_to_index("B#3") == note_to_index("C4")
+
+
+def test_midi_round_trip():
+    assert note_to_midi("A0") == 21
+    assert note_to_midi("C4") == 60
+    assert midi_to_note(60) == "C4"
+    for num in range(21, 109):
+        assert note_to_midi(midi_to_note(num)) == num
+
+
+def test_note_to_pc():
+    for pc, name in enumerate(PITCH_CLASSES):
+        assert note_to_pc(name) == pc
+        assert note_to_pc(f"{name}4") == pc
+    assert note_to_pc("Db") == 1
+
+
+def test_invalid_notes():
+    with pytest.raises(ValueError):
+        note_to_index("H4")
+    with pytest.raises(ValueError):
+        notes_to_indices(["C4", "X9"])
+    with pytest.raises(ValueError):
+        midi_to_note(20)
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+from random import Random
+
+import numpy as np
+import pytest
+
+from utils.mapping import (
+    chars_to_indices,
+    float_to_int,
+    hex_to_indices,
+    hex_to_int_list,
+    letters_to_numbers,
+    map_data,
+    map_data_array,
+    scale_the_scale,
+)
+
+rng = Random(0)
+INTS = [rng.randint(0, 500) for _ in range(300)]
+FLOATS = [rng.uniform(0.001, 500.001) for _ in range(300)]
+CHARS = [rng.choice("abcXYZ019 ?!") for _ in range(300)]
+HEX = ["0x" + format(rng.randint(0, 16777215), "x") for _ in range(50)]
+
+
+def test_arrays_match_list_helpers():
+    assert map_data_array(INTS, "int").tolist() == scale_the_scale(list(INTS))
+    assert map_data_array(FLOATS, "float").tolist() == scale_the_scale(
+        float_to_int(FLOATS)
+    )
+    assert chars_to_indices(CHARS).tolist() == letters_to_numbers(CHARS)
+    assert chars_to_indices("".join(CHARS)).tolist() == letters_to_numbers(CHARS)
+    expected = [i for hex_str in HEX for i in hex_to_int_list(hex_str)]
+    assert hex_to_indices(HEX).tolist() == expected
+    assert hex_to_indices(HEX[0]).tolist() == hex_to_int_list(HEX[0])
+
+
+def test_list_input_stays_a_list():
+    for data, data_type in ((INTS, "int"), (FLOATS, "float"), (CHARS, "chars")):
+        res = map_data(data, data_type)
+        assert isinstance(res, list)
+        assert res == map_data_array(data, data_type).tolist()
+    assert map_data(HEX[0], "hex") == hex_to_int_list(HEX[0])
+
+
+def test_input_is_not_modified():
+    ints = list(INTS)
+    map_data(ints, "int")
+    assert ints == INTS
+    array = np.array(INTS)
+    map_data(array, "int")
+    assert array.tolist() == INTS
+
+
+def test_buffers():
+    data = bytes(range(256))
+    indices = map_data(data, "int")
+    assert isinstance(indices, np.ndarray)
+    assert indices.tolist() == scale_the_scale(list(data))
+    assert (indices >= 0).all() and (indices < len(data)).all()
+
+
+def test_invalid_data_type():
+    with pytest.raises(ValueError):
+        map_data(INTS, "complex")
+    with pytest.raises(ValueError):
+        map_data_array(INTS, "complex")
+
+
+def test_list_input_does_not_import_numpy():
+    code = (
+        "import sys; from core.generate import Generate; "
+        "Generate(seed=0).new_melody(raw_data=[1, 2, 3, 400], data_type='int'); "
+        "print('numpy' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip().splitlines()[-1] == "False"
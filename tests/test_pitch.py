@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from core import pitch
+
+
+def test_indices_round_trip():
+    notes = ["C4", "Eb4", "G4", "Bb2"]
+    assert pitch.to_notes(pitch.to_indices(notes)) == notes
+
+
+def test_to_notes_out_of_range():
+    with pytest.raises(ValueError):
+        pitch.to_notes(np.array([-1, 3]))
+
+
+def test_transpose():
+    pcs = np.array([0, 4, 7, 11])
+    assert pitch.transpose(pcs, 2).tolist() == [2, 6, 9, 1]
+    assert pitch.transpose(pcs, 2, oct_eq=False).tolist() == [2, 6, 9, 13]
+    assert pitch.transpose(pcs, np.array([1, 1, 0, 0])).tolist() == [1, 5, 7, 11]
+    with pytest.raises(ValueError):
+        pitch.transpose(pcs, np.array([1, 2]))
+
+
+def test_intervals_invert_retrograde():
+    indices = np.array([10, 14, 17, 12])
+    assert pitch.intervals(indices).tolist() == [4, 3, -5]
+    assert pitch.invert(indices).tolist() == [10, 6, 3, 8]
+    assert pitch.retrograde(indices).tolist() == [12, 17, 14, 10]
@@ -0,0 +1,42 @@
+from random import Random
+
+import pytest
+
+from core.constants import NOTES, RANGE
+from core.lookup import note_to_midi
+from core.ranges import in_range, notes_in_range, sample_in_range
+
+
+def test_in_range_matches_range_lists():
+    for instrument, notes in RANGE.items():
+        for note in NOTES:
+            expected = note in notes
+            assert in_range(note, instrument) == expected
+            assert in_range(note_to_midi(note), instrument) == expected
+
+
+def test_gaps_are_out_of_range():
+    assert in_range("G5", "Oboe")
+    assert not in_range("A5", "Oboe")
+    assert in_range("C6", "Oboe")
+
+
+def test_enharmonic_spellings():
+    assert in_range("Db4", "Flute") == in_range("C#4", "Flute")
+    assert not in_range("X4", "Flute")
+
+
+def test_notes_in_range():
+    notes = ["C2", "C4", "E4", "C4", "G7"]
+    assert notes_in_range(notes, "Flute") == ["C4", "E4", "C4"]
+    with pytest.raises(ValueError):
+        notes_in_range(notes, "Kazoo")
+
+
+def test_sample_in_range():
+    notes = ["C2", "C4", "E4", "G7"]
+    picks = sample_in_range(notes, "Flute", 500, Random(0))
+    assert set(picks) == {"C4", "E4"}
+    assert picks == sample_in_range(notes, "Flute", 500, Random(0))
+    with pytest.raises(ValueError):
+        sample_in_range(["C1", "C8"], "Flute", 5, Random(0))
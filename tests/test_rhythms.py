@@ -0,0 +1,77 @@
+import copy
+import pickle
+from itertools import accumulate
+from random import Random
+
+from containers.melody import Melody
+from containers.rhythms import Rhythms
+
+
+def check(rhythms: Rhythms, reference: list) -> None:
+    assert list(rhythms) == reference
+    assert abs(rhythms.total() - sum(reference)) < 1e-9
+    expected = [0.0] + list(accumulate(reference))[:-1] if reference else []
+    assert all(abs(a - b) < 1e-9 for a, b in zip(rhythms.onsets(), expected))
+    assert len(rhythms.onsets()) == len(reference)
+
+
+def test_mutations_keep_totals_and_onsets_current():
+    rng = Random(0)
+    rhythms = Rhythms([0.5, 1.0, 0.25])
+    reference = [0.5, 1.0, 0.25]
+    for _ in range(2000):
+        op = rng.randrange(9)
+        value = rng.choice([0.125, 0.25, 0.5, 1.0, 2.0])
+        if op == 0:
+            rhythms.append(value)
+            reference.append(value)
+        elif op == 1:
+            rhythms.extend([value, value])
+            reference.extend([value, value])
+        elif op == 2 and reference:
+            i = rng.randrange(-len(reference), len(reference))
+            rhythms[i] = value
+            reference[i] = value
+        elif op == 3 and reference:
+            i = rng.randrange(-len(reference), len(reference))
+            assert rhythms.pop(i) == reference.pop(i)
+        elif op == 4:
+            i = rng.randrange(-len(reference) - 1, len(reference) + 1)
+            rhythms.insert(i, value)
+            reference.insert(i, value)
+        elif op == 5 and reference:
+            i = rng.randrange(len(reference))
+            del rhythms[i : i + 2]
+            del reference[i : i + 2]
+        elif op == 6:
+            rhythms.reverse()
+            reference.reverse()
+        elif op == 7:
+            rhythms.sort()
+            reference.sort()
+        elif op == 8 and len(reference) > 50:
+            rhythms.clear()
+            reference.clear()
+        # read onsets part of the time, so later changes have to invalidate them
+        if rng.random() < 0.3:
+            check(rhythms, reference)
+    check(rhythms, reference)
+
+
+def test_copy_and_pickle():
+    rhythms = Rhythms([0.5, 1.0])
+    for clone in (copy.copy(rhythms), copy.deepcopy(rhythms)):
+        assert isinstance(clone, Rhythms)
+        check(clone, [0.5, 1.0])
+    clone = pickle.loads(pickle.dumps(rhythms))
+    check(clone, [0.5, 1.0])
+
+
+def test_melody_duration_follows_rhythms():
+    melody = Melody()
+    melody.rhythms = [1.0, 0.5]
+    assert isinstance(melody.rhythms, Rhythms)
+    assert melody.duration() == 1.5
+    melody.rhythms.append(2.0)
+    assert melody.duration() == 3.5
+    assert list(melody.onsets()) == [0.0, 1.0, 1.5]
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from core.serial import get_matrix, matrices, to_row
+
+ROW = [0, 11, 7, 8, 3, 1, 2, 10, 6, 5, 4, 9]
+
+
+def test_forms():
+    m = get_matrix(ROW)
+    assert m.P(0).tolist() == ROW
+    assert m.I(0).tolist() == [0, 1, 5, 4, 9, 11, 10, 2, 6, 7, 8, 3]
+    assert m.R(0).tolist() == ROW[::-1]
+    assert m.RI(0).tolist() == m.I(0).tolist()[::-1]
+    assert m.P(3).tolist() == [(pc + 3) % 12 for pc in ROW]
+
+
+def test_every_row_and_column_is_a_row():
+    m = get_matrix(ROW)
+    for n in range(12):
+        assert sorted(m.P(n).tolist()) == list(range(12))
+        assert sorted(m.I(n).tolist()) == list(range(12))
+    assert len(m.forms()) == 48
+
+
+def test_matrices_are_cached_and_read_only():
+    m = get_matrix(ROW)
+    assert get_matrix(list(ROW)) is m
+    with pytest.raises(ValueError):
+        m.matrix[0, 0] = 1
+
+
+def test_bulk_matrices_match_single():
+    rng = np.random.default_rng(0)
+    rows = np.array([rng.permutation(12) for _ in range(20)])
+    bulk = matrices(rows)
+    for row, matrix in zip(rows, bulk):
+        assert (matrix == get_matrix(row.tolist()).matrix).all()
+
+
+def test_invalid_rows():
+    with pytest.raises(ValueError):
+        to_row([0, 1, 2])
+    with pytest.raises(ValueError):
+        to_row([0] * 12)
@@ -0,0 +1,72 @@
+from itertools import combinations
+from random import Random
+
+from core.analyze import Analyze
+from core.constants import SETS
+from core.setclass import (
+    forte_number,
+    invert_mask,
+    normal_order,
+    prime_form,
+    to_mask,
+    to_pcs,
+    transpose_mask,
+)
+
+
+def naive_find_set(pcs):
+    """brute force: find a SETS entry that's a transposition of the set"""
+    target = sorted(set(pc % 12 for pc in pcs))
+    for name, prime in SETS.items():
+        for n in range(12):
+            if sorted((pc + n) % 12 for pc in prime) == target:
+                return name
+    return None
+
+
+def test_mask_round_trip():
+    assert to_pcs(to_mask([7, 0, 4, 4, 16])) == [0, 4, 7]
+
+
+def test_normal_order_and_prime_form():
+    assert normal_order(to_mask([7, 0, 4])) == [0, 4, 7]
+    assert prime_form(to_mask([0, 4, 7])) == [0, 3, 7]
+    assert prime_form(to_mask([2, 6, 9])) == [0, 3, 7]
+
+
+def test_prime_form_is_transposition_and_inversion_invariant():
+    for size in (3, 5, 7):
+        for pcs in list(combinations(range(12), size))[::17]:
+            mask = to_mask(pcs)
+            prime = prime_form(mask)
+            assert prime[0] == 0
+            assert prime_form(to_mask(prime)) == prime
+            assert prime_form(invert_mask(mask)) == prime
+            for n in range(12):
+                assert prime_form(transpose_mask(mask, n)) == prime
+
+
+def test_every_5_to_9_note_set_has_a_forte_number():
+    for size in range(5, 10):
+        for pcs in combinations(range(12), size):
+            assert forte_number(to_mask(pcs)) is not None
+
+
+def test_forte_numbers_match_brute_force():
+    rng = Random(0)
+    for _ in range(500):
+        pcs = rng.sample(range(12), rng.randint(5, 9))
+        assert forte_number(to_mask(pcs)) == naive_find_set(pcs)
+
+
+def test_sets_entries_map_to_themselves():
+    for name, prime in SETS.items():
+        assert forte_number(to_mask(prime)) == name
+
+
+def test_find_sets_matches_find_set():
+    analyze = Analyze()
+    rng = Random(1)
+    melody = [rng.randint(0, 11) for _ in range(200)]
+    windows = [melody[i : i + 6] for i in range(len(melody) - 5)]
+    assert analyze.find_sets(melody, 6) == [analyze.find_set(w) for w in windows]
@@ -0,0 +1,74 @@
+import pytest
+
+from core.generate import Generate
+from containers.chord import Chord
+from containers.composition import Composition
+from utils.midi import export_midi, export_midi_stream
+from utils.smf import decode_var_int, encode_var_int, read_notes, ticks_to_seconds
+
+
+def new_composition() -> Composition:
+    gen = Generate(seed=4)
+    comp = Composition(title="test", tempo=90.0)
+    melody = gen.new_melody(tempo=90.0, total=40)
+    melody.instrument = "Violin"
+    comp.add_part(melody, "Violin")
+    chords = []
+    for rhythm in (1.0, 0.5, 2.0):
+        chord = Chord(instrument="Acoustic Grand Piano", tempo=90.0)
+        chord.notes = ["C3", "E3", "G3"]
+        chord.rhythm = rhythm
+        chord.dynamic = 80
+        chords.append(chord)
+    comp.add_part(chords, "Acoustic Grand Piano")
+    return comp
+
+
+def test_var_int_round_trip():
+    for value in (0, 1, 127, 128, 8191, 16383, 16384, 2**21, 2**28 - 1):
+        data = b"\xff" + encode_var_int(value) + b"\xff"
+        assert decode_var_int(data, 1) == (value, len(data) - 1)
+    assert encode_var_int(0x40) == b"\x40"
+    assert encode_var_int(0x2000) == b"\xc0\x00"
+
+
+def test_stream_matches_export(tmp_path):
+    comp = new_composition()
+    export_midi(comp, str(tmp_path / "a.mid"))
+    export_midi_stream(comp, str(tmp_path / "b.mid"))
+    assert (tmp_path / "a.mid").read_bytes() == (tmp_path / "b.mid").read_bytes()
+
+
+def test_read_notes_matches_pretty_midi(tmp_path):
+    from pretty_midi import PrettyMIDI
+
+    file_name = str(tmp_path / "a.mid")
+    export_midi(new_composition(), file_name)
+    resolution, tempos, tracks = read_notes(file_name)
+    pm = PrettyMIDI(file_name)
+    assert resolution == pm.resolution
+    assert len(tempos) == 1 and abs(60e6 / tempos[0][1] - 90.0) < 0.01
+    # pretty_midi skips the tempo track, so only compare tracks with notes
+    tracks = [track for track in tracks if len(track) > 0]
+    assert len(tracks) == len(pm.instruments)
+    for track, inst in zip(tracks, pm.instruments):
+        notes = sorted(inst.notes, key=lambda note: note.start)
+        assert track["pitch"].tolist() == [note.pitch for note in notes]
+        assert track["velocity"].tolist() == [note.velocity for note in notes]
+        assert track["onset"].tolist() == [pm.time_to_tick(n.start) for n in notes]
+        ends = (track["onset"] + track["duration"]).tolist()
+        assert ends == [pm.time_to_tick(note.end) for note in notes]
+
+
+def test_ticks_to_seconds():
+    # 480 ticks per beat: 120 bpm for the first 960 ticks, then 60 bpm
+    tempos = [(0, 500000), (960, 1000000)]
+    seconds = ticks_to_seconds([0, 480, 960, 1440], 480, tempos)
+    assert seconds.tolist() == [0.0, 0.5, 1.0, 2.0]
+
+
+def test_not_a_midi_file(tmp_path):
+    file_name = tmp_path / "a.mid"
+    file_name.write_bytes(b"RIFF0000")
+    with pytest.raises(ValueError):
+        read_notes(str(file_name))
@@ -0,0 +1,68 @@
+import pytest
+
+from core.constants import NOTES
+from core.generate import Generate
+from core.sources import (
+    clear_cache,
+    get_root,
+    get_source_scale,
+    root_pcs,
+    root_source_scale,
+)
+
+
+def test_get_root():
+    assert get_root([0, 4, 7]) == ("C", "E", "G")
+    assert get_root([0, 4, 7], 2) == ("D", "F#", "A")
+    assert get_root([0, 4, 7], 0, 3) == ("C3", "E3", "G3")
+    with pytest.raises(ValueError, match="2-5"):
+        get_root([0, 4, 7], 0, 6)
+
+
+def test_shared_entries():
+    clear_cache()
+    assert get_root([0, 4, 7], 2) is get_root([2, 6, 9])
+    assert get_source_scale([0, 4, 7], 2) is get_source_scale([2, 6, 9])
+
+
+def test_source_scale():
+    scale = get_source_scale([0, 4, 7])
+    assert len(scale) == 12
+    assert scale.notes[:4] == ("C2", "E2", "G2", "C3")
+    assert scale.notes[-1] == "G5"
+    assert [NOTES[i] for i in scale.indices] == list(scale.notes)
+
+
+@pytest.mark.parametrize("low,high", [(2, 2), (3, 4), (4, 5), (5, 5)])
+def test_spans(low, high):
+    full = get_source_scale([1, 5, 8, 11])
+    scale = get_source_scale([1, 5, 8, 11], 0, low, high)
+    expected = [n for n in full.notes if low <= int(n[-1]) <= high]
+    assert list(scale.notes) == expected
+    assert [NOTES[i] for i in scale.indices] == expected
+
+
+def test_invalid_spans():
+    with pytest.raises(ValueError):
+        get_source_scale([0, 4, 7], 0, 1, 5)
+    with pytest.raises(ValueError):
+        get_source_scale([0, 4, 7], 0, 4, 3)
+    with pytest.raises(ValueError):
+        get_source_scale([])
+
+
+def test_root_source_scale_keeps_spelling():
+    assert root_pcs(["Db", "E"]) == (1, 4)
+    scale = root_source_scale(["Db", "E"])
+    assert scale.notes[:2] == ("Db2", "E2")
+    assert list(scale.indices) == list(get_source_scale([1, 4]).indices)
+    with pytest.raises(ValueError):
+        root_pcs(["H"])
+
+
+def test_new_source_scale():
+    source = Generate.new_source_scale(["C", "E", "G"])
+    assert len(source) == 28
+    assert source[:4] == ["C2", "E2", "G2", "C3"]
+    # roots keep their own spelling
+    assert Generate.new_source_scale(["Db", "F"])[:2] == ["Db2", "F2"]
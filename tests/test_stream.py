@@ -0,0 +1,71 @@
+import os
+from itertools import islice
+
+import pytest
+
+from core.generate import Generate
+from utils.data import iter_chars, iter_csv_column
+from utils.midi import export_melody_stream
+from utils.smf import read_notes
+
+
+def values():
+    """an endless stream of ints"""
+    n = 0
+    while True:
+        yield n * 7 % 300
+        n += 1
+
+
+def test_melodies_share_tempo_and_instrument():
+    stream = Generate(seed=0).new_melody_stream(values(), "int", chunk=32)
+    melodies = list(islice(stream, 5))
+    assert len({m.tempo for m in melodies}) == 1
+    assert len({m.instrument for m in melodies}) == 1
+    assert melodies[0].instrument != "None"
+    for melody in melodies:
+        assert len(melody.notes) == len(melody.rhythms) == len(melody.dynamics)
+        assert len(melody.source_data) == 32
+
+
+def test_instrument_and_tempo():
+    stream = Generate(seed=0).new_melody_stream(
+        range(100), "int", chunk=40, tempo=90.0, instrument="Cello"
+    )
+    melodies = list(stream)
+    assert [len(m.source_data) for m in melodies] == [40, 40, 20]
+    assert all(m.instrument == "Cello" and m.tempo == 90.0 for m in melodies)
+
+
+def test_export_melody_stream(tmp_path):
+    file_name = str(tmp_path / "a.mid")
+    melodies = list(
+        Generate(seed=1).new_melody_stream(range(200), "int", chunk=50, tempo=60.0)
+    )
+    total = export_melody_stream(iter(melodies), file_name)
+    expected = sum(1 for m in melodies for d in m.dynamics if d > 0)
+    assert total == expected
+    _, _, tracks = read_notes(file_name)
+    assert sum(len(track) for track in tracks) == expected
+
+
+def test_bad_instrument_leaves_no_file(tmp_path):
+    file_name = str(tmp_path / "a.mid")
+    stream = Generate(seed=1).new_melody_stream(range(10), "int")
+    with pytest.raises(ValueError):
+        export_melody_stream(stream, file_name, instrument="Kazoo")
+    assert not os.path.exists(file_name)
+
+
+def test_file_sources(tmp_path):
+    csv_file = tmp_path / "a.csv"
+    csv_file.write_text("a,b\n1,2.5\n3,x\n5,6.5\n")
+    assert list(iter_csv_column(str(csv_file), "b")) == [2.5, 6.5]
+    assert list(iter_csv_column(str(csv_file), 0, int)) == [1, 3, 5]
+    text_file = tmp_path / "a.txt"
+    text_file.write_text("hello world")
+    assert "".join(iter_chars(str(text_file), block=3)) == "hello world"
+    melodies = list(
+        Generate(seed=2).new_melody_stream(iter_chars(str(text_file)), "chars")
+    )
+    assert len(melodies) == 1
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from core.generate import Generate
+from containers.chord import Chord
+from containers.composition import Composition
+from utils.txtfile import (
+    PART_HEADER,
+    gen_info_doc,
+    gen_info_doc_async,
+    gen_info_jsonl,
+    render_info_doc,
+)
+
+
+def new_composition() -> Composition:
+    gen = Generate(seed=8)
+    comp = Composition(title="test piece", composer="someone", tempo=60.0)
+    melody = gen.new_melody(tempo=60.0, total=12)
+    melody.instrument = "Flute"
+    comp.add_part(melody, "Flute")
+    chords = []
+    for notes in (["C3", "E3", "G3"], ["D3", "F3", "A3"]):
+        chord = Chord()
+        chord.notes = notes
+        chord.rhythm = 1.0
+        chord.dynamic = 80
+        chords.append(chord)
+    comp.add_part(chords, "Acoustic Grand Piano")
+    return comp
+
+
+def test_render_info_doc():
+    comp = new_composition()
+    doc = render_info_doc(comp, data=[1, 2, 3])
+    assert "test piece" in doc and "someone" in doc
+    assert "Data inputted: 1, 2, 3" in doc
+    # one header per part, even for a list of chords
+    assert doc.count(PART_HEADER) == 2
+    melody, chords = comp.parts.values()
+    assert str(melody.notes) in doc
+    assert all(str(chord.notes) in doc for chord in chords)
+
+
+def test_gen_info_doc(tmp_path):
+    comp = new_composition()
+    file_name = tmp_path / "a.txt"
+    gen_info_doc(str(file_name), comp)
+    assert file_name.read_text() == render_info_doc(comp)
+
+
+def test_gen_info_jsonl(tmp_path):
+    comp = new_composition()
+    file_name = tmp_path / "a.jsonl"
+    gen_info_jsonl(str(file_name), comp)
+    records = [json.loads(line) for line in file_name.read_text().splitlines()]
+    assert [r["type"] for r in records] == ["composition", "melody", "chord", "chord"]
+    assert records[0]["seconds"] == comp._duration()
+    melody = list(comp.parts.values())[0]
+    assert records[1]["rhythms"] == list(melody.rhythms)
+    assert records[2]["pcs"] == []
+
+
+def test_async_writer(tmp_path):
+    comp = new_composition()
+    file_name = tmp_path / "a.txt"
+    assert gen_info_doc_async(str(file_name), comp).result() is None
+    assert file_name.read_text() == render_info_doc(comp)
+
+
+def test_async_writer_errors(tmp_path):
+    writer = gen_info_doc_async(str(tmp_path / "missing" / "a.txt"), new_composition())
+    with pytest.raises(FileNotFoundError):
+        writer.result()
@@ -0,0 +1,32 @@
+from core.constants import WORD_LIST
+from core.generate import Generate
+from utils.words import get_words, load_words, word_list_path
+
+
+def test_env_list_is_used(tmp_path, monkeypatch):
+    path = tmp_path / "words.txt"
+    path.write_text("alpha\nbeta\n\ngamma\n")
+    monkeypatch.setenv("ANIMA_WORD_LIST", str(path))
+    assert word_list_path() == str(path)
+    assert get_words() == ("alpha", "beta", "gamma")
+    assert set(Generate(seed=0).new_title().split()) <= {"alpha", "beta", "gamma"}
+
+
+def test_words_are_memoized(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("one\ntwo\n")
+    first = load_words(str(path))
+    path.write_text("three\n")
+    assert load_words(str(path)) is first
+
+
+def test_bundled_list_is_not_empty():
+    words = load_words(WORD_LIST)
+    assert len(words) > 100
+
+
+def test_titles_are_seeded(monkeypatch):
+    monkeypatch.setenv("ANIMA_WORD_LIST", WORD_LIST)
+    title = Generate(seed=3).new_title()
+    assert Generate(seed=3).new_title() == title
+    assert 2 <= len(title.split()) <= 4
@@ -0,0 +1,209 @@
+"""
+An on-disk cache for MIDI analysis results (see Analyze.analyze_midi()).
+
+Each entry is a .npz file named after a hash of the MIDI file it came from,
+so re-analyzing an archive only reads files that have changed:
+
+    - by content (the default): a hash of the file's bytes. renamed or
+      copied files still hit, and any edit is a miss.
+    - by stat: a hash of the file's path, size, and modification time.
+      cheaper, since the file isn't read, but a touched file is a miss.
+
+The cache is bounded in size. Entries are touched when they're read, and the
+least recently used ones are deleted first once the cache grows past
+max_bytes. Bumping CACHE_VERSION invalidates every existing entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from os.path import abspath, join
+
+import numpy as np
+
+from core.constants import ANALYSIS_CACHE
+
+# part of every key, so results from an older format are never read back
+CACHE_VERSION = 1
+
+# default size limit (bytes)
+MAX_BYTES = 512 * 1024 * 1024
+
+
+class AnalysisCache:
+    """
+    Usage:
+        cache = AnalysisCache()
+        res = analyze.analyze_midi(file_name, cache=cache)
+
+    or directly:
+        res = cache.get(file_name)
+        if res is None:
+            res = ...
+            cache.put(file_name, res)
+    """
+
+    def __init__(
+        self, folder: str = None, max_bytes: int = MAX_BYTES, by_content: bool = True
+    ):
+        self.folder = ANALYSIS_CACHE if folder is None else folder
+        self.max_bytes = max_bytes
+        self.by_content = by_content
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.folder, exist_ok=True)
+        self.size = sum(size for _, _, size in self._entries())
+
+    ### Keys ###
+
+    def key(self, file_name: str) -> str:
+        """
+        returns the cache key of a MIDI file
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"v{CACHE_VERSION}:".encode())
+        if self.by_content:
+            with open(file_name, "rb") as file:
+                for block in iter(lambda: file.read(1 << 20), b""):
+                    digest.update(block)
+        else:
+            stat = os.stat(file_name)
+            digest.update(
+                f"{abspath(file_name)}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+            )
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return join(self.folder, f"{key}.npz")
+
+    ### Entries ###
+
+    def get(self, file_name: str, key: str = None) -> dict | None:
+        """
+        returns the cached analysis of a MIDI file, or None on a miss.
+        pass the file's key() if it's already known, so it isn't hashed again.
+        """
+        path = self._path(self.key(file_name) if key is None else key)
+        try:
+            with np.load(path) as data:
+                res = _unpack(data)
+        except (OSError, KeyError, ValueError):
+            # missing, or a partial/corrupt entry
+            self.misses += 1
+            return None
+        # mark as recently used. another process may have evicted it since.
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return res
+
+    def put(self, file_name: str, res: dict, key: str = None) -> None:
+        """
+        stores the analysis of a MIDI file, evicting old entries if needed.
+        pass the file's key() if it's already known, so it isn't hashed again.
+        """
+        path = self._path(self.key(file_name) if key is None else key)
+        # write to a temp file first so other processes never read a partial entry
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as file:
+            np.savez(file, **_pack(res))
+        try:
+            self.size -= os.path.getsize(path)
+        except FileNotFoundError:
+            pass
+        size = os.path.getsize(tmp)
+        os.replace(tmp, path)
+        self.size += size
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def invalidate(self, file_name: str) -> bool:
+        """
+        removes a MIDI file's entry. returns True if there was one.
+        """
+        path = self._path(self.key(file_name))
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        self.size -= size
+        return True
+
+    def clear(self) -> None:
+        """
+        removes every entry
+        """
+        for path, _, _ in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.size = 0
+
+    def evict(self) -> None:
+        """
+        deletes the least recently used entries until the cache
+        is back under max_bytes
+        """
+        # re-scan, since other processes may share this folder
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self.size = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self.size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.size -= size
+
+    def _entries(self) -> list[tuple[str, int, int]]:
+        """returns (path, last used, size) of every entry"""
+        entries = []
+        with os.scandir(self.folder) as found:
+            for entry in found:
+                if entry.name.endswith(".npz"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue  # removed by another process
+                    entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        return entries
+
+
+def _pack(res: dict) -> dict:
+    """flattens an analysis dict into named arrays for np.savez()"""
+    tracks = list(res["Notes"])
+    arrays = {
+        "tempo": np.array(res["Tempo"]),
+        "resolution": np.array(res["Resolution"]),
+        "tracks": np.array(tracks, dtype=str),
+    }
+    for i, track in enumerate(tracks):
+        arrays[f"notes_{i}"] = res["Notes"][track]
+        arrays[f"onsets_{i}"] = res["Onsets"][track]
+        arrays[f"durations_{i}"] = res["Durations"][track]
+        arrays[f"pcs_{i}"] = res["Pitch Classes"][track]
+    return arrays
+
+
+def _unpack(data) -> dict:
+    """rebuilds an analysis dict from _pack()'s arrays"""
+    res = {
+        "Tempo": int(data["tempo"]),
+        "Resolution": int(data["resolution"]),
+        "Notes": {},
+        "Onsets": {},
+        "Durations": {},
+        "Pitch Classes": {},
+    }
+    for i, track in enumerate(data["tracks"].tolist()):
+        res["Notes"][track] = data[f"notes_{i}"]
+        res["Onsets"][track] = data[f"onsets_{i}"]
+        res["Durations"][track] = data[f"durations_{i}"]
+        res["Pitch Classes"][track] = data[f"pcs_{i}"]
+    return res
@@ -3,38 +3,93 @@ Generate random source data for generative methods.
 
 Outputs list of n length with one of the following data types: list[int],
 list[float], hex str, list[str]
+
+DATA_MAP maps each data type to the function that generates it, so nothing
+is generated until new_data() is called, and every call returns fresh data.
+Each function takes an optional total, so large amounts of data can be made
+in one call, i.e.:
+
+    new_data("ints", total=1_000_000, as_array=True)
+
+as_array=True returns a numpy array (built in one call, without a python
+loop) instead of a list.
+
+iter_csv_column() and iter_chars() read data from files lazily, for
+Generate.new_melody_stream(). map_file() memory-maps a binary file as a numpy
+array, which can be passed to either new_melody() or new_melody_stream().
 """
 
-from random import seed, uniform, randint, choice
+import csv
+import os
+from random import uniform, randint, choice
+from typing import Iterator
 from core.constants import ALPHABET
 
-seed()
+# values used for ints and floats
+INT_RANGE = (0, 500)
+FLOAT_RANGE = (0.001, 500.001)
+HEX_MAX = 16777215
+
+
+def _total(total: int = None) -> int:
+    """returns total, or a random total of 10 - 50 if none is given"""
+    if total is None:
+        return randint(10, 50)
+    if total < 0:
+        raise ValueError(f"total must be non-negative! total: {total}")
+    return total
+
 
+def _np_rng():
+    """a numpy Generator seeded from the random module, so seed() applies"""
+    import numpy as np
 
-def new_ints() -> list[int]:
-    """Generate a list of 10 - 50 random numbers between 0-500"""
-    total = randint(10, 50)
-    return [randint(0, 500) for i in range(total)]
+    return np.random.default_rng(randint(0, 2**63))
 
 
-def new_floats() -> list[float]:
-    """Generate a list of 10 - 50 random floating point numbers between 0 - 200"""
-    total = randint(10, 50)
-    return [uniform(0.001, 500.001) for i in range(total)]
+def new_ints(total: int = None, as_array: bool = False):
+    """Generate a list of 10 - 50 (or total) random numbers between 0-500"""
+    total = _total(total)
+    low, high = INT_RANGE
+    if as_array:
+        return _np_rng().integers(low, high + 1, size=total)
+    return [randint(low, high) for i in range(total)]
 
 
-def new_hex() -> str:
-    """Generates a random hex color number 0x000000 to 0xFFFFFF as a string"""
-    num = randint(0, 16777215)
-    hex_num = format(num, "x")
-    hex_num = "0x" + hex_num
-    return hex_num
+def new_floats(total: int = None, as_array: bool = False):
+    """Generate a list of 10 - 50 (or total) random floats between 0 - 500"""
+    total = _total(total)
+    low, high = FLOAT_RANGE
+    if as_array:
+        return _np_rng().uniform(low, high, size=total)
+    return [uniform(low, high) for i in range(total)]
 
 
-def new_chars() -> list[str]:
-    """Generate a list of 10 - 50 random upper/lower-case characters"""
+def new_hex(total: int = None, as_array: bool = False):
+    """
+    Generates a random hex color number 0x000000 to 0xFFFFFF as a string.
+    if total is given, returns a list (or array) of that many hex strings.
+    """
+    if total is None:
+        return "0x" + format(randint(0, HEX_MAX), "x")
+    total = _total(total)
+    if as_array:
+        import numpy as np
+
+        nums = _np_rng().integers(0, HEX_MAX + 1, size=total)
+        return np.char.add("0x", np.char.mod("%x", nums))
+    return ["0x" + format(randint(0, HEX_MAX), "x") for i in range(total)]
+
+
+def new_chars(total: int = None, as_array: bool = False):
+    """Generate a list of 10 - 50 (or total) random upper/lower-case characters"""
+    total = _total(total)
+    if as_array:
+        import numpy as np
+
+        alphabet = np.array(ALPHABET + [char.upper() for char in ALPHABET])
+        return alphabet[_np_rng().integers(0, len(alphabet), size=total)]
     chars = []
-    total = randint(10, 50)
     for i in range(total):
         char = choice(ALPHABET)
         # Capitalize?
@@ -45,21 +100,100 @@ def new_chars() -> list[str]:
 
 
 DATA_MAP = {
-    "ints": new_ints(),
-    "floats": new_floats(),
-    "chars": new_chars(),
-    "hex_num": new_hex(),
+    "ints": new_ints,
+    "floats": new_floats,
+    "chars": new_chars,
+    "hex_num": new_hex,
 }
 
 
-def new_data(data_type: str):
+def new_data(data_type: str, total: int = None, as_array: bool = False):
     """
     Select and generate some random data for input.
 
+    total sets how much data to generate (by default 10 - 50 items,
+    or a single string for hex_num). as_array returns a numpy array.
     """
-    if data_type not in list(DATA_MAP.keys()):
+    if data_type not in DATA_MAP:
         raise ValueError(
             f"{data_type} is not a valid data type! "
             f"available data types: {list(DATA_MAP.keys())}"
         )
-    return DATA_MAP[data_type]
+    return DATA_MAP[data_type](total=total, as_array=as_array)
+
+
+### FILE SOURCES ###
+
+
+def iter_csv_column(file_name: str, column, dtype=float) -> Iterator:
+    """
+    yields the values of a single CSV column one row at a time.
+    column can be a header name or an index. rows where the value
+    is missing or can't be converted with dtype are skipped.
+    """
+    with open(file_name, newline="") as file:
+        reader = csv.reader(file)
+        if isinstance(column, str):
+            column = next(reader).index(column)
+        for row in reader:
+            try:
+                yield dtype(row[column])
+            except (IndexError, ValueError):
+                continue
+
+
+def iter_chars(file_name: str, block: int = 65536) -> Iterator[str]:
+    """
+    yields every character of a text file (i.e. a log file),
+    reading block characters at a time.
+    """
+    with open(file_name, errors="replace") as file:
+        for text in iter(lambda: file.read(block), ""):
+            yield from text
+
+
+# ways map_file() can shorten a file to a given total
+MAP_MODES = ("stride", "mean", "head")
+
+
+def map_file(
+    file_name: str,
+    dtype="u1",
+    offset: int = 0,
+    total: int = None,
+    mode: str = "stride",
+):
+    """
+    memory-maps a binary file as a read-only numpy array of a given dtype
+    (unsigned bytes by default), starting offset bytes in. nothing is read
+    until values are used, so files can be larger than memory. any trailing
+    bytes that don't make up a whole value are ignored.
+
+    if total is given and the file has more values than that, it's shortened:
+        - "stride": every nth value (a view, nothing is copied)
+        - "mean": the mean of each block of n values (reads the whole file)
+        - "head": the first total values (a view)
+
+    i.e.
+        data = map_file("recording.raw", dtype="<i2", total=2000)
+        melody = gen.new_melody(raw_data=data, data_type="int")
+    """
+    import numpy as np
+
+    if mode not in MAP_MODES:
+        raise ValueError(f"{mode} is not a valid mode! available modes: {MAP_MODES}")
+    dtype = np.dtype(dtype)
+    size = (os.path.getsize(file_name) - offset) // dtype.itemsize
+    if size <= 0:
+        raise ValueError(f"{file_name} has no data after offset {offset}!")
+    data = np.memmap(file_name, dtype=dtype, mode="r", offset=offset, shape=(size,))
+    if total is None or size <= total:
+        return data
+    if total < 1:
+        raise ValueError(f"total must be at least 1! total: {total}")
+    if mode == "head":
+        return data[:total]
+    if mode == "stride":
+        return data[:: -(-size // total)]
+    step = size // total
+    return data[: step * total].reshape(total, step).mean(axis=1)
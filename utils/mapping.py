@@ -1,10 +1,20 @@
 """
 This module handles mapping functions when converting raw data to index numbers,
 which will be used to map against newNotes()'s generated source scale in newMelody()
+
+The *_to_indices() functions do the same mapping with numpy, for large data sets.
+They accept lists, numpy arrays, or buffers (bytes, bytearray, memoryview, etc.),
+read arrays and buffers without copying them, never modify their input, and
+return an index array that can be passed straight to Generate.new_notes().
 """
 
-from containers.melody import Melody
+from functools import lru_cache
+
 from core.constants import ALPHABET
+from utils.tools import is_array
+
+# buffer types that are read directly with np.frombuffer()
+BUFFERS = (bytes, bytearray, memoryview)
 
 
 def float_to_int(data):
@@ -68,21 +78,208 @@ def hex_to_int_list(hex_str: str) -> list[int]:
     return [int(x) for x in str(hex_int)]
 
 
+### NUMPY ###
+
+
+def _as_array(data, dtype=None):
+    """
+    returns data as a 1D numpy array. arrays and buffers are viewed, not copied.
+    """
+    import numpy as np
+
+    if isinstance(data, BUFFERS):
+        return np.frombuffer(data, dtype=np.uint8 if dtype is None else dtype)
+    return np.asarray(data, dtype=dtype).reshape(-1)
+
+
+def _scale_indices(data):
+    """
+    numpy version of scale_the_scale(). returns a new array.
+
+    unlike scale_the_scale(), negative values are wrapped into range
+    as well, since raw binary data often has them.
+    """
+    import numpy as np
+
+    data = data.astype(np.intp, copy=False)
+    limit = len(data) - 1
+    if limit < 1:
+        return np.zeros(len(data), dtype=np.intp)
+    return np.where((data > limit) | (data < 0), data % limit, data)
+
+
+def ints_to_indices(data):
+    """
+    numpy version of scale_the_scale(). buffers are read as uint8 values.
+    """
+    return _scale_indices(_as_array(data))
+
+
+def floats_to_indices(data):
+    """
+    numpy version of scale_the_scale(float_to_int(data)).
+    buffers are read as float64 values.
+    """
+    import numpy as np
+
+    data = _as_array(data, np.float64 if isinstance(data, BUFFERS) else None)
+    # NaN, inf, and anything too large to cast (common when binary data is
+    # read as floats) map to 0
+    data = np.where(np.isfinite(data) & (np.abs(data) < 2**62), data, 0)
+    # casting truncates towards zero, like int()
+    return _scale_indices(data.astype(np.intp))
+
+
+@lru_cache(maxsize=1)
+def _char_table():
+    """
+    lookup table of (ascii) character code -> index number, or -1 for
+    characters letters_to_numbers() skips
+    """
+    import numpy as np
+
+    table = np.full(256, -1, dtype=np.intp)
+    for i, letter in enumerate(ALPHABET):
+        table[ord(letter)] = i
+        table[ord(letter.upper())] = i
+    for digit in range(10):
+        table[ord(str(digit))] = digit
+    return table
+
+
+def _char_codes(letters):
+    """returns character codes for a string, buffer, or list/array of chars"""
+    import numpy as np
+
+    if is_array(letters) and letters.dtype.kind in "US":
+        if letters.dtype.itemsize == (4 if letters.dtype.kind == "U" else 1):
+            dtype = np.uint32 if letters.dtype.kind == "U" else np.uint8
+            return np.ascontiguousarray(letters).reshape(-1).view(dtype)
+        letters = letters.reshape(-1).tolist()
+    if isinstance(letters, list):
+        letters = "".join(c.decode() if isinstance(c, bytes) else c for c in letters)
+    if isinstance(letters, str):
+        letters = letters.encode("utf-8")
+    if isinstance(letters, BUFFERS):
+        return np.frombuffer(letters, dtype=np.uint8)
+    return np.asarray(letters).reshape(-1)
+
+
+def chars_to_indices(letters):
+    """
+    numpy version of letters_to_numbers(). letters are mapped with a lookup
+    table instead of searching ALPHABET for each one.
+
+    letters can be a string, a buffer of ascii bytes, or a list/array of
+    single characters.
+    """
+    import numpy as np
+
+    codes = _char_codes(letters)
+    # anything outside of ascii is skipped
+    codes = np.where(codes < 256, codes, 0)
+    indices = _char_table()[codes]
+    return indices[indices >= 0]
+
+
+@lru_cache(maxsize=1)
+def _hex_table():
+    """lookup table of (ascii) character code -> hex digit value, or -1"""
+    import numpy as np
+
+    table = np.full(256, -1, dtype=np.int64)
+    for digit in "0123456789abcdef":
+        table[ord(digit)] = int(digit, 16)
+        table[ord(digit.upper())] = int(digit, 16)
+    return table
+
+
+def _parse_hex(hex_strs):
+    """
+    parses an array of prefixed hex strings into an int64 array, one
+    character column at a time
+    """
+    import numpy as np
+
+    hex_strs = np.ascontiguousarray(hex_strs, dtype="U")
+    codes = hex_strs.view(np.uint32).reshape(len(hex_strs), -1)
+    # the "0x" prefix and padding map to -1 (the leading 0 is harmless),
+    # so only hex digits are accumulated
+    digits = _hex_table()[np.where(codes < 256, codes, 0)]
+    values = np.zeros(len(hex_strs), dtype=np.int64)
+    for col in range(codes.shape[1]):
+        digit = digits[:, col]
+        values = np.where(digit >= 0, values * 16 + digit, values)
+    return values
+
+
+def hex_to_indices(hex_nums):
+    """
+    numpy version of hex_to_int_list(). hex_nums can be a single prefixed
+    hex string, or a list/array of hex strings or ints. returns the
+    decimal digits of each number, in order, as one array.
+    """
+    import numpy as np
+
+    if isinstance(hex_nums, str):
+        hex_nums = [hex_nums]
+    values = np.asarray(hex_nums).reshape(-1)
+    if values.dtype.kind in "US":
+        values = _parse_hex(values)
+    values = values.astype(np.int64, copy=False)
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.intp)
+    # split each number into its decimal digits, most significant first
+    lengths = np.ones(len(values), dtype=np.int64)
+    for power in range(1, 19):
+        lengths += values >= 10**power
+    width = int(lengths.max())
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    digits = values[:, None] // powers % 10
+    keep = np.arange(width) >= (width - lengths)[:, None]
+    return digits[keep].astype(np.intp)
+
+
+def map_data_array(data, data_type: str):
+    """
+    numpy version of map_data(). returns an index array.
+    """
+    if data_type == "int":
+        return ints_to_indices(data)
+    elif data_type == "float":
+        return floats_to_indices(data)
+    elif data_type == "chars":
+        return chars_to_indices(data)
+    elif data_type == "hex":
+        return hex_to_indices(data)
+    raise ValueError(f"unsupported data type: {data_type}")
+
+
 def map_data(data, data_type: str):
     """
     Wrapper method to map data used by newMelody()
 
-    Returns modified data and modified melody() object, or -1
-    on failure. melody() object has original source data saved.
+    Returns a list[int] of index numbers, or an index array if data is a
+    numpy array or buffer. The supplied data is never modified, so a
+    melody() object can save it as its original source data.
+
+    lists and strings are mapped with the list helpers above, so numpy
+    is only imported for arrays and buffers.
     """
+    if is_array(data) or isinstance(data, BUFFERS):
+        return map_data_array(data, data_type)
     if data_type == "int":
-        data_scaled = scale_the_scale(data)
+        # scale_the_scale() works in place, so give it a copy
+        data_scaled = scale_the_scale(list(data))
     elif data_type == "float":
         data_scaled = scale_the_scale(float_to_int(data))
     elif data_type == "chars":
         data_scaled = letters_to_numbers(data)
     elif data_type == "hex":
-        data_scaled = hex_to_int_list(data)
+        if isinstance(data, str):
+            data_scaled = hex_to_int_list(data)
+        else:
+            data_scaled = [i for hex_str in data for i in hex_to_int_list(hex_str)]
     else:
         raise ValueError(f"unsupported data type: {data_type}")
     return data_scaled
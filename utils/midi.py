@@ -1,18 +1,29 @@
 """
 Utility functions for working with MIDI data and I/O
+
+NOTE: mido and pretty_midi (which pulls in numpy) are imported inside the
+      functions that need them, so importing this module stays cheap.
 """
 
+from __future__ import annotations
+
+from itertools import chain
 from os.path import join
-from mido import MidiFile, MidiTrack, Message, MetaMessage
-from pretty_midi import PrettyMIDI, Instrument
+from typing import TYPE_CHECKING, Iterable
 
 from utils.tools import normalize_str
-from core.constants import INSTRUMENTS, NOTES, MIDI_FOLDER
+from utils.smf import SMFWriter
+from core.constants import INSTRUMENTS, MIDI_FOLDER
+from core.lookup import note_to_midi, midi_to_note
 from containers.note import Note
 from containers.melody import Melody
 from containers.chord import Chord
 from containers.composition import Composition
 
+if TYPE_CHECKING:
+    from mido import MidiFile
+    from pretty_midi import Instrument
+
 
 def is_valid_midi_num(num: int) -> bool:
     """
@@ -33,7 +44,7 @@ def note_name_to_MIDI_num(note: str) -> int:
     so we compensate for the difference in value between the index and the
     MIDI number by adding (or subtracting) 21.
     """
-    return NOTES.index(note) + 21
+    return note_to_midi(note)
 
 
 def MIDI_num_to_note_name(num: int) -> str:
@@ -41,9 +52,7 @@ def MIDI_num_to_note_name(num: int) -> str:
     returns the corresponding note name string from a
     given MIDI note number.
     """
-    if num < 21 or num > 108:
-        raise ValueError("MIDI number must be between 21 and 108")
-    return NOTES[num - 21]
+    return midi_to_note(num)
 
 
 def instrument_to_program(instr: str) -> int:
@@ -74,6 +83,8 @@ def load_midi_file(file_name: str) -> MidiFile:
     """
     loads a MIDI file using a supplied file name (i.e "song.mid")
     """
+    from mido import MidiFile
+
     if not file_name.endswith(".mid"):
         raise ValueError("must be a midi file name!")
     return MidiFile(filename=file_name)
@@ -106,6 +117,8 @@ def parse_midi(file_name: str) -> tuple[dict, list]:
 
 
 def _to_instrument(part) -> Instrument:
+    from pretty_midi import Instrument
+
     return Instrument(program=instrument_to_program(part.instrument))
 
 
@@ -146,10 +159,14 @@ def _build_chord(
     return start, end, chord_inst
 
 
-def export_midi(comp: Composition) -> None:
+def export_midi(comp: Composition, file_name: str = None) -> None:
     """
     Takes a composition object and constructs data to be written out to a MIDI file
+
+    Writes to comp.midi_file_name in MIDI_FOLDER unless a file_name is supplied.
     """
+    from pretty_midi import PrettyMIDI
+
     if len(comp.parts) == 0:
         print("No tracks! Exiting...")
         return
@@ -200,5 +217,136 @@ def export_midi(comp: Composition) -> None:
             )
 
     # write to MIDI file
+    if file_name is None:
+        file_name = join(MIDI_FOLDER, comp.midi_file_name)
+    print(f"\nsaving {comp.midi_file_name} ... ")
+    midi_writer.write(file_name)
+
+
+def _stream_melody(
+    start: float, end: float, cur_part: Melody, writer: SMFWriter
+) -> tuple[float, float]:
+    end += cur_part.rhythms[0]
+    for i in range(1, len(cur_part.notes)):
+        writer.add_note(
+            start=start,
+            end=end,
+            pitch=note_name_to_MIDI_num(cur_part.notes[i - 1]),
+            velocity=cur_part.dynamics[i - 1],
+        )
+        start += cur_part.rhythms[i - 1]
+        end += cur_part.rhythms[i]
+
+    return start, end
+
+
+def _stream_chord(
+    start: float, end: float, cur_part: Chord, writer: SMFWriter
+) -> tuple[float, float]:
+    end += cur_part.rhythm
+    for note in cur_part.notes:
+        writer.add_note(
+            start=start,
+            end=end,
+            pitch=note_name_to_MIDI_num(note),
+            velocity=cur_part.dynamic,
+        )
+    start += cur_part.rhythm
+
+    return start, end
+
+
+def export_midi_stream(comp: Composition, file_name: str = None) -> None:
+    """
+    Streaming version of export_midi(). Writes each part's note events directly
+    to the MIDI file track by track without building a PrettyMIDI object first.
+
+    Produces the same file as export_midi() for the same composition.
+    Writes to comp.midi_file_name in MIDI_FOLDER unless a file_name is supplied.
+    """
+    if len(comp.parts) == 0:
+        print("No tracks! Exiting...")
+        return
+
+    if file_name is None:
+        file_name = join(MIDI_FOLDER, comp.midi_file_name)
+
     print(f"\nsaving {comp.midi_file_name} ... ")
-    midi_writer.write(join(MIDI_FOLDER, comp.midi_file_name))
+    with SMFWriter(file_name, tempo=comp.tempo) as writer:
+        for part in comp.parts:
+            # reset start and end markers for each track
+            start, end = 0.0, 0.0
+            cur_part = comp.parts[part]
+
+            if isinstance(cur_part, Melody):
+                writer.start_track(instrument_to_program(cur_part.instrument))
+                _stream_melody(start, end, cur_part, writer)
+            elif isinstance(cur_part, Chord):
+                writer.start_track(instrument_to_program(cur_part.instrument))
+                _stream_chord(start, end, cur_part, writer)
+            # a list of Chord() or Melody() objects (or both!) is a single track
+            elif isinstance(cur_part, list):
+                writer.start_track(instrument_to_program(cur_part[0].instrument))
+                for item in cur_part:
+                    if isinstance(item, Melody):
+                        start, end = _stream_melody(start, end, item, writer)
+                    elif isinstance(item, Chord):
+                        start, end = _stream_chord(start, end, item, writer)
+                    else:
+                        raise TypeError(
+                            f"Unsupported type! Cur_part is type: {type(cur_part)} "
+                            "Should be a Melody or Chord object, or list of either(or both)"
+                        )
+            else:
+                raise TypeError(
+                    f"Unsupported type! Cur_part is type: {type(cur_part)} "
+                    "Should be a Melody or Chord object, or list of either(or both)"
+                )
+            writer.end_track()
+
+
+def export_melody_stream(
+    melodies: Iterable[Melody], file_name: str, instrument: str = None
+) -> int:
+    """
+    Writes a stream of Melody() objects (i.e. from Generate.new_melody_stream())
+    one after another as a single track, as they're generated. Only the
+    current melody is held in memory, so the stream can be any length.
+
+    The tempo is taken from the first melody, and the instrument too
+    unless one is supplied. Rests (notes with a dynamic of 0) aren't written.
+
+    Returns the number of notes written.
+    """
+    melodies = iter(melodies)
+    first = next(melodies, None)
+    if first is None:
+        print("No melodies! Exiting...")
+        return 0
+    if instrument is None:
+        instrument = first.instrument
+    # resolve the program first, so a bad instrument doesn't leave a partial file
+    try:
+        program = instrument_to_program(instrument)
+    except ValueError:
+        raise ValueError(f"{instrument} is not a valid instrument!") from None
+
+    total = 0
+    start = 0.0
+    with SMFWriter(file_name, tempo=first.tempo) as writer:
+        writer.start_track(program)
+        for melody in chain([first], melodies):
+            for note, rhythm, dynamic in zip(
+                melody.notes, melody.rhythms, melody.dynamics
+            ):
+                if dynamic > 0:
+                    writer.add_note(
+                        start=start,
+                        end=start + rhythm,
+                        pitch=note_name_to_MIDI_num(note),
+                        velocity=dynamic,
+                    )
+                    total += 1
+                start += rhythm
+        writer.end_track()
+    return total
@@ -0,0 +1,372 @@
+"""
+A minimal, streaming Standard MIDI File (SMF) writer and note reader.
+
+SMFWriter writes note events straight to disk track by track instead of
+building a PrettyMIDI/mido object graph first, so memory stays bounded by the
+number of notes sounding at once rather than the length of the piece.
+
+The file layout (resolution, timing track, channel assignment, event ordering,
+and running status) matches what PrettyMIDI.write() produces, so the same
+composition yields the same bytes either way.
+
+read_notes() goes the other way: it scans each track's raw bytes once and
+pairs note-on/off events into a numpy structured array per track, without
+creating a mido Message() for every event.
+"""
+
+from __future__ import annotations
+
+import struct
+from array import array
+from heapq import heappush, heappop
+
+# PrettyMIDI's default resolution (ticks per quarter note)
+DEFAULT_RESOLUTION = 220
+
+# every channel except 9 (drums), in the order PrettyMIDI assigns them
+CHANNELS = [c for c in range(16) if c != 9]
+
+# default tempo (microseconds per beat) when a file doesn't set one
+DEFAULT_TEMPO = 500000
+
+# fields of each note returned by read_notes(). times are in ticks.
+NOTE_FIELDS = [
+    ("pitch", "u1"),
+    ("velocity", "u1"),
+    ("channel", "u1"),
+    ("onset", "i8"),
+    ("duration", "i8"),
+]
+
+# number of data bytes that follow each channel message's status byte
+_DATA_BYTES = {0x80: 2, 0x90: 2, 0xA0: 2, 0xB0: 2, 0xC0: 1, 0xD0: 1, 0xE0: 2}
+
+# sort weight PrettyMIDI uses for note events at the same tick. program
+# changes always sort first, so they don't need one.
+_NOTE_ON_SCORE = 10 * 256 * 256
+
+
+def encode_var_int(value: int) -> bytes:
+    """
+    encodes a non-negative int as a MIDI variable-length quantity
+    """
+    if value < 0:
+        raise ValueError(f"variable-length values must be positive! value: {value}")
+    data = [value & 0x7F]
+    value >>= 7
+    while value:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(data))
+
+
+def decode_var_int(data: bytes, pos: int) -> tuple[int, int]:
+    """
+    decodes a MIDI variable-length quantity starting at data[pos].
+    returns the value and the position of the next byte.
+    """
+    value = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos
+
+
+class SMFWriter:
+    """
+    Streams a type 1 MIDI file to disk.
+
+    Usage:
+        with SMFWriter(file_name, tempo=comp.tempo) as writer:
+            writer.start_track(program)
+            writer.add_note(start, end, pitch, velocity)  # times in seconds
+            ...
+            writer.end_track()
+
+    Notes within a track must be added in order of their start times.
+    """
+
+    def __init__(
+        self, file_name: str, tempo: float = 120.0, resolution: int = DEFAULT_RESOLUTION
+    ):
+        self.resolution = resolution
+        self.tick_scale = 60.0 / (tempo * resolution)
+        self.total_tracks = 0
+        self.instruments = 0
+
+        # current track state
+        self._channel = None
+        self._pending = []  # heap of (tick, score, seq, pitch, velocity)
+        self._seq = 0
+        self._last_tick = 0
+        self._running_status = None
+        self._track_data = bytearray()
+        self._track_start = 0
+        self._track_length = 0
+
+        self.file = open(file_name, "wb")
+        # header is patched with the real track count in close()
+        self._write_header()
+        self._write_timing_track(tempo)
+
+    def __enter__(self) -> SMFWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    ### Timing ###
+
+    def time_to_tick(self, time: float) -> int:
+        """
+        converts a time in seconds to an absolute tick
+        """
+        if time <= 0:
+            return 0
+        return int(round(time / self.tick_scale))
+
+    ### Chunks ###
+
+    def _write_header(self) -> None:
+        self.file.write(b"MThd")
+        self.file.write(struct.pack(">Lhhh", 6, 1, 0, self.resolution))
+
+    def _begin_chunk(self) -> None:
+        self.file.write(b"MTrk")
+        self._track_start = self.file.tell()
+        self.file.write(b"\x00\x00\x00\x00")  # patched in _end_chunk()
+        self._track_length = 0
+        self._last_tick = 0
+        self._running_status = None
+        self.total_tracks += 1
+
+    def _end_chunk(self) -> None:
+        # end of track is always one tick after the last event
+        self._write_event(self._last_tick + 1, b"\xff\x2f\x00", meta=True)
+        self._flush()
+        end = self.file.tell()
+        self.file.seek(self._track_start)
+        self.file.write(struct.pack(">L", self._track_length))
+        self.file.seek(end)
+
+    def _flush(self) -> None:
+        self.file.write(self._track_data)
+        self._track_length += len(self._track_data)
+        self._track_data.clear()
+
+    def _write_event(self, tick: int, data: bytes, meta: bool = False) -> None:
+        self._track_data += encode_var_int(tick - self._last_tick)
+        self._last_tick = tick
+        if meta:
+            self._track_data += data
+            self._running_status = None
+        else:
+            # omit the status byte if it's the same as the previous message
+            if data[0] == self._running_status:
+                self._track_data += data[1:]
+            else:
+                self._track_data += data
+            self._running_status = data[0]
+        if len(self._track_data) > 65536:
+            self._flush()
+
+    def _write_timing_track(self, tempo: float) -> None:
+        self._begin_chunk()
+        us_per_beat = int(6e7 / (60.0 / (self.tick_scale * self.resolution)))
+        self._write_event(0, b"\xff\x51\x03" + us_per_beat.to_bytes(3, "big"), True)
+        # default 4/4 time signature
+        self._write_event(0, b"\xff\x58\x04\x04\x02\x18\x08", meta=True)
+        self._end_chunk()
+
+    ### Tracks ###
+
+    def start_track(self, program: int) -> int:
+        """
+        starts a new instrument track with a given program number.
+        returns the MIDI channel assigned to it.
+        """
+        if self._channel is not None:
+            raise RuntimeError("previous track hasn't been ended yet!")
+        self._channel = CHANNELS[self.instruments % len(CHANNELS)]
+        self.instruments += 1
+        self._begin_chunk()
+        self._write_event(0, bytes([0xC0 | self._channel, program]))
+        return self._channel
+
+    def add_note(self, start: float, end: float, pitch: int, velocity: int) -> None:
+        """
+        adds a note to the current track. times are in seconds.
+        """
+        if self._channel is None:
+            raise RuntimeError("no track has been started!")
+        start_tick = self.time_to_tick(start)
+        # anything due before this note starts can be written out now, since
+        # later notes can't start any earlier than this one.
+        self._write_pending(before=start_tick)
+        self._push(start_tick, pitch, velocity)
+        self._push(self.time_to_tick(end), pitch, 0)
+
+    def end_track(self) -> None:
+        """
+        writes out any remaining events and closes the current track
+        """
+        if self._channel is None:
+            raise RuntimeError("no track has been started!")
+        self._write_pending()
+        self._end_chunk()
+        self._channel = None
+
+    def _push(self, tick: int, pitch: int, velocity: int) -> None:
+        if tick < self._last_tick:
+            raise ValueError("notes must be added in order of their start times!")
+        score = _NOTE_ON_SCORE + pitch * 256 + velocity
+        heappush(self._pending, (tick, score, self._seq, pitch, velocity))
+        self._seq += 1
+
+    def _write_pending(self, before: int = None) -> None:
+        status = 0x90 | self._channel
+        while self._pending and (before is None or self._pending[0][0] < before):
+            tick, _, _, pitch, velocity = heappop(self._pending)
+            self._write_event(tick, bytes([status, pitch, velocity]))
+
+    ### File ###
+
+    def close(self) -> None:
+        """
+        finishes any open track, patches the header, and closes the file
+        """
+        if self.file.closed:
+            return
+        if self._channel is not None:
+            self.end_track()
+        self.file.seek(10)
+        self.file.write(struct.pack(">h", self.total_tracks))
+        self.file.close()
+
+
+### Reading ###
+
+
+def _read_track(data: bytes, tempos: list) -> tuple:
+    """
+    scans a single track chunk's events, pairing each note-on with the
+    next note-off (or note-on with a velocity of 0) of the same pitch and
+    channel. any set_tempo events are appended to tempos as (tick, tempo).
+
+    returns the note columns as arrays.
+    """
+    pitches, velocities, channels = array("B"), array("B"), array("B")
+    onsets, durations = array("q"), array("q")
+    sounding = {}  # (channel, pitch) -> list of (onset, velocity)
+    pos, tick, status = 0, 0, 0
+    end = len(data)
+    while pos < end:
+        # most deltas fit in one byte, so skip the function call for those
+        if data[pos] < 0x80:
+            tick += data[pos]
+            pos += 1
+        else:
+            delta, pos = decode_var_int(data, pos)
+            tick += delta
+        if data[pos] & 0x80:
+            status = data[pos]
+            pos += 1
+        if status == 0xFF:
+            kind = data[pos]
+            length, pos = decode_var_int(data, pos + 1)
+            if kind == 0x51:
+                tempos.append((tick, int.from_bytes(data[pos : pos + 3], "big")))
+            elif kind == 0x2F:
+                break
+            pos += length
+            status = 0  # meta events cancel running status
+        elif status in (0xF0, 0xF7):
+            length, pos = decode_var_int(data, pos)
+            pos += length
+            status = 0
+        else:
+            kind = status & 0xF0
+            if kind not in _DATA_BYTES:
+                raise ValueError(f"unexpected status byte: {status:#x}")
+            if kind == 0x90 or kind == 0x80:
+                key = (status & 0x0F, data[pos])
+                velocity = data[pos + 1]
+                if kind == 0x90 and velocity > 0:
+                    sounding.setdefault(key, []).append((tick, velocity))
+                elif sounding.get(key):
+                    onset, velocity = sounding[key].pop(0)
+                    pitches.append(key[1])
+                    velocities.append(velocity)
+                    channels.append(key[0])
+                    onsets.append(onset)
+                    durations.append(tick - onset)
+            pos += _DATA_BYTES[kind]
+    return pitches, velocities, channels, onsets, durations
+
+
+def read_notes(file_name: str) -> tuple[int, list, list]:
+    """
+    reads every note in a MIDI file, one track at a time.
+
+    returns a tuple:
+        - the file's resolution (ticks per quarter note)
+        - a list of (tick, tempo) set_tempo events, tempo in microseconds
+          per beat. [(0, DEFAULT_TEMPO)] if the file doesn't have any.
+        - a list with a numpy structured array (see NOTE_FIELDS) for each
+          track, sorted by onset. notes that are never released are dropped.
+    """
+    import numpy as np
+
+    tracks = []
+    tempos = []
+    with open(file_name, "rb") as file:
+        chunk, length = struct.unpack(">4sL", file.read(8))
+        if chunk != b"MThd":
+            raise ValueError(f"{file_name} is not a MIDI file!")
+        _, _, resolution = struct.unpack(">hhh", file.read(6))
+        file.seek(length - 6, 1)
+        if resolution < 0:
+            raise ValueError("SMPTE time division isn't supported")
+        while True:
+            head = file.read(8)
+            if len(head) < 8:
+                break
+            chunk, length = struct.unpack(">4sL", head)
+            data = file.read(length)
+            if chunk != b"MTrk":
+                continue
+            columns = _read_track(data, tempos)
+            notes = np.empty(len(columns[0]), dtype=NOTE_FIELDS)
+            for (field, _), column in zip(NOTE_FIELDS, columns):
+                notes[field] = column
+            tracks.append(notes[np.argsort(notes["onset"], kind="stable")])
+    if not tempos:
+        tempos = [(0, DEFAULT_TEMPO)]
+    return resolution, sorted(tempos), tracks
+
+
+def ticks_to_seconds(ticks, resolution: int, tempos: list):
+    """
+    converts an array of absolute ticks to seconds, following
+    a list of (tick, tempo) events from read_notes().
+    """
+    import numpy as np
+
+    ticks = np.asarray(ticks, dtype=np.float64)
+    starts = np.array([tick for tick, _ in tempos], dtype=np.float64)
+    scales = np.array([tempo for _, tempo in tempos], dtype=np.float64) / (
+        resolution * 1e6
+    )
+    # seconds elapsed at the start of each tempo
+    offsets = np.concatenate(([0.0], np.cumsum(np.diff(starts) * scales[:-1])))
+    if starts[0] > 0:
+        # anything before the first tempo event uses the default tempo
+        default = DEFAULT_TEMPO / (resolution * 1e6)
+        offsets += starts[0] * default
+        starts = np.concatenate(([0.0], starts))
+        scales = np.concatenate(([default], scales))
+        offsets = np.concatenate(([0.0], offsets))
+    i = np.searchsorted(starts, ticks, side="right") - 1
+    return offsets[i] + (ticks - starts[i]) * scales[i]
@@ -6,11 +6,43 @@ classes in the analyze.py and modify.py files.
 
 from __future__ import annotations
 
+import random
+import sys
+from itertools import islice
 from math import floor
-from random import randint
+from typing import Iterable, Iterator
 from core.constants import NOTES, PITCH_CLASSES
 
 
+def is_array(obj) -> bool:
+    """
+    Returns true if obj is a numpy array. Doesn't import numpy, since
+    nothing can be an array if numpy hasn't been imported yet.
+    """
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(obj, np.ndarray)
+
+
+def chunks(data: Iterable, size: int) -> Iterator:
+    """
+    yields successive chunks of up to size items from any iterable,
+    without reading more than one chunk at a time. numpy arrays are
+    sliced (so each chunk is a view), anything else yields lists.
+    """
+    if size < 1:
+        raise ValueError(f"chunk size must be at least 1! size: {size}")
+    if is_array(data):
+        for i in range(0, len(data), size):
+            yield data[i : i + size]
+        return
+    data = iter(data)
+    while True:
+        chunk = list(islice(data, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def all_same(a_list: list) -> bool:
     """
     Returns true if all elements in the list are the same
@@ -90,11 +122,11 @@ def oct_equiv(pitch):
     Octave equivalence. Handles either a single int or list[int].
     Keeps a single pitch class integer within span of an octave (0 - 11).
 
-    Pitch should be an int or a list[int]
+    Pitch should be an int, a list[int], or a numpy int array
 
-    Returns either a modified int or list[int]
+    Returns either a modified int, list[int], or array
     """
-    if type(pitch) == int:
+    if type(pitch) == int or is_array(pitch):
         pitch %= 12
     elif type(pitch) == list:
         pitch_len = len(pitch)
@@ -103,7 +135,7 @@ def oct_equiv(pitch):
                 pitch[p] %= 12
     else:
         raise TypeError(
-            f"must be single int or list[int]. supplied arg is type: {type(pitch)}"
+            f"must be single int, list[int], or array. supplied arg is type: {type(pitch)}"
         )
     return pitch
 
@@ -126,7 +158,7 @@ def scale_to_tempo(tempo: float, rhythms, revert: bool = False) -> float | list:
     actual value in seconds at a given tempo. can also convert back to base
     rhythmic values of revert is set to True.
 
-    Returns either a single float or list[float]
+    Returns either a single float, list[float], or array (for array input)
 
     ex: [base] q = 60, quarter_note = 1 sec,
         [new tempo] q = 72, quarter_note = 0.8333(...) sec
@@ -140,40 +172,63 @@ def scale_to_tempo(tempo: float, rhythms, revert: bool = False) -> float | list:
     diff = 60 / tempo
     if type(rhythms) == float:
         rhythms = round(_scale(rhythms, diff, revert), 3)
-    elif type(rhythms) == list:
+    elif isinstance(rhythms, list):
         rhythm_len = len(rhythms)
         for i in range(rhythm_len):
             rhythms[i] = round(_scale(rhythms[i], diff, revert), 3)
+    elif is_array(rhythms):
+        np = sys.modules["numpy"]
+        rhythms = np.round(_scale(rhythms.astype(float), diff, revert), 3)
     else:
-        raise TypeError("incorrect input type. must be single float or list of floats!")
+        raise TypeError(
+            "incorrect input type. must be single float, list of floats, or array!"
+        )
     return rhythms
 
 
-def scale_limit(given_total_items: int) -> int:
+def scale_limit(given_total_items: int, rng: random.Random = None) -> int:
     """
     scales repetition limits according to total notes
     higher total == fewer reps, basically
+
+    draws from rng (a random.Random() instance) if one is supplied,
+    otherwise from the global random state.
     """
     """
     TODO: look at proportional scaling methods...
     """
+    if given_total_items < 1:
+        raise ValueError("total cannot be less than 1")
+    if rng is None:
+        rng = random
+
+    if given_total_items <= 10:
+        given_total_items = rng.randint(1, 3)
+        return 0
+    return rng.randint(1, scale_limit_bound(given_total_items))
+
+
+def scale_limit_bound(given_total_items: int) -> int:
+    """
+    returns the upper bound scale_limit() draws its repetition limit from
+    (the limit itself is picked between 1 and this value). returns 0
+    for totals of 10 or fewer, where scale_limit() always returns 0.
+
+    used by bulk generators that draw many limits at once.
+    """
     if given_total_items < 1:
         raise ValueError("total cannot be less than 1")
 
-    rep_limit = 0
-    if 1 <= given_total_items <= 10:
-        given_total_items = randint(1, 3)
-    elif 11 <= given_total_items <= 100:
-        rep_limit = randint(1, floor(given_total_items * 0.2))
-    elif 101 <= given_total_items <= 300:
-        rep_limit = randint(1, floor(given_total_items * 0.075))
-    elif 301 <= given_total_items <= 500:
-        rep_limit = randint(1, floor(given_total_items * 0.05))
-    elif 501 <= given_total_items <= 700:
-        rep_limit = randint(1, floor(given_total_items * 0.035))
-    elif 701 <= given_total_items <= 1000:
-        rep_limit = randint(1, floor(given_total_items * 0.02))
-    elif given_total_items > 1000:
-        rep_limit = randint(1, floor(given_total_items * 0.001))
-
-    return rep_limit
+    if given_total_items <= 10:
+        return 0
+    elif given_total_items <= 100:
+        return floor(given_total_items * 0.2)
+    elif given_total_items <= 300:
+        return floor(given_total_items * 0.075)
+    elif given_total_items <= 500:
+        return floor(given_total_items * 0.05)
+    elif given_total_items <= 700:
+        return floor(given_total_items * 0.035)
+    elif given_total_items <= 1000:
+        return floor(given_total_items * 0.02)
+    return floor(given_total_items * 0.001)
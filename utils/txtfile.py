@@ -1,14 +1,152 @@
 """
 This module handles text file generation for new compositions.
 
-Also see if we can reduce the number of times f.write() is called. It seems like... a lot, in
-it's current state.
+Documents are rendered from templates into a single string and written with
+one write() call. Each composition can also be written as JSON Lines (one
+JSON object for the composition, then one per part) for other programs to
+read, and either format can be written from a background thread so it
+overlaps with MIDI export.
 """
 
+from __future__ import annotations
+
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator
+
 from containers.chord import Chord
+from containers.container import EMPTY
 from containers.melody import Melody
 from containers.composition import Composition
 
+HEADER = (
+    "\n************************************************************* "
+    "\n--------------------------COMPOSITION------------------------ "
+    "\n************************************************************* "
+)
+
+COMP_TEMPLATE = (
+    "\n\nTitle: {title} "
+    "\nComposer: {composer} "
+    "\nInstruments: {instruments} "
+    "\nDate: {date} "
+    "\nDuration: {duration} "
+)
+
+DATA_TEMPLATE = "\n\nData inputted: {data}"
+
+PART_HEADER = "\n\n\n---------------------------Part Info ---------------------------"
+
+META_TEMPLATE = (
+    "\n\n## --- Meta data --- ##"
+    "\nInfo: {info}"
+    "\nSource data: {source_data}"
+    "\nSource scale: {source_notes}"
+    "\nPitch classes: {pcs}"
+)
+
+MELODY_TEMPLATE = (
+    "\n\nType: MELODY"
+    "\nInstrument: {instrument}  "
+    "\nTotal notes: {total_notes}"
+    "\nNotes: {notes}"
+    "\nTotal rhythms: {total_rhythms}"
+    "\nRhythms: {rhythms}"
+    "\nTotal dynamics: {total_dynamics}"
+    "\nDynamics: {dynamics}" + META_TEMPLATE
+)
+
+CHORD_TEMPLATE = (
+    "\n\nType: HARMONY"
+    "\nInstrument: {instrument}  "
+    "\nType: Harmony (chord)"
+    "\nTotal notes: {total_notes}"
+    "\nNotes: {notes}"
+    "\nRhythm: {rhythm}"
+    "\nDynamic: {dynamic}" + META_TEMPLATE
+)
+
+
+def _type_error(part) -> TypeError:
+    return TypeError(
+        "Comp object has wrong type! "
+        "Should be a Melody, Chord object, or list of Melody or Chord objects "
+        f"Type was: {type(part)}"
+    )
+
+
+def _items(comp: Composition) -> Iterator[tuple[str, Melody | Chord]]:
+    """
+    yields (part name, object) for every Melody() or Chord() in a composition,
+    including each one in a part made of a list
+    """
+    for name, part in comp.parts.items():
+        items = part if isinstance(part, list) else [part]
+        for item in items:
+            if not isinstance(item, (Melody, Chord)):
+                raise _type_error(part)
+            yield name, item
+
+
+def _data_str(data) -> str:
+    return ", ".join(str(i) for i in data) if type(data) == list else str(data)
+
+
+def _meta(value):
+    """unused metadata fields read as EMPTY, but are still written as []"""
+    return [] if value is EMPTY else value
+
+
+def _render_item(item: Melody | Chord) -> str:
+    meta = {
+        "instrument": item.instrument,
+        "total_notes": len(item.notes),
+        "notes": item.notes,
+        "info": item.info,
+        "source_data": _meta(item.source_data),
+        "source_notes": _meta(item.source_notes),
+        "pcs": _meta(item.pcs),
+    }
+    if isinstance(item, Melody):
+        return MELODY_TEMPLATE.format(
+            total_rhythms=len(item.rhythms),
+            rhythms=list(item.rhythms),
+            total_dynamics=len(item.dynamics),
+            dynamics=item.dynamics,
+            **meta,
+        )
+    return CHORD_TEMPLATE.format(rhythm=item.rhythm, dynamic=item.dynamic, **meta)
+
+
+def iter_info_doc(comp: Composition, data=None) -> Iterator[str]:
+    """
+    yields each section of a composition's info document in order
+    """
+    yield HEADER
+    yield COMP_TEMPLATE.format(
+        title=comp.title,
+        composer=comp.composer,
+        instruments=", ".join(comp.instruments),
+        date=comp.date,
+        duration=comp.duration(),
+    )
+    if data is not None:
+        yield DATA_TEMPLATE.format(data=_data_str(data))
+    current = None
+    for name, item in _items(comp):
+        # one header per part, even if it's a list of objects
+        if name != current:
+            current = name
+            yield PART_HEADER
+        yield _render_item(item)
+
+
+def render_info_doc(comp: Composition, data=None) -> str:
+    """
+    returns a composition's info document as a single string
+    """
+    return "".join(iter_info_doc(comp, data))
+
 
 def gen_info_doc(file_name: str, comp: Composition, data=None):
     """
@@ -18,129 +156,76 @@ def gen_info_doc(file_name: str, comp: Composition, data=None):
         data: any object
         comp: Composition
     """
-    with open(file_name, "w+") as f:
-        ### generate a header ###
-        header = (
-            "\n************************************************************* "
-            "\n--------------------------COMPOSITION------------------------ "
-            "\n************************************************************* "
-        )
-        f.write(header)
-
-        ### add composition information ###
-        info = (
-            f"\n\nTitle: {comp.title} "
-            f"\nComposer: {comp.composer} "
-            f"\nInstruments: {', '.join(comp.instruments)} "
-            f"\nDate: {comp.date} "
-            f"\nDuration: {comp.duration()} "
+    doc = render_info_doc(comp, data)
+    with open(file_name, "w") as f:
+        f.write(doc)
+
+
+def info_records(comp: Composition, data=None) -> Iterator[dict]:
+    """
+    yields a dict for the composition, then one for every Melody() or Chord()
+    in it, with the same information as the text document.
+    """
+    yield {
+        "type": "composition",
+        "title": comp.title,
+        "composer": comp.composer,
+        "instruments": comp.instruments,
+        "date": str(comp.date),
+        "tempo": comp.tempo,
+        "seconds": comp._duration(),
+        "data": data,
+    }
+    for name, item in _items(comp):
+        record = {
+            "type": "melody" if isinstance(item, Melody) else "chord",
+            "part": name,
+            "instrument": item.instrument,
+            "notes": item.notes,
+        }
+        if isinstance(item, Melody):
+            record.update({"rhythms": item.rhythms, "dynamics": item.dynamics})
+        else:
+            record.update({"rhythm": item.rhythm, "dynamic": item.dynamic})
+        record.update(
+            {
+                "info": item.info,
+                "source_data": item.source_data,
+                "source_notes": item.source_notes,
+                "pcs": item.pcs,
+            }
         )
-        f.write(info)
-
-        ## add info about any data inputted to create the new composition ###
-        if data is not None:
-            data_str = (
-                ", ".join([str(i) for i in range(len(data))])
-                if type(data) == list
-                else str(data)
-            )
-            data_info = f"\n\nData inputted: {data_str}"
-            f.write(data_info)
-
-        # iterate over composition part dictionary
-        for part in comp.parts:
-            ### add part information ###
-            sub_header = (
-                "\n\n\n---------------------------Part Info ---------------------------"
-            )
-            f.write(sub_header)
-            # handle melody objects
-            if isinstance(comp.parts[part], Melody):
-                part = (
-                    f"\n\nType: MELODY"
-                    f"\nInstrument: {comp.parts[part].instrument}  "
-                    f"\nTotal notes: {len(comp.parts[part].notes)}"
-                    f"\nNotes: {comp.parts[part].notes}"
-                    f"\nTotal rhythms: {len(comp.parts[part].rhythms)}"
-                    f"\nRhythms: {comp.parts[part].rhythms}"
-                    f"\nTotal dynamics: {len(comp.parts[part].dynamics)}"
-                    f"\nDynamics: {comp.parts[part].dynamics}"
-                    f"\n\n## --- Meta data --- ##"
-                    f"\nInfo: {comp.parts[part].info}"
-                    f"\nSource data: {comp.parts[part].source_data}"
-                    f"\nSource scale: {comp.parts[part].source_notes}"
-                    f"\nPitch classes: {comp.parts[part].pcs}"
-                )
-                f.write(part)
-            # handle chord objects
-            elif isinstance(comp.parts[part], Chord):
-                part = (
-                    f"\n\nType: HARMONY"
-                    f"\nInstrument: {comp.parts[part].instrument}  "
-                    f"\nType: Harmony (chord)"
-                    f"\nTotal notes: {len(comp.parts[part].notes)}"
-                    f"\nNotes: {comp.parts[part].notes}"
-                    f"\nTotal rhythms: {len(comp.parts[part].rhythm)}"
-                    f"\nRhythms: {comp.parts[part].rhythm}"
-                    f"\nTotal dynamics: {len(comp.parts[part].dynamic)}"
-                    f"\nDynamics: {comp.parts[part].dynamic}"
-                    f"\n\n## --- Meta data --- ##"
-                    f"\nInfo: {comp.parts[part].info}"
-                    f"\nSource data: {comp.parts[part].source_data}"
-                    f"\nSource scale: {comp.parts[part].source_notes}"
-                    f"\nPitch classes: {comp.parts[part].pcs}"
-                )
-                f.write(part)
-            # handle list of melody and/or chord objects
-            elif isinstance(comp.parts[part], list):
-                for item in comp.parts[part]:
-                    # handle single melody or chord objects
-                    if isinstance(item, Melody):
-                        part = (
-                            f"\n\nType: MELODY"
-                            f"\nInstrument: {comp.parts[part].instrument}  "
-                            f"\nTotal notes: {len(comp.parts[part].notes)}"
-                            f"\nNotes: {comp.parts[part].notes}"
-                            f"\nTotal rhythms: {len(comp.parts[part].rhythms)}"
-                            f"\nRhythms: {comp.parts[part].rhythms}"
-                            f"\nTotal dynamics: {len(comp.parts[part].dynamics)}"
-                            f"\nDynamics: {comp.parts[part].dynamics}"
-                            f"\n## --- Meta data --- ##"
-                            f"\nInfo: {comp.parts[part].info}"
-                            f"\nSource data: {comp.parts[part].source_data}"
-                            f"\nSource scale: {comp.parts[part].source_notes}"
-                            f"\nPitch classes: {comp.parts[part].pcs}"
-                        )
-                        f.write(part)
-                    elif isinstance(item, Chord):
-                        part = (
-                            f"\n\nType: HARMONY"
-                            f"\nInstrument: {comp.parts[part].instrument}  "
-                            f"\nType: Harmony (chord)"
-                            f"\nTotal notes: {len(comp.parts[part].notes)}"
-                            f"\nNotes: {comp.parts[part].notes}"
-                            f"\nTotal rhythms: {len(comp.parts[part].rhythm)}"
-                            f"\nRhythms: {comp.parts[part].rhythm}"
-                            f"\nTotal dynamics: {len(comp.parts[part].dynamic)}"
-                            f"\nDynamics: {comp.parts[part].dynamic}"
-                            f"\n## --- Meta data --- ##"
-                            f"\nInfo: {comp.parts[part].info}"
-                            f"\nSource data: {comp.parts[part].source_data}"
-                            f"\nSource scale: {comp.parts[part].source_notes}"
-                            f"\nPitch classes: {comp.parts[part].pcs}"
-                        )
-                        f.write(part)
-                    else:
-                        raise TypeError(
-                            "Comp object has wrong type! "
-                            "Should be a Melody, Chord object, or list of Melody or Chord objects "
-                            f"Type was: {type(comp.parts[part])}"
-                        )
-            else:
-                raise TypeError(
-                    "Comp object has wrong type! "
-                    "Should be a Melody, Chord object, or list of Melody or Chord objects "
-                    f"Type was: {type(comp.parts[part])}"
-                )
-        # close file instance
-        f.close()
+        yield record
+
+
+def gen_info_jsonl(file_name: str, comp: Composition, data=None):
+    """
+    Generates a JSON Lines (.jsonl) file with a composition's data and
+    meta-data (see info_records()). anything that isn't JSON serializable
+    (i.e. arrays) is written as a string.
+    """
+    lines = [json.dumps(record, default=str) for record in info_records(comp, data)]
+    with open(file_name, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def gen_info_doc_async(
+    file_name: str, comp: Composition, data=None, jsonl: bool = False
+) -> Future:
+    """
+    runs gen_info_doc() (or gen_info_jsonl() if jsonl is True) in a
+    background thread and returns a Future for it. call result() on it
+    before modifying the composition or relying on the file. result()
+    re-raises anything that went wrong while writing.
+
+    i.e.
+        writer = gen_info_doc_async(comp.txt_file_name, comp)
+        export_midi(comp)
+        writer.result()
+    """
+    target = gen_info_jsonl if jsonl else gen_info_doc
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="info-doc")
+    future = executor.submit(target, file_name, comp, data)
+    # the thread exits once the file is written
+    executor.shutdown(wait=False)
+    return future
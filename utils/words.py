@@ -0,0 +1,73 @@
+"""
+Word list loading for title generation.
+
+Word lists are read from disk once per process and memoized, so picking
+title words never touches the network. Lists are searched in this order:
+
+    1. a path set with the ANIMA_WORD_LIST environment variable
+    2. the on-disk cache of the MIT 10,000 word list (see cache_words())
+    3. the word list bundled with the program (data/wordlist.txt)
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from os.path import dirname, exists
+
+from core.constants import WORD_LIST, WORD_LIST_URL, WORD_LIST_CACHE
+
+
+@lru_cache(maxsize=None)
+def load_words(path: str) -> tuple[str, ...]:
+    """
+    reads a word list file (one word per line) and returns a tuple of words.
+    results are memoized per path.
+    """
+    with open(path) as f:
+        words = tuple(line.strip() for line in f if line.strip())
+    if len(words) == 0:
+        raise ValueError(f"word list is empty! path: {path}")
+    return words
+
+
+def word_list_path() -> str:
+    """
+    returns the path of the word list that get_words() will use
+    """
+    path = os.environ.get("ANIMA_WORD_LIST")
+    if path:
+        return path
+    if exists(WORD_LIST_CACHE):
+        return WORD_LIST_CACHE
+    return WORD_LIST
+
+
+def get_words() -> tuple[str, ...]:
+    """
+    returns the current word list
+    """
+    return load_words(word_list_path())
+
+
+def cache_words(url: str = WORD_LIST_URL, path: str = WORD_LIST_CACHE) -> str:
+    """
+    downloads a word list to the on-disk cache so later runs can use it offline.
+    only needs to be run once. returns the path of the cached file.
+    """
+    import urllib.request
+
+    response = urllib.request.urlopen(url)
+    text = response.read().decode()
+    os.makedirs(dirname(path), exist_ok=True)
+    # write to a temp file first so a failed download doesn't leave a partial list
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+    load_words.cache_clear()
+    return path
+
+
+if __name__ == "__main__":
+    print(f"saved word list to {cache_words()}")